@@ -20,6 +20,8 @@ from octobot.api import updater
 
 from octobot.api.backtesting import (
     create_independent_backtesting,
+    create_and_init_shared_backtesting_data,
+    run_backtesting_batch,
     check_independent_backtesting_remaining_objects,
     is_independent_backtesting_in_progress,
     is_independent_backtesting_computing,
@@ -73,6 +75,8 @@ from octobot.api.updater import (
 
 __all__ = [
     "create_independent_backtesting",
+    "create_and_init_shared_backtesting_data",
+    "run_backtesting_batch",
     "check_independent_backtesting_remaining_objects",
     "is_independent_backtesting_in_progress",
     "is_independent_backtesting_computing",
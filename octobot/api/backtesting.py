@@ -55,6 +55,44 @@ def create_independent_backtesting(
     )
 
 
+async def create_and_init_shared_backtesting_data(
+    data_files,
+    config,
+    tentacles_setup_config,
+    use_accurate_price_time_frame=True,
+    candles_store=None,
+) -> backtesting.SharedCandlesBacktestData:
+    backtesting_data = backtesting.SharedCandlesBacktestData(
+        data_files, config, tentacles_setup_config, use_accurate_price_time_frame, candles_store=candles_store
+    )
+    await backtesting_data.initialize()
+    return backtesting_data
+
+
+async def run_backtesting_batch(
+    config,
+    tentacles_setup_config,
+    data_files,
+    configs_by_tentacle,
+    start_timestamp=None,
+    end_timestamp=None,
+    enable_logs=False,
+    enable_storage=True,
+    enforce_total_databases_max_size_after_run=True,
+) -> list:
+    return await backtesting.BacktestingBatch(
+        config,
+        tentacles_setup_config,
+        data_files,
+        configs_by_tentacle,
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
+        enable_logs=enable_logs,
+        enable_storage=enable_storage,
+        enforce_total_databases_max_size_after_run=enforce_total_databases_max_size_after_run,
+    ).run()
+
+
 async def initialize_and_run_independent_backtesting(independent_backtesting, log_errors=True) -> None:
     await independent_backtesting.initialize_and_run(log_errors=log_errors)
 
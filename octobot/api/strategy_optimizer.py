@@ -57,8 +57,10 @@ async def resume_design_strategy_optimizer(optimizer, optimizer_settings: optimi
     return await optimizer.resume(optimizer_settings)
 
 
-def find_optimal_configuration(strategy_optimizer, TAs=None, time_frames=None, risks=None) -> None:
-    strategy_optimizer.find_optimal_configuration(TAs=TAs, time_frames=time_frames, risks=risks)
+def find_optimal_configuration(strategy_optimizer, TAs=None, time_frames=None, risks=None,
+                               processes_count=1) -> None:
+    strategy_optimizer.find_optimal_configuration(TAs=TAs, time_frames=time_frames, risks=risks,
+                                                  processes_count=processes_count)
 
 
 def cancel_strategy_optimizer(strategy_optimizer):
@@ -14,9 +14,21 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 
+from octobot.backtesting import config_overlay
+from octobot.backtesting import phases_profiler
 from octobot.backtesting import abstract_backtesting_test
 from octobot.backtesting import independent_backtesting
 from octobot.backtesting import octobot_backtesting
+from octobot.backtesting import shared_candles_store
+from octobot.backtesting import shared_backtest_data
+from octobot.backtesting import backtesting_batch
+from octobot.backtesting import backtesting_benchmark
+from octobot.backtesting.config_overlay import (
+    ConfigOverlay,
+)
+from octobot.backtesting.phases_profiler import (
+    PhasesProfiler,
+)
 from octobot.backtesting.abstract_backtesting_test import (
     AbstractBacktestingTest,
 )
@@ -26,9 +38,27 @@ from octobot.backtesting.independent_backtesting import (
 from octobot.backtesting.octobot_backtesting import (
     OctoBotBacktesting,
 )
+from octobot.backtesting.shared_candles_store import (
+    SharedCandlesStore,
+)
+from octobot.backtesting.shared_backtest_data import (
+    SharedCandlesBacktestData,
+)
+from octobot.backtesting.backtesting_batch import (
+    BacktestingBatch,
+)
+from octobot.backtesting.backtesting_benchmark import (
+    BacktestingBenchmark,
+)
 
 __all__ = [
+    "ConfigOverlay",
+    "PhasesProfiler",
     "OctoBotBacktesting",
     "IndependentBacktesting",
     "AbstractBacktestingTest",
+    "SharedCandlesStore",
+    "SharedCandlesBacktestData",
+    "BacktestingBatch",
+    "BacktestingBenchmark",
 ]
@@ -0,0 +1,98 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import octobot_commons.logging as commons_logging
+
+import octobot.backtesting.config_overlay as config_overlay
+import octobot.backtesting.independent_backtesting as independent_backtesting_import
+import octobot.backtesting.shared_backtest_data as shared_backtest_data
+import octobot.storage as storage
+
+
+class BacktestingBatch:
+    """
+    Runs a backtesting for each tentacles configuration on the same data files, one after another in the
+    current event loop: data files are imported once and their preloaded candles are shared by every run
+    """
+    def __init__(
+        self,
+        config,
+        tentacles_setup_config,
+        data_files,
+        configs_by_tentacle,
+        start_timestamp=None,
+        end_timestamp=None,
+        enable_logs=False,
+        enable_storage=True,
+        enforce_total_databases_max_size_after_run=True,
+    ):
+        self.logger = commons_logging.get_logger(self.__class__.__name__)
+        self.config = config
+        self.tentacles_setup_config = tentacles_setup_config
+        self.data_files = data_files
+        self.configs_by_tentacle = configs_by_tentacle
+        self.start_timestamp = start_timestamp
+        self.end_timestamp = end_timestamp
+        self.enable_logs = enable_logs
+        self.enable_storage = enable_storage
+        self.enforce_total_databases_max_size_after_run = enforce_total_databases_max_size_after_run
+        self.backtesting_data = None
+
+    async def run(self) -> list:
+        """
+        :return: the report of each backtesting, in configs_by_tentacle order, None when a backtesting failed
+        """
+        # runs can't be interleaved: importers read caches and preloaded candles indexes are shared between runs
+        self.backtesting_data = shared_backtest_data.SharedCandlesBacktestData(
+            self.data_files, self.config, self.tentacles_setup_config, True
+        )
+        try:
+            await self.backtesting_data.initialize()
+            reports = [
+                await self._run_backtesting(config_by_tentacle)
+                for config_by_tentacle in self.configs_by_tentacle
+            ]
+        finally:
+            await self.backtesting_data.stop()
+            self.backtesting_data = None
+        if self.enforce_total_databases_max_size_after_run:
+            try:
+                await storage.enforce_total_databases_max_size()
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when enforcing max run databases size: {e}")
+        return reports
+
+    async def _run_backtesting(self, config_by_tentacle):
+        independent_backtesting = independent_backtesting_import.IndependentBacktesting(
+            config_overlay.ConfigOverlay(self.config),
+            self.tentacles_setup_config,
+            self.data_files,
+            start_timestamp=self.start_timestamp,
+            end_timestamp=self.end_timestamp,
+            enable_logs=self.enable_logs,
+            enforce_total_databases_max_size_after_run=False,
+            enable_storage=self.enable_storage,
+            backtesting_data=self.backtesting_data,
+            config_by_tentacle=config_by_tentacle,
+        )
+        try:
+            await independent_backtesting.initialize_and_run(log_errors=False)
+            await independent_backtesting.join_backtesting_updater(timeout=None)
+            return await independent_backtesting.get_dict_formatted_report()
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when running backtesting with {config_by_tentacle}: {e}")
+            return None
+        finally:
+            await independent_backtesting.stop()
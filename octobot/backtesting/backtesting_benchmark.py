@@ -0,0 +1,170 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import json
+import os
+import platform
+import statistics
+import tracemalloc
+
+import octobot_backtesting.constants as backtesting_constants
+
+import octobot.backtesting.config_overlay as config_overlay
+import octobot.backtesting.independent_backtesting as independent_backtesting_import
+import octobot.backtesting.phases_profiler as phases_profiler
+
+
+class BacktestingBenchmark:
+    """
+    Runs a fixed set of backtesting scenarios and records the wall time, cpu time and peak memory of each
+    initialization phase, of the simulation and of the backtesting stop
+    """
+    FORMAT_VERSION = 1
+    SIMULATION_PHASE = "simulation"
+    STOP_PHASE = "stop"
+    # relative increase from the baseline to be considered as a regression
+    DEFAULT_TOLERANCE = 0.2
+    # smaller increases can't be reliably measured
+    MIN_REGRESSION_DELTAS = {
+        phases_profiler.WALL_TIME: 0.05,
+        phases_profiler.CPU_TIME: 0.05,
+        phases_profiler.PEAK_MEMORY: 1024 * 1024,
+    }
+
+    def __init__(
+        self,
+        config,
+        tentacles_setup_config,
+        scenarios,
+        data_file_path=backtesting_constants.BACKTESTING_FILE_PATH,
+        repetitions=3,
+        measure_memory=True,
+        enable_storage=False,
+        timeout=None,
+    ):
+        self.config = config
+        self.tentacles_setup_config = tentacles_setup_config
+        # scenario name: data files
+        self.scenarios = scenarios
+        self.data_file_path = data_file_path
+        self.repetitions = repetitions
+        self.measure_memory = measure_memory
+        self.enable_storage = enable_storage
+        self.timeout = timeout
+
+    async def run(self) -> dict:
+        results = {
+            "version": self.FORMAT_VERSION,
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "scenarios": {},
+        }
+        for name, data_files in self.scenarios.items():
+            # timings are measured without tracemalloc as it slows down allocations
+            phases = self._get_median_profiles([
+                await self._run_scenario(data_files)
+                for _ in range(self.repetitions)
+            ])
+            if self.measure_memory:
+                tracemalloc.start()
+                try:
+                    memory_profiles = await self._run_scenario(data_files)
+                finally:
+                    tracemalloc.stop()
+                for phase, profile in memory_profiles.items():
+                    phases.setdefault(phase, {})[phases_profiler.PEAK_MEMORY] = profile[phases_profiler.PEAK_MEMORY]
+            results["scenarios"][name] = {
+                "data_files": list(data_files),
+                "phases": phases,
+            }
+        return results
+
+    async def _run_scenario(self, data_files) -> dict:
+        independent_backtesting = independent_backtesting_import.IndependentBacktesting(
+            config_overlay.ConfigOverlay(self.config),
+            self.tentacles_setup_config,
+            data_files,
+            self.data_file_path,
+            enable_logs=False,
+            enforce_total_databases_max_size_after_run=False,
+            enable_storage=self.enable_storage,
+        )
+        profiler = phases_profiler.PhasesProfiler()
+        try:
+            await independent_backtesting.initialize_and_run(log_errors=False)
+            with profiler.profile(self.SIMULATION_PHASE):
+                await independent_backtesting.join_backtesting_updater(self.timeout)
+        finally:
+            with profiler.profile(self.STOP_PHASE):
+                await independent_backtesting.stop()
+        return {
+            **independent_backtesting.get_phases_profile(),
+            **profiler.phases,
+        }
+
+    @staticmethod
+    def _get_median_profiles(runs_profiles) -> dict:
+        phases = {}
+        for profiles in runs_profiles:
+            for phase in profiles:
+                phases.setdefault(phase, None)
+        return {
+            phase: {
+                metric: statistics.median(
+                    profiles[phase][metric]
+                    for profiles in runs_profiles
+                    if phase in profiles
+                )
+                for metric in (phases_profiler.WALL_TIME, phases_profiler.CPU_TIME)
+            }
+            for phase in phases
+        }
+
+    @classmethod
+    def get_regressions(cls, results, baseline, tolerance=DEFAULT_TOLERANCE) -> list:
+        """
+        :return: the phases metrics of results that are above baseline values by more than tolerance
+        """
+        regressions = []
+        for scenario, baseline_scenario in baseline["scenarios"].items():
+            phases = results["scenarios"].get(scenario, {}).get("phases", {})
+            for phase, baseline_profile in baseline_scenario["phases"].items():
+                for metric, baseline_value in baseline_profile.items():
+                    value = phases.get(phase, {}).get(metric)
+                    if value is None or baseline_value is None:
+                        continue
+                    if value > baseline_value * (1 + tolerance) \
+                       and value - baseline_value > cls.MIN_REGRESSION_DELTAS[metric]:
+                        regressions.append({
+                            "scenario": scenario,
+                            "phase": phase,
+                            "metric": metric,
+                            "value": value,
+                            "baseline": baseline_value,
+                        })
+        return regressions
+
+    @staticmethod
+    def save(results, file_path):
+        with open(file_path, "w") as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+
+    @staticmethod
+    def load(file_path) -> dict:
+        with open(file_path) as results_file:
+            return json.load(results_file)
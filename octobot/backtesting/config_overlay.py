@@ -0,0 +1,86 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import collections.abc
+import copy
+
+
+class ConfigOverlay(collections.abc.MutableMapping):
+    """
+    Copy-on-write view of a config: reads fall through to the base config that is never modified, writes are
+    kept in the overlay. Nested dicts are returned as overlays and other mutable values are copied on first read.
+    """
+    def __init__(self, base):
+        self._base = base
+        self._local = {}
+        self._deleted = set()
+
+    def __getitem__(self, key):
+        try:
+            return self._local[key]
+        except KeyError:
+            if key in self._deleted:
+                raise
+        value = self._base[key]
+        if isinstance(value, dict):
+            value = ConfigOverlay(value)
+        elif isinstance(value, (list, set)):
+            value = copy.deepcopy(value)
+        else:
+            # immutable value: no need to store it
+            return value
+        self._local[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._local[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        if key in self._base:
+            self._deleted.add(key)
+
+    def __contains__(self, key):
+        return key in self._local or (key not in self._deleted and key in self._base)
+
+    def __iter__(self):
+        for key in self._base:
+            if key not in self._deleted:
+                yield key
+        for key in self._local:
+            if key not in self._base:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __deepcopy__(self, memo):
+        # copies are independent from the base config: use plain dicts
+        return self.to_dict()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def to_dict(self) -> dict:
+        """
+        :return: a dict copy of this config, including nested overlays
+        """
+        return {
+            key: value.to_dict() if isinstance(value, ConfigOverlay) else copy.deepcopy(value)
+            for key, value in self.items()
+        }
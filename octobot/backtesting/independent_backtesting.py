@@ -29,6 +29,7 @@ import octobot_commons.optimization_campaign as optimization_campaign
 import octobot_commons.time_frame_manager as time_frame_manager
 
 import octobot.backtesting as backtesting
+import octobot.backtesting.phases_profiler as phases_profiler
 import octobot_backtesting.api as backtesting_api
 import octobot_backtesting.constants as backtesting_constants
 import octobot_backtesting.enums as backtesting_enums
@@ -80,6 +81,7 @@ class IndependentBacktesting:
         self.stopped = False
         self.stopped_event = None
         self.post_backtesting_task = None
+        self.phases_profiler = phases_profiler.PhasesProfiler()
         self.join_backtesting_timeout = join_backtesting_timeout
         self.enable_logs = enable_logs
         self.stop_when_finished = stop_when_finished
@@ -129,10 +131,29 @@ class IndependentBacktesting:
             raise e
 
     async def initialize_config(self):
-        await self._register_available_data()
+        with self.phases_profiler.profile("register_available_data"):
+            await self._register_available_data()
         self._adapt_config()
         return self.backtesting_config
 
+    def get_phases_duration(self):
+        """
+        :return: the duration in seconds of each initialization phase
+        """
+        return {
+            **self.phases_profiler.get_wall_times(),
+            **self.octobot_backtesting.phases_duration
+        }
+
+    def get_phases_profile(self):
+        """
+        :return: the wall time, cpu time and peak memory of each initialization phase
+        """
+        return {
+            **self.phases_profiler.phases,
+            **self.octobot_backtesting.phases_profiler.phases
+        }
+
     async def join_stop_event(self, timeout=None):
         if self.stopped_event is None:
             return
@@ -193,6 +214,15 @@ class IndependentBacktesting:
         else:
             # stop backtesting importers to release database files
             await self.octobot_backtesting.stop_importers()
+        if self.octobot_backtesting.enable_storage:
+            try:
+                storage.register_run_databases(
+                    databases.RunDatabasesProvider.instance().get_run_databases_identifier(
+                        self.octobot_backtesting.bot_id
+                    )
+                )
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when indexing run databases size: {e}")
         if self.enforce_total_databases_max_size_after_run:
             try:
                 await storage.enforce_total_databases_max_size()
@@ -217,11 +247,15 @@ class IndependentBacktesting:
 
     async def _register_available_data(self):
         if not self.symbols_to_create_exchange_classes:
-            for data_file in self.backtesting_files:
-                data_file_path = data_file
-                if not path.isfile(data_file_path):
-                    data_file_path = path.join(self.data_file_path, data_file)
-                description = await backtesting_data.get_file_description(data_file_path)
+            data_file_paths = [
+                data_file if path.isfile(data_file) else path.join(self.data_file_path, data_file)
+                for data_file in self.backtesting_files
+            ]
+            # read every data file description concurrently
+            descriptions = await asyncio.gather(
+                *(backtesting_data.get_file_description(data_file_path) for data_file_path in data_file_paths)
+            )
+            for data_file, description in zip(self.backtesting_files, descriptions):
                 if description is None:
                     raise RuntimeError(f"Impossible to start backtesting: missing or invalid data file: {data_file}")
                 exchange_name = description[backtesting_enums.DataFormatKeys.EXCHANGE.value]
@@ -0,0 +1,103 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import gc
+import tracemalloc
+import weakref
+
+_GC_GENERATIONS = (0, 1, 2)
+
+
+class ObjectsTracker:
+    """
+    Keeps weak references to tracked objects to find the ones that are not garbage collected without going through
+    every live object. When tracemalloc is tracing, allocations differences between checks can also be reported
+    """
+    DEFAULT_ALLOCATIONS_DIFF_LIMIT = 10
+
+    def __init__(self):
+        self._references_by_type = {}
+        self._snapshot = None
+
+    def track(self, object_type, *objects):
+        # forget garbage collected objects: references don't accumulate when alive objects are never checked
+        references = [
+            reference
+            for reference in self._references_by_type.get(object_type, [])
+            if reference() is not None
+        ]
+        references.extend(weakref.ref(obj) for obj in objects)
+        self._references_by_type[object_type] = references
+
+    def get_alive_objects(self) -> dict:
+        """
+        :return: the tracked objects that can't be garbage collected by type
+        """
+        self._remove_dead_references()
+        for generation in _GC_GENERATIONS:
+            if not self._references_by_type:
+                break
+            # remaining objects might be in reference cycles: collect them, starting from the cheapest generation
+            gc.collect(generation)
+            self._remove_dead_references()
+        return {
+            object_type: [reference() for reference in references]
+            for object_type, references in self._references_by_type.items()
+        }
+
+    def _remove_dead_references(self):
+        self._references_by_type = {
+            object_type: alive_references
+            for object_type, alive_references in (
+                (object_type, [reference for reference in references if reference() is not None])
+                for object_type, references in self._references_by_type.items()
+            )
+            if alive_references
+        }
+
+    def take_snapshot(self):
+        self._snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+
+    def get_allocations_diff(self, limit=DEFAULT_ALLOCATIONS_DIFF_LIMIT) -> list:
+        """
+        :return: the allocation sites with the largest memory increase since the last snapshot
+        """
+        if self._snapshot is None or not tracemalloc.is_tracing():
+            return []
+        return tracemalloc.take_snapshot().compare_to(self._snapshot, "lineno")[:limit]
+
+
+def get_alive_references(references) -> list:
+    """
+    :return: the references to objects that can't be garbage collected
+    """
+    alive_references = [reference for reference in references if reference() is not None]
+    for generation in _GC_GENERATIONS:
+        if not alive_references:
+            break
+        # remaining objects might be in reference cycles: collect them, starting from the cheapest generation
+        gc.collect(generation)
+        alive_references = [reference for reference in alive_references if reference() is not None]
+    return alive_references
+
+
+def get_allocation_site(obj) -> str:
+    if not tracemalloc.is_tracing():
+        return "unknown (tracemalloc is not tracing)"
+    allocation_traceback = tracemalloc.get_object_traceback(obj)
+    if allocation_traceback is None:
+        # allocated before tracing or object memory layout not handled by tracemalloc
+        return "unknown"
+    return str(allocation_traceback[-1])
@@ -15,8 +15,8 @@
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import json
 import uuid
-import gc
 import sys
+import weakref
 import asyncio
 import time
 
@@ -37,6 +37,8 @@ import octobot_evaluators.constants as evaluator_constants
 import octobot_services.api as service_api
 
 import octobot_trading.exchanges as exchanges
+import octobot_trading.exchange_channel as exchange_channel
+import octobot_trading.constants as trading_constants
 import octobot_trading.exchange_data as exchange_data
 import octobot_trading.api as trading_api
 import octobot_trading.enums as trading_enums
@@ -47,9 +49,14 @@ import octobot.limits as limits
 import octobot.constants as constants
 import octobot.errors as errors
 import octobot.databases_util as databases_util
+import octobot.backtesting.phases_profiler as phases_profiler
+import octobot.backtesting.objects_tracker as objects_tracker
 
 
 class OctoBotBacktesting:
+    # shared by every backtesting to find objects remaining from previous runs
+    OBJECTS_TRACKER = objects_tracker.ObjectsTracker()
+
     def __init__(
         self,
         backtesting_config,
@@ -97,6 +104,10 @@ class OctoBotBacktesting:
         self.run_on_all_available_time_frames = run_on_all_available_time_frames
         self._has_started = False
         self.has_fetched_data = False
+        # stored run metadata, available once the backtesting is stopped
+        self.run_metadata = None
+        # wall time, cpu time and peak memory of each initialization phase
+        self.phases_profiler = phases_profiler.PhasesProfiler()
         self.services_config = services_config
 
     async def initialize_and_run(self):
@@ -104,34 +115,54 @@ class OctoBotBacktesting:
             raise errors.DisabledError("Backtesting is disabled")
         self.logger.info(f"Starting on {self.backtesting_files} with {self.symbols_to_create_exchange_classes}")
         self.start_time = time.time()
-        await commons_databases.init_bot_storage(
-            self.bot_id,
-            databases_util.get_run_databases_identifier(
-                self.backtesting_config,
-                self.tentacles_setup_config,
-                enable_storage=self.enable_storage,
-            ),
-            False
+        await self._run_phase(
+            "init_storage",
+            commons_databases.init_bot_storage(
+                self.bot_id,
+                databases_util.get_run_databases_identifier(
+                    self.backtesting_config,
+                    self.tentacles_setup_config,
+                    enable_storage=self.enable_storage,
+                ),
+                False
+            )
+        )
+        await self._run_phase("init_matrix", self._init_matrix())
+        await self._run_phase("init_backtesting", self._init_backtesting())
+        await self._run_phase("init_evaluators", self._init_evaluators())
+        await self._run_phase("init_service_feeds", self._init_service_feeds())
+        min_timestamp, max_timestamp = await self._run_phase(
+            "configure_backtesting_time_window", self._configure_backtesting_time_window()
         )
-        await self._init_matrix()
-        await self._init_backtesting()
-        await self._init_evaluators()
-        await self._init_service_feeds()
-        min_timestamp, max_timestamp = await self._configure_backtesting_time_window()
-        await self._init_exchanges()
-        self._ensure_limits()
-        await self._create_evaluators()
-        await self._fetch_backtesting_extra_data_if_any(
-            min_timestamp, max_timestamp
+        await self._run_phase("init_exchanges", self._init_exchanges())
+        with self.phases_profiler.profile("ensure_limits"):
+            self._ensure_limits()
+        await self._run_phase("create_evaluators", self._create_evaluators())
+        await self._run_phase(
+            "fetch_backtesting_extra_data",
+            self._fetch_backtesting_extra_data_if_any(min_timestamp, max_timestamp)
         )
-        await self._create_service_feeds()
-        await backtesting_api.start_backtesting(self.backtesting)
+        await self._run_phase("create_service_feeds", self._create_service_feeds())
+        await self._run_phase("start_backtesting", backtesting_api.start_backtesting(self.backtesting))
         if logger.BOT_CHANNEL_LOGGER is not None and self.enable_logs:
-            await self.start_loggers()
+            await self._run_phase("start_loggers", self.start_loggers())
         self._has_started = True
+        self.logger.debug(
+            f"Initialization phases duration: "
+            f"{', '.join(f'{phase}: {duration:.3f}s' for phase, duration in self.phases_duration.items())}"
+        )
+
+    @property
+    def phases_duration(self):
+        return self.phases_profiler.get_wall_times()
+
+    async def _run_phase(self, phase, coroutine):
+        with self.phases_profiler.profile(phase):
+            return await coroutine
 
     async def stop_importers(self):
-        if self.backtesting is not None:
+        # backtesting_data importers are shared between backtestings: they are stopped by their owner
+        if self.backtesting is not None and self.backtesting_data is None:
             # Close databases
             for importer in backtesting_api.get_importers(self.backtesting):
                 if importer is not None:
@@ -149,6 +180,9 @@ class OctoBotBacktesting:
                 self.logger.warning("No backtesting to stop, there was probably an issue when starting the backtesting")
             else:
                 exchange_managers = trading_api.get_exchange_managers_from_exchange_ids(self.exchange_manager_ids)
+                if memory_check:
+                    # only required by check_remaining_objects
+                    self._track_exchange_objects(exchange_managers)
                 if exchange_managers and self.enable_storage and self._has_started:
                     try:
                         for exchange_manager in exchange_managers:
@@ -199,26 +233,22 @@ class OctoBotBacktesting:
             # let cancelled backtesting tasks complete before returning
             await asyncio_tools.wait_asyncio_next_cycle()
             if memory_check:
-                to_reference_check = exchange_managers + [self.backtesting]
+                to_reference_check = [weakref.ref(element) for element in exchange_managers + [self.backtesting]]
                 # Call at the next loop iteration to first let coroutines get cancelled
                 # (references to coroutine and caller objects are kept while in async loop)
                 asyncio.get_event_loop().call_soon(self.memory_leak_checkup, to_reference_check)
             self.backtesting = None
 
-    def memory_leak_checkup(self, to_check_elements):
-        gc.collect()
-        self.logger.debug(f"Memory leak checking {[e.__class__.__name__ for e in to_check_elements]}")
-        memory_leak_errors = []
-        for i in range(len(to_check_elements)):
-            if sys.getrefcount(to_check_elements[i]) > 2:
-                # Using PyCharm debugger, right click on the element variable and use "Find references"
-                # Warning: Python debugger can add references when watching an element
-                element = to_check_elements[i]
-                # Now expect 3 references because the above element variable adds a reference
-                memory_leak_errors.append(f" Too many remaining references on the {element.__class__.__name__} element "
-                                          f"after {self.__class__.__name__} run, the garbage collector won't free it "
-                                          f"(expected a maximum of 3 references): {sys.getrefcount(element)} actual "
-                                          f"references ({element})")
+    def memory_leak_checkup(self, to_check_references):
+        self.logger.debug(
+            f"Memory leak checking {[r().__class__.__name__ for r in to_check_references if r() is not None]}"
+        )
+        memory_leak_errors = [
+            f" Remaining references on the {reference().__class__.__name__} element after {self.__class__.__name__} "
+            f"run, the garbage collector won't free it: {sys.getrefcount(reference()) - 1} actual references "
+            f"({reference()}), allocated at {objects_tracker.get_allocation_site(reference())}"
+            for reference in objects_tracker.get_alive_references(to_check_references)
+        ]
         if memory_leak_errors:
             errors = "\n".join(memory_leak_errors)
             raise AssertionError(
@@ -226,43 +256,65 @@ class OctoBotBacktesting:
             )
 
     # Use check_remaining_objects to check remaining objects from garbage collector after calling stop().
-    # Warning: can take a long time when a lot of objects exist
     def check_remaining_objects(self):
         objects_leak_errors = []
         exchanges_count = len(self.exchange_manager_ids)
-        to_watch_objects = (exchange_data.ExchangeSymbolData, exchanges.ExchangeManager,
-                            exchanges.ExchangeSimulator, exchange_data.OHLCVUpdaterSimulator)
-        objects_references = {obj: (0, []) for obj in to_watch_objects}
         expected_max_objects_references = {
             exchange_data.ExchangeSymbolData: exchanges_count + 1,
             exchanges.ExchangeManager: exchanges_count + 1,
             exchanges.ExchangeSimulator: exchanges_count,
             exchange_data.OHLCVUpdaterSimulator: exchanges_count
         }
-        # trigger garbage collector to get a fresh memory picture
-        gc.collect()
-        for obj in gc.get_objects():
-            if isinstance(obj, to_watch_objects):
-                if isinstance(obj, exchanges.ExchangeManager) and not obj.is_initialized:
-                    # Ignore exchange managers that have not been initialized
-                    # and are irrelevant. Pytest fixtures can also retain references failing tests
-                    continue
-                objects_references[type(obj)][1].append(obj)
-                objects_references[type(obj)] = (objects_references[type(obj)][0] + 1,
-                                                 objects_references[type(obj)][1])
-
+        alive_objects = self.OBJECTS_TRACKER.get_alive_objects()
         for obj, max_ref in expected_max_objects_references.items():
-            if objects_references[obj][0] > max_ref:
-                objects_leak_errors.append(_get_remaining_object_error(obj,
-                                                                       max_ref,
-                                                                       objects_references[obj]))
+            remaining_objects = [
+                remaining_object
+                for remaining_object in alive_objects.get(obj, [])
+                # Ignore exchange managers that have not been initialized
+                # and are irrelevant. Pytest fixtures can also retain references failing tests
+                if not (isinstance(remaining_object, exchanges.ExchangeManager) and not remaining_object.is_initialized)
+            ]
+            if len(remaining_objects) > max_ref:
+                objects_leak_errors.append(_get_remaining_object_error(obj, max_ref, remaining_objects))
+        alive_objects = remaining_objects = None
 
+        if objects_leak_errors:
+            objects_leak_errors += [
+                f"allocations increase since the previous check: {allocation_diff}"
+                for allocation_diff in self.OBJECTS_TRACKER.get_allocations_diff()
+            ]
+        self.OBJECTS_TRACKER.take_snapshot()
         if objects_leak_errors:
             errors = "\n".join(objects_leak_errors)
             raise AssertionError(
                 f"[Dev oriented error: no effect on backtesting result, please report if you see it]: {errors}"
             )
 
+    def _track_exchange_objects(self, exchange_managers):
+        for exchange_manager in exchange_managers:
+            self.OBJECTS_TRACKER.track(exchanges.ExchangeManager, exchange_manager)
+            if isinstance(exchange_manager.exchange, exchanges.ExchangeSimulator):
+                self.OBJECTS_TRACKER.track(exchanges.ExchangeSimulator, exchange_manager.exchange)
+            if exchange_manager.exchange_symbols_data is not None:
+                self.OBJECTS_TRACKER.track(
+                    exchange_data.ExchangeSymbolData,
+                    *exchange_manager.exchange_symbols_data.exchange_symbol_data.values()
+                )
+            try:
+                self.OBJECTS_TRACKER.track(
+                    exchange_data.OHLCVUpdaterSimulator,
+                    *(
+                        producer
+                        for producer in exchange_channel.get_chan(
+                            trading_constants.OHLCV_CHANNEL, exchange_manager.id
+                        ).producers
+                        if isinstance(producer, exchange_data.OHLCVUpdaterSimulator)
+                    )
+                )
+            except KeyError:
+                # channels not created
+                pass
+
     async def _store_metadata(self, exchange_managers):
         run_db = commons_databases.RunDatabasesProvider.instance().get_run_db(self.bot_id)
         await run_db.flush()
@@ -273,14 +325,14 @@ class OctoBotBacktesting:
             self.start_time,
             user_inputs=user_inputs,
         )
-        metadata = await storage.store_backtesting_run_metadata(
+        self.run_metadata = await storage.store_backtesting_run_metadata(
             exchange_managers,
             self.start_time,
             user_inputs,
             commons_databases.RunDatabasesProvider.instance().get_run_databases_identifier(self.bot_id),
             self.name
         )
-        self.logger.info(f"Backtesting metadata:\n{json.dumps(metadata, indent=4)}")
+        self.logger.info(f"Backtesting metadata:\n{json.dumps(self.run_metadata, indent=4)}")
 
     async def _init_matrix(self):
         self.matrix_id = evaluator_api.create_matrix()
@@ -409,26 +461,37 @@ class OctoBotBacktesting:
             (await service_api.get_service(gpt_service.GPTService, True, self.services_config)).clear_signal_history()
 
     async def _init_exchanges(self):
+        exchange_builders = []
         for exchange_class_string in self.symbols_to_create_exchange_classes.keys():
             is_future = self.exchange_type_by_exchange[exchange_class_string] == \
                         commons_constants.CONFIG_EXCHANGE_FUTURE
-            exchange_builder = trading_api.create_exchange_builder(self.backtesting_config, exchange_class_string) \
-                .has_matrix(self.matrix_id) \
-                .use_tentacles_setup_config(self.tentacles_setup_config) \
-                .use_trading_config_by_trading_mode(self.config_by_tentacle) \
-                .use_cached_markets(self.backtesting_data.use_cached_markets if self.backtesting_data else False) \
-                .use_exchange_config_by_exchange(self.config_by_tentacle) \
-                .set_bot_id(self.bot_id) \
-                .is_simulated() \
-                .is_rest_only() \
-                .is_backtesting(self.backtesting) \
-                .is_future(is_future, self.futures_contract_type) \
+            exchange_builders.append(
+                trading_api.create_exchange_builder(self.backtesting_config, exchange_class_string)
+                .has_matrix(self.matrix_id)
+                .use_tentacles_setup_config(self.tentacles_setup_config)
+                .use_trading_config_by_trading_mode(self.config_by_tentacle)
+                .use_cached_markets(self.backtesting_data.use_cached_markets if self.backtesting_data else False)
+                .use_exchange_config_by_exchange(self.config_by_tentacle)
+                .set_bot_id(self.bot_id)
+                .is_simulated()
+                .is_rest_only()
+                .is_backtesting(self.backtesting)
+                .is_future(is_future, self.futures_contract_type)
                 .enable_storage(self.enable_storage)
-            try:
-                await exchange_builder.build()
-            finally:
-                # always save exchange manager ids and backtesting instances
-                self.exchange_manager_ids.append(trading_api.get_exchange_manager_id(exchange_builder.exchange_manager))
+            )
+        # build exchanges concurrently
+        results = await asyncio.gather(
+            *(exchange_builder.build() for exchange_builder in exchange_builders),
+            return_exceptions=True
+        )
+        # always save exchange manager ids and backtesting instances, in exchanges order
+        self.exchange_manager_ids.extend(
+            trading_api.get_exchange_manager_id(exchange_builder.exchange_manager)
+            for exchange_builder in exchange_builders
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def start_loggers(self):
         await self.start_exchange_loggers()
@@ -439,11 +502,12 @@ class OctoBotBacktesting:
             await logger.init_exchange_chan_logger(exchange_manager_id)
 
 
-def _get_remaining_object_error(obj, expected, actual):
-    error = f"too many remaining {obj.__name__} instances: expected: {expected} actual {actual[0]}"
-    for i in range(len(actual[1])):
+def _get_remaining_object_error(obj, expected, remaining_objects):
+    error = f"too many remaining {obj.__name__} instances: expected: {expected} actual {len(remaining_objects)}"
+    for remaining_object in remaining_objects:
         debug_info = ""
-        if isinstance(actual[1][i], exchanges.ExchangeManager):
-            debug_info = f" ({actual[1][i].debug_info})"
-        error += f"{sys.getrefcount(actual[1][i])} references on {actual[1][i]} {debug_info}"
-        return error
+        if isinstance(remaining_object, exchanges.ExchangeManager):
+            debug_info = f" ({remaining_object.debug_info})"
+        error += f"\n{sys.getrefcount(remaining_object)} references on {remaining_object}{debug_info}, allocated at " \
+                 f"{objects_tracker.get_allocation_site(remaining_object)}"
+    return error
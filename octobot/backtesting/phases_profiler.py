@@ -0,0 +1,54 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import contextlib
+import time
+import tracemalloc
+
+WALL_TIME = "wall_time"
+CPU_TIME = "cpu_time"
+PEAK_MEMORY = "peak_memory"
+
+
+class PhasesProfiler:
+    """
+    Records the wall time, process CPU time and, when tracemalloc is tracing, the peak allocated memory of each phase
+    """
+    def __init__(self):
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def profile(self, phase):
+        trace_memory = tracemalloc.is_tracing()
+        start_memory = 0
+        if trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases[phase] = {
+                WALL_TIME: time.perf_counter() - start_time,
+                CPU_TIME: time.process_time() - start_cpu_time,
+                PEAK_MEMORY: tracemalloc.get_traced_memory()[1] - start_memory if trace_memory else None,
+            }
+
+    def get_wall_times(self) -> dict:
+        return {
+            phase: profile[WALL_TIME]
+            for phase, profile in self.phases.items()
+        }
@@ -0,0 +1,54 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import octobot_backtesting.backtest_data as backtest_data
+import octobot_trading.exchange_data as exchange_data
+
+import octobot.backtesting.shared_candles_store as shared_candles_store_import
+
+
+class SharedCandlesBacktestData(backtest_data.BacktestData):
+    """
+    BacktestData which preloaded candles are read from a SharedCandlesStore: backtestings running on the same
+    data files share the same candles memory, including from other processes
+    """
+    def __init__(self, data_files, config, tentacles_config, use_accurate_price_time_frame, candles_store=None):
+        super().__init__(data_files, config, tentacles_config, use_accurate_price_time_frame)
+        self.candles_store = candles_store or shared_candles_store_import.SharedCandlesStore()
+
+    async def get_preloaded_candles_manager(self, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+        key = self._get_key(exchange, symbol, time_frame, start_timestamp, end_timestamp)
+        if key not in self.preloaded_candle_managers:
+            data_file_path = self._get_importer(exchange, symbol).adapt_file_path_if_necessary()
+            candles = self.candles_store.get_candles(
+                data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp
+            )
+            if candles is None:
+                candles = self.candles_store.store_candles(
+                    data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp,
+                    await self._get_all_candles(exchange, symbol, time_frame, start_timestamp, end_timestamp)
+                )
+            self.preloaded_candle_managers[key] = await self._create_preloaded_candles_manager(candles)
+        return self.preloaded_candle_managers[key]
+
+    @staticmethod
+    async def _create_preloaded_candles_manager(candles):
+        candles_manager = exchange_data.PreloadedCandlesManager()
+        await candles_manager.initialize()
+        # use store rows as candles arrays: preloaded candles are never copied
+        candles_manager.time_candles, candles_manager.open_candles, candles_manager.high_candles, \
+            candles_manager.low_candles, candles_manager.close_candles, candles_manager.volume_candles = candles
+        candles_manager.candles_initialized = True
+        return candles_manager
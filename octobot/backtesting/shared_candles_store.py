@@ -0,0 +1,160 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import hashlib
+import os
+import time
+import uuid
+
+import numpy
+
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as commons_logging
+
+import octobot.constants as constants
+
+
+class SharedCandlesStore:
+    """
+    Read-only candles store: candles are saved once in a file that every backtesting using the same data file,
+    in any process, maps in memory without copy.
+    Expired and least recently used files are pruned when the store is larger than max_size.
+    """
+    STORE_FILE_EXT = ".npy"
+    # rows of the stored candles arrays
+    CANDLES_VALUES = (
+        commons_enums.PriceIndexes.IND_PRICE_TIME.value,
+        commons_enums.PriceIndexes.IND_PRICE_OPEN.value,
+        commons_enums.PriceIndexes.IND_PRICE_HIGH.value,
+        commons_enums.PriceIndexes.IND_PRICE_LOW.value,
+        commons_enums.PriceIndexes.IND_PRICE_CLOSE.value,
+        commons_enums.PriceIndexes.IND_PRICE_VOL.value,
+    )
+
+    def __init__(self, folder=constants.BACKTESTING_SHARED_CANDLES_FOLDER,
+                 max_size=constants.BACKTESTING_SHARED_CANDLES_MAX_SIZE,
+                 max_age=constants.BACKTESTING_SHARED_CANDLES_MAX_AGE):
+        self.logger = commons_logging.get_logger(self.__class__.__name__)
+        self.folder = folder
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def get_candles(self, data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+        """
+        :return: the read-only memory-mapped candles array or None when these candles are not stored
+        """
+        path = self._get_path(data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp)
+        try:
+            candles = numpy.load(path, mmap_mode="r")
+            # keep recently used files when pruning the store
+            os.utime(path)
+            return candles
+        except FileNotFoundError:
+            return None
+
+    def store_candles(self, data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp, candles):
+        """
+        :return: the read-only memory-mapped array of the given candles
+        """
+        candles_array = numpy.array(
+            [[candle[value] for candle in candles] for value in self.CANDLES_VALUES], dtype=numpy.float64
+        )
+        if not candles:
+            # empty files can't be memory-mapped
+            candles_array.flags.writeable = False
+            return candles_array
+        path = self._get_path(data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp)
+        os.makedirs(self.folder, exist_ok=True)
+        # write in a temporary file first: other processes only map complete files
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as store_file:
+                numpy.save(store_file, candles_array)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+        candles_array = numpy.load(path, mmap_mode="r")
+        self.prune(kept_paths=(path, ))
+        return candles_array
+
+    def prune(self, kept_paths=()) -> int:
+        """
+        Removes expired files and the least recently used ones while the store is larger than max_size
+        :param kept_paths: paths to never remove
+        :return: the number of removed files
+        """
+        now = time.time()
+        files = []
+        to_remove_paths = []
+        try:
+            for store_file in os.scandir(self.folder):
+                try:
+                    file_stat = store_file.stat()
+                except FileNotFoundError:
+                    # removed by another process
+                    continue
+                if store_file.path in kept_paths:
+                    continue
+                if self.max_age is not None and now - file_stat.st_mtime > self.max_age:
+                    to_remove_paths.append(store_file.path)
+                elif store_file.name.endswith(self.STORE_FILE_EXT):
+                    # temporary files are being written: only remove them when expired
+                    files.append((file_stat.st_mtime, file_stat.st_size, store_file.path))
+        except FileNotFoundError:
+            return 0
+        if self.max_size is not None:
+            total_size = sum(size for _, size, _ in files) + sum(
+                os.path.getsize(path) for path in kept_paths if os.path.isfile(path)
+            )
+            for _, size, path in sorted(files):
+                if total_size <= self.max_size:
+                    break
+                to_remove_paths.append(path)
+                total_size -= size
+        return sum(1 for path in to_remove_paths if self._remove_file(path))
+
+    def clear(self):
+        try:
+            for file_name in os.listdir(self.folder):
+                self._remove_file(os.path.join(self.folder, file_name))
+        except FileNotFoundError:
+            pass
+
+    def _remove_file(self, path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            # already removed by another process
+            return False
+        except OSError as err:
+            # file might be mapped by another process
+            self.logger.debug(f"Can't remove {path}: {err}")
+            return False
+
+    def _get_path(self, data_file_path, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+        # identify data files by content version: a modified data file is not using previously stored candles
+        data_file_stat = os.stat(data_file_path)
+        key = hashlib.sha256(
+            "-".join(
+                str(identifier)
+                for identifier in (
+                    os.path.abspath(data_file_path), data_file_stat.st_size, data_file_stat.st_mtime_ns,
+                    exchange, symbol, time_frame, start_timestamp, end_timestamp
+                )
+            ).encode()
+        ).hexdigest()
+        return os.path.join(self.folder, f"{key}{self.STORE_FILE_EXT}")
@@ -18,12 +18,14 @@ from octobot.channels import octobot_channel
 
 from octobot.channels.octobot_channel import (
     OctoBotChannelConsumer,
+    OctoBotChannelConcurrentConsumer,
     OctoBotChannelProducer,
     OctoBotChannel,
 )
 
 __all__ = [
     "OctoBotChannelConsumer",
+    "OctoBotChannelConcurrentConsumer",
     "OctoBotChannelProducer",
     "OctoBotChannel",
 ]
@@ -14,6 +14,8 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+
 import async_channel.constants as channel_constants
 import async_channel.channels as channels
 import async_channel.consumer as consumers
@@ -26,6 +28,36 @@ class OctoBotChannelConsumer(consumers.Consumer):
     """
 
 
+class OctoBotChannelConcurrentConsumer(OctoBotChannelConsumer):
+    """
+    OctoBotChannel consumer performing each received event in its own task: a slow event
+    (such as an exchange creation) does not delay the next ones
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.perform_tasks = set()
+
+    async def perform(self, kwargs) -> None:
+        task = asyncio.create_task(self._concurrent_perform(kwargs))
+        self.perform_tasks.add(task)
+        task.add_done_callback(self.perform_tasks.discard)
+
+    async def _concurrent_perform(self, kwargs) -> None:
+        try:
+            await super().perform(kwargs)
+        except asyncio.CancelledError:
+            self.logger.debug("Cancelled task")
+        except Exception as err:
+            self.logger.exception(err, True, f"Exception when calling callback on {self}: {err}")
+
+    async def stop(self) -> None:
+        await super().stop()
+        for task in list(self.perform_tasks):
+            task.cancel()
+        self.perform_tasks.clear()
+
+
 class OctoBotChannelProducer(producers.Producer):
     """
     Producer adapted for OctoBotChannel
@@ -47,6 +79,26 @@ class OctoBotChannelProducer(producers.Producer):
                 "data": data
             })
 
+    async def send_batch(self, bot_id, subject, action, data_batch):
+        """
+        Send a message for each data of data_batch, consumers are filtered once for the whole batch
+        :param bot_id: the messages bot id
+        :param subject: the messages subject
+        :param action: the messages action
+        :param data_batch: the messages data
+        """
+        consumers = self.channel.get_filtered_consumers(bot_id=bot_id, subject=subject, action=action)
+        if not consumers:
+            return
+        for data in data_batch:
+            for consumer in consumers:
+                await consumer.queue.put({
+                    "bot_id": bot_id,
+                    "subject": subject,
+                    "action": action,
+                    "data": data
+                })
+
 
 class OctoBotChannel(channels.Channel):
     """
@@ -64,6 +116,8 @@ class OctoBotChannel(channels.Channel):
         super().__init__()
         self.chan_id = bot_id
         self.is_synchronized = True
+        # (bot_id, subject, action): filtered consumers, reset on consumers update
+        self._filtered_consumers_cache = {}
 
     async def new_consumer(self,
                            callback: object = None,
@@ -71,7 +125,8 @@ class OctoBotChannel(channels.Channel):
                            priority_level: int = DEFAULT_PRIORITY_LEVEL,
                            bot_id: object = channel_constants.CHANNEL_WILDCARD,
                            subject: object = channel_constants.CHANNEL_WILDCARD,
-                           action: object = channel_constants.CHANNEL_WILDCARD) -> OctoBotChannelConsumer:
+                           action: object = channel_constants.CHANNEL_WILDCARD,
+                           concurrent: bool = False) -> OctoBotChannelConsumer:
         """
         Creates a new OctoBot Channel consumer
         :param callback: the consumer callback
@@ -80,9 +135,11 @@ class OctoBotChannel(channels.Channel):
         :param bot_id: the consumer bot id filtering
         :param subject: the consumer subject filtering
         :param action: the consumer action filtering
+        :param concurrent: when True, each event is processed in its own task
         :return: the consumer instance created
         """
-        consumer = OctoBotChannelConsumer(callback, size=size, priority_level=priority_level)
+        consumer_class = OctoBotChannelConcurrentConsumer if concurrent else OctoBotChannelConsumer
+        consumer = consumer_class(callback, size=size, priority_level=priority_level)
         await self._add_new_consumer_and_run(consumer, bot_id=bot_id, subject=subject, action=action)
         self.logger.debug(f"Consumer started for subject: {subject} action: {action} [{consumer}]")
         return consumer
@@ -98,11 +155,24 @@ class OctoBotChannel(channels.Channel):
         :param action: the action criteria
         :return: the matched consumers list
         """
-        return self.get_consumer_from_filters({
-            self.BOT_ID_KEY: bot_id,
-            self.SUBJECT_KEY: subject,
-            self.ACTION_KEY: action
-        })
+        try:
+            return self._filtered_consumers_cache[(bot_id, subject, action)]
+        except KeyError:
+            filtered_consumers = self._filtered_consumers_cache[(bot_id, subject, action)] = \
+                self.get_consumer_from_filters({
+                    self.BOT_ID_KEY: bot_id,
+                    self.SUBJECT_KEY: subject,
+                    self.ACTION_KEY: action
+                })
+            return filtered_consumers
+
+    def add_new_consumer(self, consumer, consumer_filters) -> None:
+        self._filtered_consumers_cache.clear()
+        super().add_new_consumer(consumer, consumer_filters)
+
+    async def remove_consumer(self, consumer: OctoBotChannelConsumer) -> None:
+        self._filtered_consumers_cache.clear()
+        await super().remove_consumer(consumer)
 
     async def _add_new_consumer_and_run(self, consumer,
                                         bot_id: object = channel_constants.CHANNEL_WILDCARD,
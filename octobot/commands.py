@@ -19,6 +19,7 @@ import typing
 
 import sys
 import asyncio
+import multiprocessing
 import signal
 import threading
 import subprocess
@@ -76,7 +77,7 @@ def start_strategy_optimizer(config, commands):
     tentacles_setup_config = tentacles_manager_api.get_tentacles_setup_config(config.get_tentacles_config_path())
     optimizer = strategy_optimizer_api.create_strategy_optimizer(config.config, tentacles_setup_config, commands[0])
     if strategy_optimizer_api.get_optimizer_is_properly_initialized(optimizer):
-        strategy_optimizer_api.find_optimal_configuration(optimizer)
+        strategy_optimizer_api.find_optimal_configuration(optimizer, processes_count=multiprocessing.cpu_count())
         strategy_optimizer_api.print_optimizer_report(optimizer)
 
 
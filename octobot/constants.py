@@ -19,6 +19,7 @@ import dotenv
 import decimal
 
 import octobot_commons.os_util as os_util
+import octobot_commons.constants as commons_constants
 import octobot_commons.enums
 import octobot.enums
 
@@ -166,8 +167,17 @@ DEFAULT_TENTACLES_PACKAGE_NAME = "OctoBot-Default-Tentacles"
 LOGS_FOLDER = "logs"
 FORCED_LOG_LEVEL = os.getenv("FORCED_LOG_LEVEL", "")
 ENV_TRADING_ENABLE_DEBUG_LOGS = os_util.parse_boolean_environment_var("ENV_TRADING_ENABLE_DEBUG_LOGS", "False")
+# minimal seconds between two logs of the same market data channel, 0 to log every update
+MARKET_DATA_CHANNEL_LOGS_MIN_INTERVAL = float(os.getenv("MARKET_DATA_CHANNEL_LOGS_MIN_INTERVAL", "0"))
 
 # system
+# seconds given to OctoBot.stop, and to each of the stopped components
+OCTOBOT_STOP_TIMEOUT = float(os.getenv("OCTOBOT_STOP_TIMEOUT", "9"))
+OCTOBOT_COMPONENT_STOP_TIMEOUT = float(os.getenv("OCTOBOT_COMPONENT_STOP_TIMEOUT", "5"))
+# threads running blocking I/O calls
+IO_EXECUTOR_WORKERS = int(os.getenv("IO_EXECUTOR_WORKERS", "2"))
+# processes running CPU-heavy calls, 0 to run them in the I/O executor
+CPU_EXECUTOR_WORKERS = int(os.getenv("CPU_EXECUTOR_WORKERS", "0"))
 ENABLE_CLOCK_SYNCH = os_util.parse_boolean_environment_var("ENABLE_CLOCK_SYNCH", "True")
 ENABLE_SYSTEM_WATCHER = os_util.parse_boolean_environment_var("ENABLE_SYSTEM_WATCHER", "True")
 WATCH_RAM = os_util.parse_boolean_environment_var("WATCH_RAM", "False")
@@ -210,6 +220,15 @@ DEFAULT_PROFILE_AVATAR = f"{CONFIG_FOLDER}/{DEFAULT_PROFILE_AVATAR_FILE_NAME}"
 LOGGING_CONFIG_FILE = f"{CONFIG_FOLDER}/logging_config.ini"
 LOG_FILE = f"{LOGS_FOLDER}/{PROJECT_NAME}.log"
 
+# Backtesting
+# memory-mapped candles shared between backtestings on the same data files
+BACKTESTING_SHARED_CANDLES_FOLDER = os.path.join(
+    commons_constants.USER_FOLDER, commons_constants.DATA_FOLDER, "backtesting_shared_candles"
+)
+# least recently used candles files are removed above this size or age
+BACKTESTING_SHARED_CANDLES_MAX_SIZE = 1000000000   # 1GB
+BACKTESTING_SHARED_CANDLES_MAX_AGE = 7 * commons_constants.DAYS_TO_SECONDS
+
 # Optimizer
 OPTIMIZER_FORCE_ASYNCIO_DEBUG_OPTION = False
 OPTIMIZER_DATA_FILES_FOLDER = f"{OCTOBOT_FOLDER}/strategy_optimizer/optimizer_data_files"
@@ -229,11 +248,19 @@ OPTIMIZER_DEFAULT_MAX_MUTATION_PROBABILITY_PERCENT = decimal.Decimal(95)
 OPTIMIZER_DEFAULT_MIN_MUTATION_PROBABILITY_PERCENT = decimal.Decimal(10)
 OPTIMIZER_DEFAULT_MAX_MUTATION_NUMBER_MULTIPLIER = 3
 OPTIMIZER_DEFAULT_DB_UPDATE_PERIOD = 15
+OPTIMIZER_DEFAULT_USE_RUN_RESULTS_CACHE = True
+OPTIMIZER_RUN_RESULTS_CACHE_MAX_ENTRIES = 200000
+OPTIMIZER_RUN_RESULTS_CACHE_MAX_AGE = 30 * commons_constants.DAYS_TO_SECONDS
+OPTIMIZER_RUN_RESULTS_CACHE_EVICTION_PERIOD = 1000
+OPTIMIZER_DEFAULT_HALVING_FACTOR = 3
+OPTIMIZER_DEFAULT_HALVING_RUNGS_COUNT = 3
 
 # Databases
 DEFAULT_MAX_TOTAL_RUN_DATABASES_SIZE = 1000000000   # 1GB
 ENABLE_RUN_DATABASE_LIMIT = os_util.parse_boolean_environment_var("ENABLE_RUN_DATABASE_LIMIT", "True")
 MAX_TOTAL_RUN_DATABASES_SIZE = int(os.getenv("MAX_TOTAL_RUN_DATABASES_SIZE", DEFAULT_MAX_TOTAL_RUN_DATABASES_SIZE))
+# rebuild the run databases size index from the stored runs when it is older than this
+RUN_DATABASES_SIZE_INDEX_MAX_AGE = 7 * commons_constants.DAYS_TO_SECONDS
 
 # Channel
 OCTOBOT_CHANNEL = "OctoBot"
@@ -39,12 +39,14 @@ class CommunityConfigurationActions(enum.Enum):
 class OptimizerModes(enum.Enum):
     NORMAL = "normal"
     GENETIC = "genetic"
+    SUCCESSIVE_HALVING = "successive_halving"
 
 
 class OptimizerConfig(enum.Enum):
     OPTIMIZER_ID = "optimizer_id"
     OPTIMIZER_IDS = "optimizer_ids"
     RANDOMLY_CHOSE_RUNS = "randomly_chose_runs"
+    RANDOM_SEED = "random_seed"
     DATA_FILES = "data_files"
     OPTIMIZER_CONFIG = "optimizer_config"
     EXCHANGE_TYPE = "exchange_type"
@@ -70,6 +72,9 @@ class OptimizerConfig(enum.Enum):
     DEFAULT_CROSSOVER_PERCENT = "default_crossover_percent"
     STAY_WITHIN_BOUNDARIES = "stay_within_boundaries"
     TARGET_FITNESS_SCORE = "target_fitness_score"
+    USE_RUN_RESULTS_CACHE = "use_run_results_cache"
+    HALVING_FACTOR = "halving_factor"
+    HALVING_RUNGS_COUNT = "halving_rungs_count"
 
 
 class OctoBotDistribution(enum.Enum):
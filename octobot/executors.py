@@ -0,0 +1,107 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import concurrent.futures as futures
+import threading
+import time
+
+SUBMITTED_TASKS = "submitted_tasks"
+COMPLETED_TASKS = "completed_tasks"
+RUNNING_TASKS = "running_tasks"
+QUEUE_DEPTH = "queue_depth"
+MAX_QUEUE_DEPTH = "max_queue_depth"
+QUEUED_SUBMISSIONS = "queued_submissions"
+SATURATION = "saturation"
+AVERAGE_LATENCY = "average_latency"
+MAX_LATENCY = "max_latency"
+
+
+class ExecutorMetrics:
+    """
+    Thread safe tasks count and latency (from submission to completion) of an executor.
+    Tasks are running as long as workers are available, the others are queued.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.submitted_tasks = 0
+        self.completed_tasks = 0
+        self.max_queue_depth = 0
+        # submissions that found all workers busy
+        self.queued_submissions = 0
+        self.total_latency = 0
+        self.max_latency = 0
+        self._lock = threading.Lock()
+
+    def on_submit(self, future):
+        submit_time = time.perf_counter()
+        with self._lock:
+            if self.get_pending_tasks() >= self.max_workers:
+                self.queued_submissions += 1
+            self.submitted_tasks += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.get_queue_depth())
+        future.add_done_callback(lambda _: self._on_done(submit_time))
+
+    def _on_done(self, submit_time):
+        latency = time.perf_counter() - submit_time
+        with self._lock:
+            self.completed_tasks += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def get_pending_tasks(self):
+        return self.submitted_tasks - self.completed_tasks
+
+    def get_running_tasks(self):
+        return min(self.get_pending_tasks(), self.max_workers)
+
+    def get_queue_depth(self):
+        return max(0, self.get_pending_tasks() - self.max_workers)
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                SUBMITTED_TASKS: self.submitted_tasks,
+                COMPLETED_TASKS: self.completed_tasks,
+                RUNNING_TASKS: self.get_running_tasks(),
+                QUEUE_DEPTH: self.get_queue_depth(),
+                MAX_QUEUE_DEPTH: self.max_queue_depth,
+                QUEUED_SUBMISSIONS: self.queued_submissions,
+                SATURATION: self.get_running_tasks() / self.max_workers,
+                AVERAGE_LATENCY: self.total_latency / self.completed_tasks if self.completed_tasks else 0,
+                MAX_LATENCY: self.max_latency,
+            }
+
+
+class InstrumentedThreadPoolExecutor(futures.ThreadPoolExecutor):
+    def __init__(self, max_workers, **kwargs):
+        super().__init__(max_workers=max_workers, **kwargs)
+        self.metrics = ExecutorMetrics(max_workers)
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        self.metrics.on_submit(future)
+        return future
+
+
+class InstrumentedProcessPoolExecutor(futures.ProcessPoolExecutor):
+    def __init__(self, max_workers, **kwargs):
+        super().__init__(max_workers=max_workers, **kwargs)
+        self.metrics = ExecutorMetrics(max_workers)
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        self.metrics.on_submit(future)
+        return future
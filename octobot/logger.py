@@ -13,10 +13,12 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import functools
 import logging
 import logging.config as config
 import os
 import shutil
+import time
 import traceback
 
 import sys
@@ -40,6 +42,23 @@ import octobot.configuration_manager as configuration_manager
 
 BOT_CHANNEL_LOGGER = None
 LOGGER_PRIORITY_LEVEL = channel_enums.ChannelConsumerPriorityLevels.OPTIONAL.value
+MARKET_DATA_CHANNELS = [
+    channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.RECENT_TRADES_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.FUNDING_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.TICKER_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.MINI_TICKER_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.ORDER_BOOK_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.ORDER_BOOK_TICKER_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.KLINE_CHANNEL.value,
+    channels_name.OctoBotTradingChannelsName.MARK_PRICE_CHANNEL.value,
+]
+# channel name: minimal seconds between two logs of this channel
+CHANNEL_LOGS_MIN_INTERVALS = {
+    channel_name: constants.MARKET_DATA_CHANNEL_LOGS_MIN_INTERVAL
+    for channel_name in MARKET_DATA_CHANNELS
+}
+_LAST_CHANNEL_LOG_TIMES = {}
 
 
 def _log_uncaught_exceptions(ex_cls, ex, tb):
@@ -102,72 +121,86 @@ def _load_logger_config():
                                                            f" using default one. {ex}")
 
 
-async def init_exchange_chan_logger(exchange_id):
-    await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value,
-                                     exchange_id).new_consumer(
-        ohlcv_callback, priority_level=LOGGER_PRIORITY_LEVEL
-    )
-    await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.BALANCE_CHANNEL.value,
-                                     exchange_id).new_consumer(
-        balance_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
-    )
-    await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.TRADES_CHANNEL.value,
-                                     exchange_id).new_consumer(
-        trades_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
-    )
-    await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.LIQUIDATIONS_CHANNEL.value,
-                                     exchange_id).new_consumer(
-        liquidations_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
-    )
-    await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.POSITIONS_CHANNEL.value,
-                                     exchange_id).new_consumer(
-        positions_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
-    )
-    await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.ORDERS_CHANNEL.value,
-                                     exchange_id).new_consumer(
-        orders_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
-    )
+def is_channel_logger_enabled() -> bool:
+    return BOT_CHANNEL_LOGGER is not None and BOT_CHANNEL_LOGGER.logger.isEnabledFor(logging.DEBUG)
+
+
+def set_channel_logs_min_interval(channel_name: str, min_interval: float):
+    CHANNEL_LOGS_MIN_INTERVALS[channel_name] = min_interval
+
+
+def _should_log_channel_update(channel_name: str) -> bool:
+    if not is_channel_logger_enabled():
+        return False
+    min_interval = CHANNEL_LOGS_MIN_INTERVALS.get(channel_name)
+    if min_interval:
+        now = time.monotonic()
+        last_log_time = _LAST_CHANNEL_LOG_TIMES.get(channel_name)
+        if last_log_time is not None and now - last_log_time < min_interval:
+            return False
+        _LAST_CHANNEL_LOG_TIMES[channel_name] = now
+    return True
+
+
+def _channel_logger(channel_name: str):
+    """
+    Skip the decorated callback (and its message formatting) when its log would be filtered out
+    """
+    def decorator(callback):
+        @functools.wraps(callback)
+        async def wrapper(*args, **kwargs):
+            if _should_log_channel_update(channel_name):
+                await callback(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _get_exchange_channel_loggers() -> list:
+    medium_priority_level = channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
+    channel_loggers = [
+        (channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value, ohlcv_callback, LOGGER_PRIORITY_LEVEL),
+        (channels_name.OctoBotTradingChannelsName.BALANCE_CHANNEL.value, balance_callback, medium_priority_level),
+        (channels_name.OctoBotTradingChannelsName.TRADES_CHANNEL.value, trades_callback, medium_priority_level),
+        (channels_name.OctoBotTradingChannelsName.LIQUIDATIONS_CHANNEL.value,
+         liquidations_callback, medium_priority_level),
+        (channels_name.OctoBotTradingChannelsName.POSITIONS_CHANNEL.value, positions_callback, medium_priority_level),
+        (channels_name.OctoBotTradingChannelsName.ORDERS_CHANNEL.value, orders_callback, medium_priority_level),
+    ]
     # secondary logs, very verbose on websockets
     if constants.ENV_TRADING_ENABLE_DEBUG_LOGS:
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.RECENT_TRADES_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            recent_trades_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.FUNDING_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            funding_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.TICKER_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            ticker_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.MINI_TICKER_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            mini_ticker_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.ORDER_BOOK_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            order_book_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.ORDER_BOOK_TICKER_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            order_book_ticker_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.KLINE_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            kline_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.MARK_PRICE_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            mark_price_callback, priority_level=LOGGER_PRIORITY_LEVEL
-        )
-        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.BALANCE_PROFITABILITY_CHANNEL.value,
-                                         exchange_id).new_consumer(
-            balance_profitability_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
+        channel_loggers += [
+            (channels_name.OctoBotTradingChannelsName.RECENT_TRADES_CHANNEL.value,
+             recent_trades_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.FUNDING_CHANNEL.value, funding_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.TICKER_CHANNEL.value, ticker_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.MINI_TICKER_CHANNEL.value,
+             mini_ticker_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.ORDER_BOOK_CHANNEL.value,
+             order_book_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.ORDER_BOOK_TICKER_CHANNEL.value,
+             order_book_ticker_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.KLINE_CHANNEL.value, kline_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.MARK_PRICE_CHANNEL.value,
+             mark_price_callback, LOGGER_PRIORITY_LEVEL),
+            (channels_name.OctoBotTradingChannelsName.BALANCE_PROFITABILITY_CHANNEL.value,
+             balance_profitability_callback, medium_priority_level),
+        ]
+    return channel_loggers
+
+
+async def init_exchange_chan_logger(exchange_id):
+    # channel logs are debug logs: subscribe only when they can be displayed
+    if not is_channel_logger_enabled():
+        return
+    for channel_name, callback, priority_level in _get_exchange_channel_loggers():
+        await exchanges_channel.get_chan(channel_name, exchange_id).new_consumer(
+            callback, priority_level=priority_level
         )
 
 
 async def init_evaluator_chan_logger(matrix_id: str):
+    if not is_channel_logger_enabled():
+        return
     await evaluator_channels.get_chan(channels_name.OctoBotEvaluatorsChannelsName.MATRIX_CHANNEL.value,
                                       matrix_id).new_consumer(
         matrix_callback, priority_level=LOGGER_PRIORITY_LEVEL
@@ -187,6 +220,7 @@ async def init_octobot_chan_logger(bot_id: str):
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.TICKER_CHANNEL.value)
 async def ticker_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, ticker
 ):
@@ -196,6 +230,7 @@ async def ticker_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.MINI_TICKER_CHANNEL.value)
 async def mini_ticker_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, mini_ticker
 ):
@@ -205,6 +240,7 @@ async def mini_ticker_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.ORDER_BOOK_CHANNEL.value)
 async def order_book_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, asks, bids
 ):
@@ -214,6 +250,7 @@ async def order_book_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.ORDER_BOOK_TICKER_CHANNEL.value)
 async def order_book_ticker_callback(
         exchange: str,
         exchange_id: str,
@@ -231,6 +268,7 @@ async def order_book_ticker_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value)
 async def ohlcv_callback(
         exchange: str,
         exchange_id: str,
@@ -245,6 +283,7 @@ async def ohlcv_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.RECENT_TRADES_CHANNEL.value)
 async def recent_trades_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, recent_trades
 ):
@@ -254,6 +293,7 @@ async def recent_trades_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.LIQUIDATIONS_CHANNEL.value)
 async def liquidations_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, liquidations
 ):
@@ -263,6 +303,7 @@ async def liquidations_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.KLINE_CHANNEL.value)
 async def kline_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, time_frame, kline
 ):
@@ -272,6 +313,7 @@ async def kline_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.MARK_PRICE_CHANNEL.value)
 async def mark_price_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, mark_price
 ):
@@ -296,6 +338,7 @@ def _filter_balance(balance: dict):
     return balance, 0
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.BALANCE_CHANNEL.value)
 async def balance_callback(exchange: str, exchange_id: str, balance):
     filtered_balance, filtered_count = _filter_balance(balance)
     BOT_CHANNEL_LOGGER.debug(
@@ -303,6 +346,7 @@ async def balance_callback(exchange: str, exchange_id: str, balance):
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.BALANCE_PROFITABILITY_CHANNEL.value)
 async def balance_profitability_callback(
         exchange: str,
         exchange_id: str,
@@ -317,6 +361,7 @@ async def balance_profitability_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.TRADES_CHANNEL.value)
 async def trades_callback(
         exchange: str,
         exchange_id: str,
@@ -332,6 +377,7 @@ async def trades_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.ORDERS_CHANNEL.value)
 async def orders_callback(
         exchange: str,
         exchange_id: str,
@@ -348,6 +394,7 @@ async def orders_callback(
     BOT_CHANNEL_LOGGER.debug(order_string)
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.POSITIONS_CHANNEL.value)
 async def positions_callback(
         exchange: str,
         exchange_id: str,
@@ -359,6 +406,7 @@ async def positions_callback(
     BOT_CHANNEL_LOGGER.debug(f"POSITIONS : EXCHANGE = {exchange} || POSITIONS = {position}")
 
 
+@_channel_logger(channels_name.OctoBotTradingChannelsName.FUNDING_CHANNEL.value)
 async def funding_callback(
         exchange: str,
         exchange_id: str,
@@ -376,6 +424,7 @@ async def funding_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotEvaluatorsChannelsName.MATRIX_CHANNEL.value)
 async def matrix_callback(
         matrix_id,
         evaluator_name,
@@ -395,6 +444,7 @@ async def matrix_callback(
     )
 
 
+@_channel_logger(channels_name.OctoBotEvaluatorsChannelsName.EVALUATORS_CHANNEL.value)
 async def evaluators_callback(
         matrix_id,
         evaluator_name,
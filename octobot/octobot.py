@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import asyncio
+import functools
 import time
 import uuid
 
@@ -134,12 +135,40 @@ class OctoBot:
         self.interface_producer = producers.InterfaceProducer(self.global_consumer.octobot_channel, self)
         self.service_feed_producer = producers.ServiceFeedProducer(self.global_consumer.octobot_channel, self)
 
+    def get_producers_dependencies(self):
+        """
+        :return: each producer associated to the producers to be started before it, in start order
+        """
+        return {
+            self.evaluator_producer: (),
+            # exchanges and evaluators are bound to the evaluator matrix
+            self.exchange_producer: (self.evaluator_producer, ),
+            # Start service feeds once evaluators registered their feed requirements
+            self.service_feed_producer: (self.evaluator_producer, ),
+            # exchanges are registered into interfaces when created: no need to wait for them
+            self.interface_producer: (),
+        }
+
     async def start_producers(self):
-        await self.evaluator_producer.run()
-        await self.exchange_producer.run()
-        # Start service feeds now that evaluators registered their feed requirements
-        await self.service_feed_producer.run()
-        await self.interface_producer.run()
+        producer_tasks = {}
+        for producer, required_producers in self.get_producers_dependencies().items():
+            producer_tasks[producer] = asyncio.create_task(
+                self._start_producer(producer, [producer_tasks[required] for required in required_producers])
+            )
+        try:
+            await asyncio.gather(*producer_tasks.values())
+        except BaseException:
+            for task in producer_tasks.values():
+                task.cancel()
+            await asyncio.gather(*producer_tasks.values(), return_exceptions=True)
+            raise
+
+    async def _start_producer(self, producer, required_producer_tasks):
+        if required_producer_tasks:
+            await asyncio.gather(*required_producer_tasks)
+        start_time = time.time()
+        await producer.run()
+        self.logger.debug(f"{producer.__class__.__name__} started in {round(time.time() - start_time, 3)} seconds")
 
     async def _post_initialize(self):
         self.initialized = True
@@ -208,23 +237,71 @@ class OctoBot:
             if self._init_metadata_run_task is not None and not self._init_metadata_run_task.done():
                 self._init_metadata_run_task.cancel()
             signals.SignalPublisher.instance().stop()
-            await self.evaluator_producer.stop()
-            await self.exchange_producer.stop()
-            await self.community_auth.stop()
-            await self.service_feed_producer.stop()
-            await profiles.stop_profile_synchronizer()
-            await os_clock_sync.stop_clock_synchronizer()
-            await system_resources_watcher.stop_system_resources_watcher()
-            await service_api.stop_services()
-            await self.interface_producer.stop()
-            await databases.close_bot_storage(self.bot_id)
-            if self.automation is not None:
-                await self.automation.stop()
-
+            await self._stop_components(
+                self.get_stop_dependencies(), constants.OCTOBOT_COMPONENT_STOP_TIMEOUT, constants.OCTOBOT_STOP_TIMEOUT
+            )
         finally:
             self.stopped.set()
             self.logger.info("Stopped, now shutting down.")
 
+    def get_stop_dependencies(self):
+        """
+        :return: each component name associated to its stop coroutine function and to the
+        components to be stopped before it
+        """
+        return {
+            "evaluators": (self.evaluator_producer.stop, ()),
+            "service feeds": (self.service_feed_producer.stop, ()),
+            "community": (self.community_auth.stop, ()),
+            "profile synchronizer": (profiles.stop_profile_synchronizer, ()),
+            "clock synchronizer": (os_clock_sync.stop_clock_synchronizer, ()),
+            "system resources watcher": (system_resources_watcher.stop_system_resources_watcher, ()),
+            "automation": (self._stop_automation, ()),
+            # evaluators are fed by exchanges
+            "exchanges": (self.exchange_producer.stop, ("evaluators", )),
+            "services": (service_api.stop_services, ("service feeds", )),
+            "interfaces": (self.interface_producer.stop, ("services", )),
+            # exchanges and automations are writing into the bot storage
+            "storage": (functools.partial(databases.close_bot_storage, self.bot_id), ("exchanges", "automation")),
+        }
+
+    async def _stop_automation(self):
+        if self.automation is not None:
+            await self.automation.stop()
+
+    async def _stop_components(self, stop_dependencies, component_timeout, timeout):
+        stop_tasks = {}
+        for name, (stop, required_components) in stop_dependencies.items():
+            stop_tasks[name] = asyncio.create_task(self._stop_component(
+                name, stop, [stop_tasks[required] for required in required_components], component_timeout
+            ))
+        _, pending = await asyncio.wait(stop_tasks.values(), timeout=timeout)
+        if pending:
+            self.logger.warning(
+                f"Stop timeout ({timeout} seconds) reached, forcing stop of: "
+                f"{', '.join(name for name, task in stop_tasks.items() if task in pending)}"
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+    async def _stop_component(self, name, stop, required_component_tasks, timeout):
+        if required_component_tasks:
+            await asyncio.wait(required_component_tasks)
+        start_time = time.time()
+        try:
+            await asyncio.wait_for(stop(), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Stop timeout ({timeout} seconds) reached for {name}, skipping it")
+            return
+        except Exception as err:
+            self.logger.exception(err, True, f"Error when stopping {name}: {err}")
+            return
+        duration = time.time() - start_time
+        # slow components are still stopped but are delaying the bot stop
+        log = self.logger.warning if duration > timeout / 2 else self.logger.debug
+        log(f"{name} stopped in {round(duration, 3)} seconds")
+
     async def _start_tools_tasks(self):
         await self._init_aiohttp_session()
         self._init_community()
@@ -84,6 +84,12 @@ class OctoBotAPI:
     def run_in_async_executor(self, coroutine):
         return self._octobot.task_manager.run_in_async_executor(coroutine)
 
+    async def run_in_cpu_executor(self, func, *args):
+        return await self._octobot.task_manager.run_in_cpu_executor(func, *args)
+
+    def get_executors_metrics(self) -> dict:
+        return self._octobot.task_manager.get_executors_metrics()
+
     def stop_tasks(self) -> None:
         self._octobot.task_manager.stop_tasks()
 
@@ -52,12 +52,13 @@ class OctoBotChannelGlobalConsumer:
         self.octobot_channel_consumers.append(
             await self.octobot_channel.new_consumer(self.octobot_channel_callback, bot_id=self.octobot.bot_id))
 
-        # Initialize trading consumer
+        # Initialize trading consumer: exchanges are created concurrently
         self.octobot_channel_consumers.append(
             await self.octobot_channel.new_consumer(
                 trading_channel_consumer.octobot_channel_callback,
                 bot_id=self.octobot.bot_id,
-                action=[action.value for action in trading_channel_consumer.OctoBotChannelTradingActions]
+                action=[action.value for action in trading_channel_consumer.OctoBotChannelTradingActions],
+                concurrent=True
             ))
 
         # Initialize evaluator consumer
@@ -13,11 +13,16 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import time
+
 import octobot_commons.enums as common_enums
+import octobot_commons.channels_name as channels_name
 
 import octobot_backtesting.api as backtesting_api
 
 import octobot_evaluators.api as evaluator_api
+import octobot_evaluators.evaluators.channel as evaluator_channels
 import octobot_evaluators.octobot_channel_consumer as evaluator_channel_consumer
 
 import octobot.channels as octobot_channel
@@ -35,6 +40,8 @@ class EvaluatorProducer(octobot_channel.OctoBotChannelProducer):
         self.tentacles_setup_config = self.octobot.tentacles_setup_config
 
         self.matrix_id = None
+        self._first_evaluation_consumer = None
+        self._first_evaluation_consumer_removal_task = None
 
     async def start(self):
         await evaluator_api.initialize_evaluators(self.octobot.config, self.tentacles_setup_config)
@@ -43,6 +50,22 @@ class EvaluatorProducer(octobot_channel.OctoBotChannelProducer):
             self.matrix_id, is_backtesting=backtesting_api.is_backtesting_enabled(self.octobot.config)
         )
         await logger.init_evaluator_chan_logger(self.matrix_id)
+        self._first_evaluation_consumer = await evaluator_channels.get_chan(
+            channels_name.OctoBotEvaluatorsChannelsName.MATRIX_CHANNEL.value, self.matrix_id
+        ).new_consumer(self._first_evaluation_callback, priority_level=logger.LOGGER_PRIORITY_LEVEL)
+
+    async def _first_evaluation_callback(self, matrix_id, evaluator_name, **kwargs):
+        if self._first_evaluation_consumer is None:
+            return
+        consumer, self._first_evaluation_consumer = self._first_evaluation_consumer, None
+        self.logger.info(f"First evaluation received from {evaluator_name} "
+                         f"{round(time.time() - self.octobot.start_time, 3)} seconds after startup")
+        # removing a consumer stops it: do it from outside of its own callback
+        self._first_evaluation_consumer_removal_task = asyncio.create_task(
+            evaluator_channels.get_chan(
+                channels_name.OctoBotEvaluatorsChannelsName.MATRIX_CHANNEL.value, matrix_id
+            ).remove_consumer(consumer)
+        )
 
     async def create_evaluators(self, exchange_configuration):
         await self.send(bot_id=self.octobot.bot_id,
@@ -37,11 +37,14 @@ class ExchangeProducer(octobot_channel.OctoBotChannelProducer):
         self.created_all_exchanges = asyncio.Event()
 
     async def start(self):
-        self.to_create_exchanges_count = 0
+        exchange_names = trading_api.get_enabled_exchanges_names(self.octobot.config)
+        # count exchanges first: concurrently created exchanges can be registered before the last one is requested
+        self.to_create_exchanges_count = len(exchange_names)
         self.created_all_exchanges.clear()
-        for exchange_name in trading_api.get_enabled_exchanges_names(self.octobot.config):
+        if not exchange_names:
+            self.created_all_exchanges.set()
+        for exchange_name in exchange_names:
             await self.create_exchange(exchange_name, self.backtesting)
-            self.to_create_exchanges_count += 1
 
     def register_created_exchange_id(self, exchange_id):
         self.exchange_manager_ids.append(exchange_id)
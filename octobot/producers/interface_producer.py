@@ -59,8 +59,7 @@ class InterfaceProducer(octobot_channels.OctoBotChannelProducer):
                 f"did not start properly.")
 
     async def register_exchange(self, exchange_id):
-        for to_notify_instance in self.interfaces + self.notifiers:
-            await self._register_exchange(to_notify_instance, exchange_id)
+        await self._register_exchanges(self.interfaces + self.notifiers, [exchange_id])
 
     async def register_interface(self, instance):
         if instance is not None:
@@ -74,8 +73,7 @@ class InterfaceProducer(octobot_channels.OctoBotChannelProducer):
             await service_api.process_pending_notifications()
 
     async def _register_existing_exchanges(self, instance):
-        for exchange_id in self.octobot.exchange_producer.exchange_manager_ids:
-            await self._register_exchange(instance, exchange_id)
+        await self._register_exchanges([instance], self.octobot.exchange_producer.exchange_manager_ids)
 
     async def _create_interfaces(self, in_backtesting):
         # do not overwrite data in case of inner bots init (backtesting)
@@ -131,14 +129,20 @@ class InterfaceProducer(octobot_channels.OctoBotChannelProducer):
                             })
             self.to_create_notifiers_count += 1
 
-    async def _register_exchange(self, to_notify_instance, exchange_id):
-        await self.send(bot_id=self.octobot.bot_id,
-                        subject=common_enums.OctoBotChannelSubjects.UPDATE.value,
-                        action=service_channel_consumer.OctoBotChannelServiceActions.EXCHANGE_REGISTRATION.value,
-                        data={
-                            service_channel_consumer.OctoBotChannelServiceDataKeys.INSTANCE.value: to_notify_instance,
-                            service_channel_consumer.OctoBotChannelServiceDataKeys.EXCHANGE_ID.value: exchange_id,
-                        })
+    async def _register_exchanges(self, to_notify_instances, exchange_ids):
+        await self.send_batch(
+            bot_id=self.octobot.bot_id,
+            subject=common_enums.OctoBotChannelSubjects.UPDATE.value,
+            action=service_channel_consumer.OctoBotChannelServiceActions.EXCHANGE_REGISTRATION.value,
+            data_batch=[
+                {
+                    service_channel_consumer.OctoBotChannelServiceDataKeys.INSTANCE.value: to_notify_instance,
+                    service_channel_consumer.OctoBotChannelServiceDataKeys.EXCHANGE_ID.value: exchange_id,
+                }
+                for to_notify_instance in to_notify_instances
+                for exchange_id in exchange_ids
+            ]
+        )
 
     def _is_interface_relevant(self, interface_class, backtesting_enabled):
         return service_api.is_enabled(interface_class) and \
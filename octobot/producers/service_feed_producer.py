@@ -50,15 +50,19 @@ class ServiceFeedProducer(octobot_channels.OctoBotChannelProducer):
 
     async def start_feeds(self):
         self.started = True
-        for feed in self.service_feeds:
-            await self.send(bot_id=self.octobot.bot_id,
-                            subject=common_enums.OctoBotChannelSubjects.UPDATE.value,
-                            action=service_channel_consumer.OctoBotChannelServiceActions.START_SERVICE_FEED.value,
-                            data={
-                                service_channel_consumer.OctoBotChannelServiceDataKeys.INSTANCE.value: feed,
-                                service_channel_consumer.OctoBotChannelServiceDataKeys.EDITED_CONFIG.value:
-                                    self.octobot.get_edited_config(constants.CONFIG_KEY, dict_only=False)
-                            })
+        edited_config = self.octobot.get_edited_config(constants.CONFIG_KEY, dict_only=False)
+        await self.send_batch(
+            bot_id=self.octobot.bot_id,
+            subject=common_enums.OctoBotChannelSubjects.UPDATE.value,
+            action=service_channel_consumer.OctoBotChannelServiceActions.START_SERVICE_FEED.value,
+            data_batch=[
+                {
+                    service_channel_consumer.OctoBotChannelServiceDataKeys.INSTANCE.value: feed,
+                    service_channel_consumer.OctoBotChannelServiceDataKeys.EDITED_CONFIG.value: edited_config
+                }
+                for feed in self.service_feeds
+            ]
+        )
 
     async def create_feed(self, service_feed_factory, feed, in_backtesting):
         await self.send(bot_id=self.octobot.bot_id,
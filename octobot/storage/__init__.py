@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 from octobot.storage import trading_metadata
+from octobot.storage import run_databases_size_index
 from octobot.storage import db_databases_pruning
 
 from octobot.storage.trading_metadata import (
@@ -21,8 +22,14 @@ from octobot.storage.trading_metadata import (
     store_run_metadata,
     store_backtesting_run_metadata,
 )
+from octobot.storage.run_databases_size_index import (
+    RunDatabasesSizeIndex,
+    IndexedRunDatabasesPruner,
+)
 from octobot.storage.db_databases_pruning import (
-    enforce_total_databases_max_size
+    enforce_total_databases_max_size,
+    register_run_databases,
+    remove_run_databases,
 )
 
 
@@ -30,5 +37,9 @@ __all__ = [
     "clear_run_metadata",
     "store_run_metadata",
     "store_backtesting_run_metadata",
+    "RunDatabasesSizeIndex",
+    "IndexedRunDatabasesPruner",
     "enforce_total_databases_max_size",
+    "register_run_databases",
+    "remove_run_databases",
 ]
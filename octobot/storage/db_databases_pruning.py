@@ -15,14 +15,57 @@
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import octobot_commons.databases as databases
 import octobot.constants as constants
+import octobot.storage.run_databases_size_index as run_databases_size_index
+
+
+_SIZE_INDEXES_BY_ROOT = {}
 
 
 async def enforce_total_databases_max_size():
     if constants.ENABLE_RUN_DATABASE_LIMIT:
         run_databases_identifier = databases.RunDatabasesProvider.instance().get_any_run_databases_identifier()
-        pruner = databases.run_databases_pruner_factory(
-            run_databases_identifier,
-            constants.MAX_TOTAL_RUN_DATABASES_SIZE,
-        )
+        if run_databases_identifier.database_adaptor.is_file_system_based():
+            pruner = run_databases_size_index.IndexedRunDatabasesPruner(
+                run_databases_identifier,
+                constants.MAX_TOTAL_RUN_DATABASES_SIZE,
+                _get_size_index(run_databases_identifier.data_path),
+                max_index_age=constants.RUN_DATABASES_SIZE_INDEX_MAX_AGE,
+            )
+        else:
+            pruner = databases.run_databases_pruner_factory(
+                run_databases_identifier,
+                constants.MAX_TOTAL_RUN_DATABASES_SIZE,
+            )
         await pruner.explore()
         await pruner.prune_oldest_run_databases()
+
+
+def register_run_databases(run_databases_identifier):
+    """
+    Add the run databases of a completed backtesting run to the run databases size index
+    """
+    if constants.ENABLE_RUN_DATABASE_LIMIT and run_databases_identifier.database_adaptor.is_file_system_based():
+        size_index = _get_size_index(run_databases_identifier.data_path)
+        # when the index does not exist yet, this run will be indexed by the next full exploration
+        if size_index.exists():
+            size_index.add_run_folder(run_databases_identifier.get_backtesting_run_folder())
+
+
+def remove_run_databases(run_databases_identifier):
+    """
+    Delete every run databases of the given identifier and remove them from the run databases size index
+    """
+    run_databases_identifier.remove_all()
+    if run_databases_identifier.database_adaptor.is_file_system_based():
+        size_index = _get_size_index(run_databases_identifier.data_path)
+        if size_index.exists():
+            size_index.remove_run_folders_within(run_databases_identifier.get_backtesting_run_folder())
+
+
+def _get_size_index(databases_root):
+    try:
+        return _SIZE_INDEXES_BY_ROOT[databases_root]
+    except KeyError:
+        size_index = run_databases_size_index.RunDatabasesSizeIndex(databases_root)
+        _SIZE_INDEXES_BY_ROOT[databases_root] = size_index
+        return size_index
@@ -0,0 +1,280 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import contextlib
+import json
+import os
+import time
+import uuid
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+import octobot_commons.databases as databases
+import octobot_commons.databases.run_databases.abstract_run_databases_pruner as abstract_run_databases_pruner
+
+
+class RunDatabasesSizeIndex:
+    """
+    Persistent size and age index of the stored run databases. Stored as an append-only journal of added and
+    removed run folders to be safely updated by every process writing run databases.
+    The journal is only rewritten while holding an exclusive lock on its lock file: appends from other processes
+    can't be lost
+    """
+    JOURNAL_FILE = "run_databases_size_index.txt"
+    JOURNAL_LOCK_FILE = "run_databases_size_index.lock"
+    # rewrite the journal when it contains many more entries than indexed runs
+    COMPACTION_MIN_ENTRIES = 1000
+    COMPACTION_ENTRIES_RATIO = 2
+    JOURNAL_ID_KEY = "id"
+    RESET_TIME_KEY = "reset_time"
+
+    def __init__(self, databases_root):
+        self.journal_path = os.path.join(databases_root, self.JOURNAL_FILE)
+        self.lock_path = os.path.join(databases_root, self.JOURNAL_LOCK_FILE)
+        self.total_size = 0
+        # run folder: (size, last modified time), from the oldest to the most recent
+        self.runs = {}
+        # time of the last rebuild of the index from the stored runs
+        self.reset_time = None
+        self._journal_entries = 0
+        self._read_offset = 0
+        self._journal_id = None
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.journal_path)
+
+    def refresh(self):
+        """
+        Apply the entries appended to the journal since the last refresh
+        """
+        try:
+            with open(self.journal_path, "rb") as journal:
+                # inodes can be reused: also identify the journal by its first line
+                journal_id = (os.fstat(journal.fileno()).st_ino, journal.readline())
+                if journal_id != self._journal_id:
+                    # journal has been compacted: read it again
+                    self._clear()
+                    self._journal_id = journal_id
+                    self.reset_time = self._get_reset_time(journal_id[1])
+                journal.seek(self._read_offset)
+                content = journal.read()
+        except FileNotFoundError:
+            self._clear()
+            return
+        # ignore the last entry if it is being written
+        complete_content_size = content.rfind(b"\n") + 1
+        for entry in content[:complete_content_size].splitlines():
+            self._apply_entry(entry)
+        self._read_offset += complete_content_size
+
+    def reset(self, all_db_data):
+        """
+        Replace the journal content by the given runs
+        """
+        with self._journal_lock(exclusive=True):
+            self._write_journal([
+                [os.fspath(db_data.identifier), db_data.size, db_data.last_modified_time]
+                for db_data in sorted(all_db_data, key=lambda data: data.last_modified_time)
+            ], time.time())
+        self.refresh()
+
+    def add_run_folder(self, run_folder):
+        size = 0
+        last_modified_time = 0
+        for file_stat in self._get_files_stat(run_folder):
+            size += file_stat.st_size
+            last_modified_time = max(last_modified_time, file_stat.st_mtime)
+        self._append([[run_folder, size, last_modified_time]])
+
+    def remove_run_folders(self, run_folders):
+        self._append([[run_folder] for run_folder in run_folders])
+        if self._journal_entries > max(
+            self.COMPACTION_MIN_ENTRIES, len(self.runs) * self.COMPACTION_ENTRIES_RATIO
+        ):
+            self._compact()
+
+    def remove_run_folders_within(self, folder):
+        """
+        Remove the given run folder and every run folder it contains
+        """
+        self.refresh()
+        folder = os.path.normpath(folder)
+        removed_run_folders = [
+            run_folder
+            for run_folder in self.runs
+            if os.path.normpath(run_folder) == folder or os.path.normpath(run_folder).startswith(folder + os.sep)
+        ]
+        if removed_run_folders:
+            self.remove_run_folders(removed_run_folders)
+
+    def get_oldest_db_data(self):
+        for run_folder, (size, last_modified_time) in self.runs.items():
+            yield IndexedDBData(run_folder, size, last_modified_time)
+
+    def _append(self, entries):
+        # appends from several processes can run concurrently, they are only excluded by compactions
+        with self._journal_lock(exclusive=False):
+            with open(self.journal_path, "a") as journal:
+                journal.write("".join(f"{json.dumps(entry)}\n" for entry in entries))
+        self.refresh()
+
+    def _compact(self):
+        with self._journal_lock(exclusive=True):
+            # also keep the entries appended by other processes until the lock was acquired
+            self.refresh()
+            self._write_journal([
+                [run_folder, size, last_modified_time]
+                for run_folder, (size, last_modified_time) in self.runs.items()
+            ], self.reset_time)
+        self.refresh()
+
+    def _write_journal(self, entries, reset_time):
+        # requires the exclusive journal lock
+        temp_path = f"{self.journal_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as journal:
+            # unique first line of each compacted journal
+            journal.write(f"{json.dumps({self.JOURNAL_ID_KEY: uuid.uuid4().hex, self.RESET_TIME_KEY: reset_time})}\n")
+            journal.write("".join(f"{json.dumps(entry)}\n" for entry in entries))
+        os.replace(temp_path, self.journal_path)
+
+    @contextlib.contextmanager
+    def _journal_lock(self, exclusive):
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        with open(self.lock_path, "a+b") as lock_file:
+            if os.name == "nt":
+                # only exclusive locks are available on windows
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if os.name == "nt":
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _apply_entry(self, entry):
+        try:
+            parsed_entry = json.loads(entry)
+        except ValueError:
+            # ignore corrupted entries
+            return
+        if not isinstance(parsed_entry, list) or not parsed_entry:
+            # journal first line or corrupted entry
+            return
+        run_folder, *values = parsed_entry
+        self._journal_entries += 1
+        if run_folder in self.runs:
+            self.total_size -= self.runs.pop(run_folder)[0]
+        if values:
+            size, last_modified_time = values
+            self.runs[run_folder] = (size, last_modified_time)
+            self.total_size += size
+
+    def _get_reset_time(self, journal_first_line):
+        try:
+            return json.loads(journal_first_line)[self.RESET_TIME_KEY]
+        except (ValueError, TypeError, KeyError):
+            # empty or corrupted journal or journal without reset time
+            return None
+
+    def _clear(self):
+        self.total_size = 0
+        self.runs = {}
+        self.reset_time = None
+        self._journal_entries = 0
+        self._read_offset = 0
+        self._journal_id = None
+
+    def _get_files_stat(self, root):
+        try:
+            for entry in os.scandir(root):
+                if entry.is_file():
+                    yield entry.stat()
+                elif entry.is_dir():
+                    yield from self._get_files_stat(entry)
+        except FileNotFoundError:
+            pass
+
+
+class IndexedDBData(abstract_run_databases_pruner.DBData):
+    def __init__(self, identifier, size, last_modified_time):
+        # parts are not read: size and last modified time are already indexed
+        # pylint: disable=super-init-not-called
+        self.identifier = identifier
+        self.parts = []
+        self.size = size
+        self.last_modified_time = last_modified_time
+
+
+class IndexedRunDatabasesPruner(databases.FileSystemRunDatabasesPruner):
+    """
+    Run databases pruner using a RunDatabasesSizeIndex instead of exploring every stored run.
+    The index is rebuilt from the stored runs when it is older than max_index_age or when runs have been
+    deleted without updating it
+    """
+    def __init__(self, run_databases_identifier, max_databases_size, size_index, max_index_age=None):
+        super().__init__(run_databases_identifier, max_databases_size)
+        self.size_index = size_index
+        self.max_index_age = max_index_age
+        self.has_missing_run_folders = False
+
+    async def explore(self):
+        if self.size_index.exists():
+            self.size_index.refresh()
+            if not self._is_index_outdated():
+                return
+        await self._rebuild_index()
+
+    async def prune_oldest_run_databases(self):
+        removed_databases = []
+        remaining_size = self.size_index.total_size
+        for db_data in self.size_index.get_oldest_db_data():
+            if remaining_size <= self.max_databases_size:
+                break
+            if await self._prune_database(db_data):
+                removed_databases.append(db_data)
+                remaining_size -= db_data.size
+        if removed_databases:
+            self.size_index.remove_run_folders([db_data.identifier for db_data in removed_databases])
+            await self._update_backtesting_runs_metadata(removed_databases)
+            self._log_summary(removed_databases)
+        if self.has_missing_run_folders:
+            # indexed runs have been deleted elsewhere: stored runs might also be missing from the index
+            await self._rebuild_index()
+
+    async def _prune_database(self, db_data):
+        if not os.path.isdir(db_data.identifier):
+            # already deleted
+            self.has_missing_run_folders = True
+            return True
+        return await super()._prune_database(db_data)
+
+    def _is_index_outdated(self):
+        if self.max_index_age is None:
+            return False
+        return self.size_index.reset_time is None or time.time() - self.size_index.reset_time > self.max_index_age
+
+    async def _rebuild_index(self):
+        await super().explore()
+        self.size_index.reset(self.all_db_data)
+        self.all_db_data = []
+        self.has_missing_run_folders = False
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import itertools
 import math
 import numpy
 
@@ -22,11 +23,13 @@ import octobot_commons.constants as commons_constants
 import octobot_commons.databases as commons_databases
 import octobot_commons.configuration as commons_configuration
 import octobot_commons.time_frame_manager as time_frame_manager
+import octobot_commons.symbols.symbol_util as symbol_util
 
 import octobot_backtesting.api as backtesting_api
 
 import octobot_trading.api as trading_api
 import octobot_trading.enums as trading_enums
+import octobot_trading.personal_data as trading_personal_data
 import octobot.backtesting as backtesting
 
 
@@ -103,41 +106,27 @@ async def _get_multi_exchange_data(exchange_managers, is_backtesting):
         for exchange_manager in exchange_managers
         for data_file in trading_api.get_backtesting_data_files(exchange_manager)
     )) if is_backtesting else []
-    profitability = numpy.average(tuple(
-        float(trading_api.get_profitability_stats(exchange_manager)[0])
-        for exchange_manager in exchange_managers
-    ))
-    profitability_percent = numpy.average(tuple(
-        float(trading_api.get_profitability_stats(exchange_manager)[1])
-        for exchange_manager in exchange_managers
-    ))
-    markets_profitability = _get_markets_profitability(exchange_managers, time_frames) if is_backtesting else {}
+    min_tf = time_frame_manager.find_min_time_frame(time_frames) if is_backtesting else None
+    markets_profitability = {}
+    exchanges_metrics = []
+    for exchange_manager in exchange_managers:
+        exchanges_metrics.append(await _get_exchange_metrics(exchange_manager))
+        if is_backtesting:
+            _update_markets_profitability(markets_profitability, exchange_manager, min_tf)
+    profitability = numpy.average([metrics.profitability for metrics in exchanges_metrics])
+    profitability_percent = numpy.average([metrics.profitability_percent for metrics in exchanges_metrics])
     exchange_names = [
         trading_api.get_exchange_name(exchange_manager)
         for exchange_manager in exchange_managers
     ]
     future_contracts_by_exchange = _get_future_contracts_by_exchange(exchange_managers)
-    trades = [
-        trade
-        for exchange_manager in exchange_managers
-        for trade in trading_api.get_trade_history(exchange_manager, include_cancelled=False)
-    ]
-    entries = [
-        trade
-        for trade in trades
-        if trade.status is trading_enums.OrderStatus.FILLED and trade.side is trading_enums.TradeOrderSide.BUY
-    ]
-    win_rate = round(numpy.average(tuple(
-        float(trading_api.get_win_rate(exchange_manager) * 100)
-        for exchange_manager in exchange_managers
-    )), 3)
-    wins = 0 if math.isnan(win_rate) else round(win_rate * len(entries) / 100)
-    draw_down = round(numpy.average(tuple(
-        float(trading_api.get_draw_down(exchange_manager))
-        for exchange_manager in exchange_managers
-    )), 3)
-    r_sq_end_balance = await _get_coefficient_of_determination(exchange_managers, False)
-    r_sq_max_balance = await _get_coefficient_of_determination(exchange_managers, True)
+    trades_count = sum(metrics.trades_count for metrics in exchanges_metrics)
+    entries_count = sum(metrics.entries_count for metrics in exchanges_metrics)
+    win_rate = round(numpy.average([metrics.win_rate * 100 for metrics in exchanges_metrics]), 3)
+    wins = 0 if math.isnan(win_rate) else round(win_rate * entries_count / 100)
+    draw_down = round(numpy.average([metrics.draw_down for metrics in exchanges_metrics]), 3)
+    r_sq_end_balance = _get_coefficient_of_determination(exchanges_metrics, False)
+    r_sq_max_balance = _get_coefficient_of_determination(exchanges_metrics, True)
     duration = round(max(
         backtesting_api.get_backtesting_duration(exchange_manager.exchange.backtesting)
         for exchange_manager in exchange_managers
@@ -174,10 +163,10 @@ async def _get_multi_exchange_data(exchange_managers, is_backtesting):
             common_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_END_BALANCE.value: r_sq_end_balance or 0,
             common_enums.BacktestingMetadata.SYMBOLS.value: symbols,
             common_enums.BacktestingMetadata.TIME_FRAMES.value: time_frames,
-            common_enums.BacktestingMetadata.ENTRIES.value: len(entries),
+            common_enums.BacktestingMetadata.ENTRIES.value: entries_count,
             common_enums.BacktestingMetadata.WINS.value: wins,
-            common_enums.BacktestingMetadata.LOSES.value: len(entries) - wins,
-            common_enums.BacktestingMetadata.TRADES.value: len(trades),
+            common_enums.BacktestingMetadata.LOSES.value: entries_count - wins,
+            common_enums.BacktestingMetadata.TRADES.value: trades_count,
             common_enums.DBRows.EXCHANGES.value: exchange_names,
             common_enums.DBRows.START_TIME.value: start_time,
             common_enums.DBRows.END_TIME.value: end_time,
@@ -186,32 +175,202 @@ async def _get_multi_exchange_data(exchange_managers, is_backtesting):
     }
 
 
-async def _get_coefficient_of_determination(exchange_managers, use_high_instead_of_end_balance):
-    try:
-        return numpy.average([
-            await trading_api.get_coefficient_of_determination(
-                exchange_manager,
-                use_high_instead_of_end_balance=use_high_instead_of_end_balance
+class _ExchangeMetrics:
+    def __init__(self, profitability, profitability_percent, trades_count, entries_count, win_rate, draw_down,
+                 r_sq_end_balance, r_sq_max_balance):
+        self.profitability = profitability
+        self.profitability_percent = profitability_percent
+        self.trades_count = trades_count
+        self.entries_count = entries_count
+        self.win_rate = win_rate
+        self.draw_down = draw_down
+        self.r_sq_end_balance = r_sq_end_balance
+        self.r_sq_max_balance = r_sq_max_balance
+
+
+async def _get_exchange_metrics(exchange_manager) -> _ExchangeMetrics:
+    """
+    Computes every metric of an exchange run from columns read once from its trades and transactions,
+    results are identical to the per metric octobot_trading.api functions
+    """
+    profitability, profitability_percent, _, _, _ = trading_api.get_profitability_stats(exchange_manager)
+    # read every trade attribute once: same trades as trading_api.get_trade_history(include_cancelled=False)
+    trades = exchange_manager.exchange_personal_data.trades_manager.get_trades()
+    cancelled, filled, buys, sells, reduce_only, losing = numpy.fromiter(
+        itertools.chain.from_iterable(
+            (
+                trade.status is trading_enums.OrderStatus.CANCELED,
+                trade.status is trading_enums.OrderStatus.FILLED,
+                trade.side is trading_enums.TradeOrderSide.BUY,
+                trade.side is trading_enums.TradeOrderSide.SELL,
+                bool(trade.reduce_only),
+                trade.exchange_trade_type in _LOSING_ORDER_TYPES,
             )
-            for exchange_manager in exchange_managers
-        ])
+            for trade in trades
+        ),
+        dtype=bool,
+        count=len(trades) * 6
+    ).reshape(len(trades), 6).T
+    transactions = exchange_manager.exchange_personal_data.transactions_manager.transactions
+    pnl_values, pnl_times, closed_pnl = numpy.fromiter(
+        itertools.chain.from_iterable(
+            _get_transaction_columns(transaction)
+            for transaction in transactions.values()
+        ),
+        dtype=float,
+        count=len(transactions) * 3
+    ).reshape(len(transactions), 3).T
+    r_sq_end_balance, r_sq_max_balance = _get_exchange_coefficients_of_determination(
+        exchange_manager, pnl_values, pnl_times
+    )
+    return _ExchangeMetrics(
+        float(profitability),
+        float(profitability_percent),
+        len(trades) - int(numpy.count_nonzero(cancelled)),
+        int(numpy.count_nonzero(filled & buys)),
+        _get_exchange_win_rate(exchange_manager, filled, sells, reduce_only, losing, closed_pnl),
+        _get_exchange_draw_down(exchange_manager, pnl_values),
+        r_sq_end_balance,
+        r_sq_max_balance,
+    )
+
+
+_LOSING_ORDER_TYPES = (
+    trading_enums.TradeOrderType.STOP_LOSS,
+    trading_enums.TradeOrderType.STOP_LOSS_LIMIT,
+)
+
+
+def _get_transaction_columns(transaction):
+    # (pnl, time, closed pnl result: 1 for a win, -1 for a loss, 0 when not a closed pnl)
+    if hasattr(transaction, "quantity"):
+        pnl = transaction.quantity
+    elif hasattr(transaction, "realised_pnl"):
+        pnl = transaction.realised_pnl
+    else:
+        return numpy.nan, numpy.nan, 0
+    closed_pnl = 0
+    if isinstance(transaction, trading_personal_data.RealisedPnlTransaction) and transaction.is_closed_pnl():
+        closed_pnl = 1 if transaction.realised_pnl > 0 else -1
+    return float(pnl), transaction.creation_time, closed_pnl
+
+
+def _get_exchange_win_rate(exchange_manager, filled, sells, reduce_only, losing, closed_pnl) -> float:
+    if exchange_manager.is_future:
+        exits = filled & reduce_only
+        lost_count = numpy.count_nonzero(exits & losing)
+        won_count = numpy.count_nonzero(exits) - lost_count
+        total_exits = won_count + lost_count
+        if total_exits and total_exits <= numpy.count_nonzero(filled & ~reduce_only) and won_count:
+            return won_count / total_exits
+        # try fallback to transactions for trailing stops and multiple exits
+        won_count = numpy.count_nonzero(closed_pnl > 0)
+        lost_count = numpy.count_nonzero(closed_pnl < 0)
+    else:
+        exits = filled & sells
+        lost_count = numpy.count_nonzero(exits & losing)
+        won_count = numpy.count_nonzero(exits) - lost_count
+    total_count = won_count + lost_count
+    return won_count / total_count if total_count else 0
+
+
+def _get_exchange_draw_down(exchange_manager, pnl_values) -> float:
+    """
+    Draw down is the lowest portfolio value in % ever reached during a run
+    """
+    if not exchange_manager.is_future:
+        return 0
+    try:
+        portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+        value_currency = portfolio_manager.reference_market
+        draw_down_pair = exchange_manager.exchange_config.traded_symbol_pairs[0]
+        if exchange_manager.exchange_personal_data.positions_manager.get_symbol_position(
+            draw_down_pair,
+            trading_enums.PositionSide.BOTH
+        ).symbol_contract.is_inverse_contract():
+            value_currency = symbol_util.parse_symbol(draw_down_pair).base
+        if portfolio_manager.portfolio_value_holder.origin_portfolio is None:
+            return 0
+        origin_value = float(portfolio_manager.portfolio_value_holder.origin_portfolio.portfolio[value_currency].total)
+    except Exception as e:
+        commons_logging.get_logger(__name__).warning(f"Error when computing draw down: {e}")
+        return 0
+    # transactions without pnl interrupt the draw down computation
+    invalid_pnl_indexes = numpy.flatnonzero(numpy.isnan(pnl_values))
+    if len(invalid_pnl_indexes):
+        pnl_values = pnl_values[:invalid_pnl_indexes[0]]
+    portfolio_history = origin_value + numpy.cumsum(pnl_values)
+    highest_values = numpy.maximum.accumulate(numpy.concatenate(((origin_value, ), portfolio_history)))[1:]
+    # draw down can't be computed from a 0 highest portfolio value
+    zero_highest_indexes = numpy.flatnonzero(highest_values == 0)
+    if len(zero_highest_indexes):
+        portfolio_history = portfolio_history[:zero_highest_indexes[0]]
+        highest_values = highest_values[:zero_highest_indexes[0]]
+    if not len(portfolio_history):
+        return 0
+    return max(0, float(numpy.max(100 - portfolio_history / (highest_values / 100))))
+
+
+def _get_exchange_coefficients_of_determination(exchange_manager, pnl_values, pnl_times) -> tuple:
+    """
+    Proximity to the best case growth (exponential curve) of this run using end and highest balances,
+    None when the reference market is missing from the origin portfolio
+    """
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    if portfolio_manager is None or portfolio_manager.portfolio_value_holder.origin_portfolio is None:
+        return 0, 0
+    try:
+        start_balance = float(
+            portfolio_manager.portfolio_value_holder.origin_portfolio.portfolio[
+                portfolio_manager.reference_market
+            ].total
+        )
     except KeyError:
+        return None, None
+    valid_pnl = ~numpy.isnan(pnl_values)
+    pnl_values = pnl_values[valid_pnl]
+    pnl_times = pnl_times[valid_pnl]
+    if not len(pnl_values):
+        return 0, 0
+    pnl_history = numpy.cumsum(numpy.concatenate(((start_balance, ), pnl_values)))
+    end_balance = pnl_history[-1]
+    if start_balance > end_balance:
+        # if we end up with a negative balance we can't compute this
+        return 0, 0
+    return tuple(
+        _get_coefficient_of_determination_value(pnl_history, pnl_times[0], pnl_times[-1], start_balance, end_value)
+        for end_value in (end_balance, numpy.max(pnl_history))
+    )
+
+
+def _get_coefficient_of_determination_value(pnl_history, start_time, end_time, start_balance, end_value):
+    pw = 15
+    adj = numpy.exp(numpy.log(start_balance / end_value) / pw)
+    a = (start_time - end_time * adj) / (adj - 1)
+    b = start_balance / (start_time + a) ** pw
+    best_case = ((numpy.linspace(start_time, end_time, len(pnl_history)) + a) ** pw) * b
+    return round(numpy.corrcoef(best_case, pnl_history)[0, 1] ** 2, 3)
+
+
+def _get_coefficient_of_determination(exchanges_metrics, use_high_instead_of_end_balance):
+    values = [
+        metrics.r_sq_max_balance if use_high_instead_of_end_balance else metrics.r_sq_end_balance
+        for metrics in exchanges_metrics
+    ]
+    if any(value is None for value in values):
         return None
+    return numpy.average(values)
 
 
-def _get_markets_profitability(exchange_managers, time_frames):
-    markets_profitability = {}
-    min_tf = time_frame_manager.find_min_time_frame(time_frames)
-    for exchange_manager in exchange_managers:
-        for symbol in trading_api.get_trading_pairs(exchange_manager):
-            if symbol is markets_profitability:
-                continue
-            try:
-                markets_profitability[symbol] = \
-                    backtesting.IndependentBacktesting.get_market_delta(symbol, exchange_manager, min_tf)
-            except Exception:
-                pass
-    return markets_profitability
+def _update_markets_profitability(markets_profitability, exchange_manager, min_tf):
+    for symbol in trading_api.get_trading_pairs(exchange_manager):
+        if symbol in markets_profitability:
+            continue
+        try:
+            markets_profitability[symbol] = \
+                backtesting.IndependentBacktesting.get_market_delta(symbol, exchange_manager, min_tf)
+        except Exception:
+            pass
 
 
 def _get_portfolio(exchange_managers):
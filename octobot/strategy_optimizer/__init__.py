@@ -38,9 +38,21 @@ from octobot.strategy_optimizer.optimizer_settings import (
 from octobot.strategy_optimizer.scored_run_result import (
     ScoredRunResult,
 )
+from octobot.strategy_optimizer.scored_run_results import (
+    ScoredRunResults,
+)
 from octobot.strategy_optimizer.optimizer_constraint import (
     OptimizerConstraint,
 )
+from octobot.strategy_optimizer.run_results_cache import (
+    RunResultsCache,
+)
+from octobot.strategy_optimizer.runs_journal import (
+    RunsJournal,
+)
+from octobot.strategy_optimizer.run_results_index import (
+    RunResultsIndex,
+)
 from octobot.strategy_optimizer.strategy_design_optimizer import (
     StrategyDesignOptimizer,
 )
@@ -59,7 +71,11 @@ __all__ = [
     "OptimizerFilter",
     "OptimizerSettings",
     "ScoredRunResult",
+    "ScoredRunResults",
     "OptimizerConstraint",
+    "RunResultsCache",
+    "RunsJournal",
+    "RunResultsIndex",
     "StrategyDesignOptimizer",
     "StrategyTestSuite",
     "create_most_advanced_strategy_design_optimizer",
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import numpy
 
 
 class FitnessParameter:
@@ -34,10 +35,12 @@ class FitnessParameter:
         return raw_value * self._get_parameter_normalizer() * self.weight
     
     def _get_value_from_ratio(self, raw_value):
-        return (
-            raw_value * self._get_parameter_normalizer() if self.max_ratio_value is None
-            else (raw_value - self.min_ratio_value) / (self.max_ratio_value - self.min_ratio_value)
-        )
+        if self.max_ratio_value is None:
+            return raw_value * self._get_parameter_normalizer()
+        if self.max_ratio_value == self.min_ratio_value:
+            # every known value is the max value
+            return 1
+        return (raw_value - self.min_ratio_value) / (self.max_ratio_value - self.min_ratio_value)
 
     def _get_parameter_normalizer(self):
         return 0.01 if "%" in self.name else 1
@@ -51,6 +54,30 @@ class FitnessParameter:
         except KeyError:
             pass
 
+    def update_ratio_from_values(self, values):
+        # vectorized update_ratio: values is a float array where missing values are nan
+        present_values = values[~numpy.isnan(values)]
+        if present_values.size:
+            max_value = present_values.max()
+            min_value = present_values.min()
+            if self.max_ratio_value is None or max_value > self.max_ratio_value:
+                self.max_ratio_value = max_value.item()
+            if self.min_ratio_value is None or min_value < self.min_ratio_value:
+                self.min_ratio_value = min_value.item()
+
+    def get_normalized_values(self, raw_values):
+        # vectorized get_normalized_value
+        if self.is_ratio_from_max:
+            if self.max_ratio_value is None:
+                values_from_ratio = raw_values * self._get_parameter_normalizer()
+            elif self.max_ratio_value == self.min_ratio_value:
+                values_from_ratio = numpy.ones_like(raw_values)
+            else:
+                values_from_ratio = (raw_values - self.min_ratio_value) / \
+                    (self.max_ratio_value - self.min_ratio_value)
+            return values_from_ratio * self.weight
+        return raw_values * self._get_parameter_normalizer() * self.weight
+
     @classmethod
     def from_dict(cls, param_dict):
         return cls(
@@ -14,6 +14,9 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import numpy
+
+import octobot_commons.enums as commons_enums
 import octobot_commons.logical_operators as logical_operators
 
 
@@ -23,6 +26,14 @@ class OptimizerFilter:
     LEFT_OPERAND_VALUE_KEY = "left_operand_value"
     RIGHT_OPERAND_VALUE_KEY = "right_operand_value"
     OPERATOR_KEY = "operator"
+    VECTORIZED_OPERATORS = {
+        commons_enums.LogicalOperators.LOWER_THAN.value: numpy.less,
+        commons_enums.LogicalOperators.HIGHER_THAN.value: numpy.greater,
+        commons_enums.LogicalOperators.LOWER_OR_EQUAL_TO.value: numpy.less_equal,
+        commons_enums.LogicalOperators.HIGHER_OR_EQUAL_TO.value: numpy.greater_equal,
+        commons_enums.LogicalOperators.EQUAL_TO.value: numpy.equal,
+        commons_enums.LogicalOperators.DIFFERENT_FROM.value: numpy.not_equal,
+    }
 
     def __init__(self, left_operand_key, right_operand_key, left_operand_value, right_operand_value, operator):
         self.left_operand_key = left_operand_key
@@ -32,7 +43,8 @@ class OptimizerFilter:
         self.operator = operator
 
     def is_valid(self):
-        return self.left_operand_value and self.right_operand_value and self.operator
+        # 0 and False are valid operands
+        return self.left_operand_value is not None and self.right_operand_value is not None and self.operator
 
     def load_values(self, values: dict):
         succeeded = False
@@ -63,6 +75,50 @@ class OptimizerFilter:
             right_operand = str(self.right_operand_value)
         return logical_operators.evaluate_condition(left_operand, right_operand, self.operator)
 
+    def get_filtered_mask(self, get_column, rows_count):
+        """
+        Vectorized load_values + is_filtered: get_column(key) returns the (float values, present mask) arrays
+        of the given result key or None when values are not numbers
+        :return: the mask of the filtered rows or None when operands are not numbers
+        """
+        left_operand = self._get_vectorized_operand(self.left_operand_key, self.left_operand_value,
+                                                    get_column, rows_count)
+        right_operand = self._get_vectorized_operand(self.right_operand_key, self.right_operand_value,
+                                                     get_column, rows_count)
+        if left_operand is None or right_operand is None:
+            return None
+        left_values, left_present, is_left_read = left_operand
+        right_values, right_present, is_right_read = right_operand
+        if not self.operator:
+            return numpy.zeros(rows_count, dtype=bool)
+        if self.operator not in self.VECTORIZED_OPERATORS:
+            return None
+        with numpy.errstate(invalid="ignore"):
+            filtered = self.VECTORIZED_OPERATORS[self.operator](left_values, right_values)
+        filtered &= left_present & right_present
+        if self.right_operand_key is not None:
+            # load_values would raise KeyError: rows without any read value are not filtered
+            filtered &= is_right_read | is_left_read
+        return filtered
+
+    @staticmethod
+    def _get_vectorized_operand(key, default_value, get_column, rows_count):
+        if default_value is None:
+            default = numpy.full(rows_count, numpy.nan)
+        else:
+            try:
+                default = numpy.full(rows_count, float(decimal.Decimal(default_value)))
+            except (decimal.InvalidOperation, TypeError, ValueError):
+                return None
+        is_default_valid = numpy.full(rows_count, default_value is not None)
+        if key is None:
+            return default, is_default_valid, numpy.zeros(rows_count, dtype=bool)
+        column = get_column(key)
+        if column is None:
+            return None
+        values, is_read = column
+        return numpy.where(is_read, values, default), is_read | is_default_valid, is_read
+
     @classmethod
     def from_dict(cls, param_dict):
         return cls(
@@ -31,6 +31,8 @@ class OptimizerSettings:
         self.optimizer_config = settings_dict.get(enums.OptimizerConfig.OPTIMIZER_CONFIG.value, None)
         self.randomly_chose_runs = settings_dict.get(enums.OptimizerConfig.RANDOMLY_CHOSE_RUNS.value,
                                                      constants.OPTIMIZER_DEFAULT_RANDOMLY_CHOSE_RUNS)
+        # seed of random runs selection, use None for a different selection each time
+        self.random_seed = settings_dict.get(enums.OptimizerConfig.RANDOM_SEED.value, None)
         self.data_files = settings_dict.get(enums.OptimizerConfig.DATA_FILES.value)
         self.start_timestamp = settings_dict.get(enums.OptimizerConfig.START_TIMESTAMP.value, None)
         self.end_timestamp = settings_dict.get(enums.OptimizerConfig.END_TIMESTAMP.value, None)
@@ -51,15 +53,18 @@ class OptimizerSettings:
         # update run database at the end of each period
         self.db_update_period = int(settings_dict.get(enums.OptimizerConfig.DB_UPDATE_PERIOD.value,
                                                       constants.OPTIMIZER_DEFAULT_DB_UPDATE_PERIOD))
+        # reuse results of identical runs from previous optimizer sessions instead of running them again
+        self.use_run_results_cache = settings_dict.get(enums.OptimizerConfig.USE_RUN_RESULTS_CACHE.value,
+                                                       constants.OPTIMIZER_DEFAULT_USE_RUN_RESULTS_CACHE)
         # AI / genetic
-        self.max_optimizer_runs = settings_dict.get(enums.OptimizerConfig.MAX_OPTIMIZER_RUNS.value,
-                                                    constants.OPTIMIZER_DEFAULT_MAX_OPTIMIZER_RUNS)
-        self.generations_count = settings_dict.get(enums.OptimizerConfig.DEFAULT_GENERATIONS_COUNT.value,
-                                                   constants.OPTIMIZER_DEFAULT_GENERATIONS_COUNT)
-        self.initial_generation_count = settings_dict.get(enums.OptimizerConfig.INITIAL_GENERATION_COUNT.value,
-                                                          constants.OPTIMIZER_DEFAULT_INITIAL_GENERATION_COUNT)
-        self.run_per_generation = settings_dict.get(enums.OptimizerConfig.DEFAULT_RUN_PER_GENERATION.value,
-                                                    constants.OPTIMIZER_DEFAULT_RUN_PER_GENERATION)
+        self.max_optimizer_runs = int(settings_dict.get(enums.OptimizerConfig.MAX_OPTIMIZER_RUNS.value,
+                                                        constants.OPTIMIZER_DEFAULT_MAX_OPTIMIZER_RUNS))
+        self.generations_count = int(settings_dict.get(enums.OptimizerConfig.DEFAULT_GENERATIONS_COUNT.value,
+                                                       constants.OPTIMIZER_DEFAULT_GENERATIONS_COUNT))
+        self.initial_generation_count = int(settings_dict.get(enums.OptimizerConfig.INITIAL_GENERATION_COUNT.value,
+                                                              constants.OPTIMIZER_DEFAULT_INITIAL_GENERATION_COUNT))
+        self.run_per_generation = int(settings_dict.get(enums.OptimizerConfig.DEFAULT_RUN_PER_GENERATION.value,
+                                                        constants.OPTIMIZER_DEFAULT_RUN_PER_GENERATION))
         self.fitness_parameters = self.parse_fitness_parameters(
             settings_dict.get(enums.OptimizerConfig.DEFAULT_SCORING_PARAMETERS.value,
                               self.get_default_fitness_parameters())
@@ -84,9 +89,18 @@ class OptimizerSettings:
         self.max_mutation_number_multiplier = decimal.Decimal(settings_dict.get(
             enums.OptimizerConfig.DEFAULT_MAX_MUTATION_NUMBER_MULTIPLIER.value,
             constants.OPTIMIZER_DEFAULT_MAX_MUTATION_NUMBER_MULTIPLIER))
-        self.target_fitness_score = settings_dict.get(enums.OptimizerConfig.TARGET_FITNESS_SCORE.value)
+        target_fitness_score = settings_dict.get(enums.OptimizerConfig.TARGET_FITNESS_SCORE.value)
+        self.target_fitness_score = target_fitness_score if target_fitness_score is None \
+            else float(target_fitness_score)
         self.stay_within_boundaries = settings_dict.get(enums.OptimizerConfig.STAY_WITHIN_BOUNDARIES.value,
                                                         False)
+        # successive halving
+        # only the best 1/halving_factor runs of a rung are promoted to the next (halving_factor x longer) window
+        self.halving_factor = int(settings_dict.get(enums.OptimizerConfig.HALVING_FACTOR.value,
+                                                    constants.OPTIMIZER_DEFAULT_HALVING_FACTOR))
+        # the last rung is using the full backtesting window
+        self.halving_rungs_count = int(settings_dict.get(enums.OptimizerConfig.HALVING_RUNGS_COUNT.value,
+                                                         constants.OPTIMIZER_DEFAULT_HALVING_RUNGS_COUNT))
 
     def get_constraint(self, constraint_key):
         if constraint_key in self.constraints_by_key:
@@ -121,6 +135,7 @@ class OptimizerSettings:
         ]
 
     def get_default_optimizer_filters(self):
+        # exclude runs without trades, with a negative R² or with losses from rankings
         return [
             {
                 optimizer_filter.OptimizerFilter.LEFT_OPERAND_KEY_KEY: commons_enums.BacktestingMetadata.TRADES.value,
@@ -0,0 +1,190 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import hashlib
+import json
+import os
+import time
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.databases as databases
+import octobot_backtesting.constants as backtesting_constants
+import octobot_tentacles_manager.api as tentacles_manager_api
+
+import octobot.constants as constants
+
+
+class RunResultsCache:
+    """
+    Content-addressed store of optimizer run results: a run result is reused when the run user inputs,
+    the backtesting data files content, the backtesting time window, the trading config and the tentacles
+    versions and configurations are identical.
+    Each result is stored in its own file: processes read and write results without sharing any lock.
+    """
+    CACHE_FOLDER_NAME = "optimizer_run_results_cache"
+    CACHE_FILE_EXT = ".json"
+    TEMP_FILE_EXT = ".tmp"
+    # first cache key characters are used as sub folder name to avoid too large folders
+    SHARD_KEY_LENGTH = 2
+    RUN_METADATA = "run_metadata"
+    RUN_FOLDER = "run_folder"
+    DATA_FILE_READ_CHUNK_SIZE = 1024 * 1024
+    # run specific config values, not relevant to identify a run result
+    IGNORED_CONFIG_KEYS = (
+        commons_constants.CONFIG_OPTIMIZER_ID,
+        commons_constants.CONFIG_BACKTESTING_ID,
+    )
+
+    def __init__(self, trading_mode, data_file_path=backtesting_constants.BACKTESTING_FILE_PATH,
+                 max_entries=constants.OPTIMIZER_RUN_RESULTS_CACHE_MAX_ENTRIES,
+                 max_age=constants.OPTIMIZER_RUN_RESULTS_CACHE_MAX_AGE):
+        self.run_dbs_identifier = databases.RunDatabasesIdentifier(trading_mode)
+        self.data_file_path = data_file_path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._stored_count = 0
+        self._context_hashes = {}
+        self._data_file_hashes = {}
+
+    def get_cache_folder(self):
+        return os.path.join(self.run_dbs_identifier.base_path, self.CACHE_FOLDER_NAME)
+
+    def get_cache_file_path(self, cache_key):
+        return os.path.join(
+            self.get_cache_folder(), cache_key[:self.SHARD_KEY_LENGTH], f"{cache_key}{self.CACHE_FILE_EXT}"
+        )
+
+    def get_cache_key(self, run_hash, config, tentacles_setup_config, data_files, start_timestamp, end_timestamp):
+        context_key = (tuple(data_files), start_timestamp, end_timestamp)
+        if context_key not in self._context_hashes:
+            # identical for every run of an optimizer session: only compute it once
+            self._context_hashes[context_key] = self._get_context_hash(
+                config, tentacles_setup_config, data_files, start_timestamp, end_timestamp
+            )
+        return hashlib.sha256(f"{run_hash}{self._context_hashes[context_key]}".encode()).hexdigest()
+
+    async def get(self, cache_key):
+        cache_file_path = self.get_cache_file_path(cache_key)
+        try:
+            if self._is_expired(os.path.getmtime(cache_file_path), time.time()):
+                cached_result = None
+            else:
+                with open(cache_file_path) as cache_file:
+                    cached_result = json.load(cache_file)
+                # keep recently used results when evicting entries
+                os.utime(cache_file_path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # JSONDecodeError: invalid cache file
+            cached_result = None
+        if cached_result is not None:
+            self.hits += 1
+            return cached_result
+        self.misses += 1
+        return None
+
+    async def store(self, cache_key, run_metadata, run_folder):
+        cache_file_path = self.get_cache_file_path(cache_key)
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        # write in a process specific file and rename it: readers never see a partially written result
+        temp_file_path = f"{cache_file_path}.{os.getpid()}{self.TEMP_FILE_EXT}"
+        with open(temp_file_path, "w") as cache_file:
+            json.dump({self.RUN_METADATA: run_metadata, self.RUN_FOLDER: run_folder}, cache_file)
+        os.replace(temp_file_path, cache_file_path)
+        self._stored_count += 1
+        # each process checks the cache size from time to time
+        if self._stored_count % constants.OPTIMIZER_RUN_RESULTS_CACHE_EVICTION_PERIOD == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Removes expired entries and the least recently used ones when the cache is larger than max_entries
+        :return: the number of removed entries
+        """
+        now = time.time()
+        entries = []
+        expired_paths = []
+        for cache_file_path, last_used_time in self._get_cache_files():
+            if self._is_expired(last_used_time, now):
+                expired_paths.append(cache_file_path)
+            else:
+                entries.append((last_used_time, cache_file_path))
+        if self.max_entries is not None and len(entries) > self.max_entries:
+            entries.sort()
+            expired_paths += [cache_file_path for _, cache_file_path in entries[:len(entries) - self.max_entries]]
+        for cache_file_path in expired_paths:
+            try:
+                os.remove(cache_file_path)
+            except FileNotFoundError:
+                # already removed by another process
+                pass
+        return len(expired_paths)
+
+    def _get_cache_files(self):
+        try:
+            shards = list(os.scandir(self.get_cache_folder()))
+        except FileNotFoundError:
+            return
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for cache_file in os.scandir(shard.path):
+                try:
+                    yield cache_file.path, cache_file.stat().st_mtime
+                except FileNotFoundError:
+                    # removed by another process
+                    pass
+
+    def _is_expired(self, last_used_time, now):
+        return self.max_age is not None and now - last_used_time > self.max_age
+
+    def get_stats_str(self):
+        return f"{self.hits} cached run results reused, {self.misses} runs executed"
+
+    def _get_context_hash(self, config, tentacles_setup_config, data_files, start_timestamp, end_timestamp):
+        activated_tentacles = sorted(tentacles_manager_api.get_activated_tentacles(tentacles_setup_config))
+        tentacles_details = {}
+        for tentacle in activated_tentacles:
+            tentacle_class = tentacles_manager_api.get_tentacle_class_from_string(tentacle)
+            tentacles_details[tentacle] = {
+                "version": tentacles_manager_api.get_tentacle_version(tentacle_class),
+                "config": tentacles_manager_api.get_tentacle_config(tentacles_setup_config, tentacle_class),
+            }
+        return hashlib.sha256(json.dumps(
+            {
+                "data_files": [self._get_data_file_hash(data_file) for data_file in data_files],
+                "start_timestamp": start_timestamp,
+                "end_timestamp": end_timestamp,
+                "tentacles": tentacles_details,
+                "config": {
+                    key: value
+                    for key, value in config.items()
+                    if key not in self.IGNORED_CONFIG_KEYS
+                },
+            },
+            sort_keys=True,
+            default=str
+        ).encode()).hexdigest()
+
+    def _get_data_file_hash(self, data_file):
+        data_file_path = data_file if os.path.isfile(data_file) else os.path.join(self.data_file_path, data_file)
+        if data_file_path not in self._data_file_hashes:
+            file_hash = hashlib.sha256()
+            with open(data_file_path, "rb") as data_file_content:
+                while chunk := data_file_content.read(self.DATA_FILE_READ_CHUNK_SIZE):
+                    file_hash.update(chunk)
+            self._data_file_hashes[data_file_path] = file_hash.hexdigest()
+        return self._data_file_hashes[data_file_path]
@@ -0,0 +1,70 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+
+import octobot_commons.enums as commons_enums
+
+
+class RunResultsIndex:
+    """
+    Hash index of optimizer run results by user input values: the most recent result is kept for each
+    combination of values
+    """
+    def __init__(self):
+        self.full_results = []
+        self._results_by_signature = {}
+
+    def update(self, all_run_results):
+        """
+        Index results that are not indexed yet: run results are appended to their database
+        """
+        if len(all_run_results) < len(self.full_results):
+            # results database has been reset
+            self.full_results = []
+            self._results_by_signature = {}
+        first_new_result_index = len(self.full_results)
+        self.full_results.extend(all_run_results[first_new_result_index:])
+        for signature, results_by_fingerprint in self._results_by_signature.items():
+            self._index_results(signature, results_by_fingerprint, first_new_result_index)
+
+    def get_most_recent(self, signature, values):
+        """
+        :param signature: tuple of the (tentacle name, user input name) to look for
+        :param values: tuple of the user input values associated to the signature
+        :return: the (index, full result) of the most recent matching result or None if no result is matching
+        """
+        if signature not in self._results_by_signature:
+            # all results of an optimizer usually share the same signature: index them once
+            self._results_by_signature[signature] = {}
+            self._index_results(signature, self._results_by_signature[signature], 0)
+        return self._results_by_signature[signature].get(self._get_fingerprint(values))
+
+    def _index_results(self, signature, results_by_fingerprint, start_index):
+        for index in range(start_index, len(self.full_results)):
+            full_result = self.full_results[index]
+            user_inputs = full_result[commons_enums.BacktestingMetadata.USER_INPUTS.value]
+            try:
+                values = tuple(user_inputs[tentacle][user_input] for tentacle, user_input in signature)
+            except (KeyError, TypeError):
+                continue
+            results_by_fingerprint[self._get_fingerprint(values)] = (index, full_result)
+
+    @staticmethod
+    def _get_fingerprint(values):
+        return tuple(
+            json.dumps(value, sort_keys=True, default=str) if isinstance(value, (list, dict)) else value
+            for value in values
+        )
@@ -0,0 +1,58 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+
+
+class RunsJournal:
+    """
+    Append-only log of the completed run hashes of an optimizer run schedule
+    """
+    JOURNAL_FILE = "completed_runs_journal.txt"
+    # sha256 hex digest
+    RUN_HASH_LENGTH = 64
+    ENTRY_SIZE = RUN_HASH_LENGTH + len(os.linesep.encode())
+
+    def __init__(self, folder):
+        self.journal_path = os.path.join(folder, self.JOURNAL_FILE)
+
+    def append(self, run_hashes):
+        os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+        with open(self.journal_path, "a") as journal:
+            journal.writelines(f"{run_hash}\n" for run_hash in run_hashes)
+
+    def read(self) -> set:
+        try:
+            with open(self.journal_path) as journal:
+                # ignore incomplete entries that might be being written
+                return set(
+                    entry
+                    for entry in journal.read().splitlines()
+                    if len(entry) == self.RUN_HASH_LENGTH
+                )
+        except FileNotFoundError:
+            return set()
+
+    def get_entries_count(self) -> int:
+        try:
+            return os.path.getsize(self.journal_path) // self.ENTRY_SIZE
+        except FileNotFoundError:
+            return 0
+
+    def clear(self):
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
@@ -25,6 +25,7 @@ class ScoredRunResult:
 
     def compute_score(self, relevant_scoring_parameters):
         self.score = 0
+        self.total_weight = 0
         try:
             self.score = sum([
                 self._compute_score(scoring_parameter)
@@ -33,6 +34,20 @@ class ScoredRunResult:
         except ZeroDivisionError:
             self.score = 0
 
+    def set_score(self, score, relevant_scoring_parameters):
+        # use a score computed by ScoredRunResults
+        self.score = score
+        self.values = {
+            scoring_parameter.name: self.full_result[scoring_parameter.name]
+            for scoring_parameter in relevant_scoring_parameters
+            if scoring_parameter.name in self.full_result
+        }
+        self.total_weight = sum(
+            scoring_parameter.weight
+            for scoring_parameter in relevant_scoring_parameters
+            if scoring_parameter.name in self.full_result
+        )
+
     def _compute_score(self, fitness_parameter):
         try:
             self.values[fitness_parameter.name] = self.full_result[fitness_parameter.name]
@@ -0,0 +1,91 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import numpy
+
+
+class ScoredRunResults:
+    """
+    Columnar version of ScoredRunResult: scores, filters and ranks every run result at once
+    """
+    def __init__(self, full_results):
+        self.full_results = full_results
+        self.scores = numpy.zeros(len(full_results))
+        self._columns = {}
+
+    def get_column(self, key):
+        """
+        :return: the (float values, present mask) arrays of the given result key or None when values are not numbers
+        """
+        if key not in self._columns:
+            self._columns[key] = self._load_column(key)
+        return self._columns[key]
+
+    def compute_scores(self, fitness_parameters):
+        scores_sum = numpy.zeros(len(self.full_results))
+        total_weights = numpy.zeros(len(self.full_results))
+        columns = [self.get_column(fitness_parameter.name) for fitness_parameter in fitness_parameters]
+        for fitness_parameter, column in zip(fitness_parameters, columns):
+            if column is not None:
+                fitness_parameter.update_ratio_from_values(column[0])
+        for fitness_parameter, column in zip(fitness_parameters, columns):
+            if column is None:
+                continue
+            values, present = column
+            scores_sum += numpy.where(present, fitness_parameter.get_normalized_values(values), 0)
+            total_weights += numpy.where(present, fitness_parameter.weight, 0)
+        self.scores = numpy.divide(scores_sum, total_weights,
+                                   out=numpy.zeros(len(self.full_results)), where=total_weights != 0)
+        return self.scores
+
+    def get_excluded_mask(self, exclude_filters):
+        excluded = numpy.zeros(len(self.full_results), dtype=bool)
+        for exclude_filter in exclude_filters:
+            filtered = exclude_filter.get_filtered_mask(self.get_column, len(self.full_results))
+            if filtered is None:
+                # operands are not numbers: check results one by one
+                filtered = numpy.fromiter(
+                    (self._is_filtered(exclude_filter, full_result) for full_result in self.full_results),
+                    dtype=bool, count=len(self.full_results)
+                )
+            excluded |= filtered
+        return excluded
+
+    def rank(self, fitness_parameters, exclude_filters):
+        """
+        :return: the indexes of the results that are not excluded, sorted from the highest score
+        """
+        self.compute_scores(fitness_parameters)
+        eligible_indexes = numpy.flatnonzero(~self.get_excluded_mask(exclude_filters))
+        return eligible_indexes[numpy.argsort(-self.scores[eligible_indexes], kind="stable")]
+
+    def _load_column(self, key):
+        raw_values = [full_result.get(key) for full_result in self.full_results]
+        try:
+            values = numpy.array(raw_values, dtype=float)
+        except (TypeError, ValueError):
+            return None
+        return values, ~numpy.isnan(values)
+
+    @staticmethod
+    def _is_filtered(exclude_filter, full_result):
+        # use a copy as loaded values are stored in the filter
+        result_filter = copy.copy(exclude_filter)
+        try:
+            result_filter.load_values(full_result)
+        except KeyError:
+            return False
+        return result_filter.is_filtered()
@@ -30,10 +30,19 @@ import numpy
 import logging
 import ctypes
 import random
+import math
+import functools
 
 import octobot.strategy_optimizer.optimizer_settings as optimizer_settings_import
 import octobot.strategy_optimizer.optimizer_filter as optimizer_filter
+import octobot.strategy_optimizer.fitness_parameter as fitness_parameter_import
+import octobot.strategy_optimizer.scored_run_result as scored_run_result_import
+import octobot.strategy_optimizer.scored_run_results as scored_run_results_import
+import octobot.strategy_optimizer.run_results_cache as run_results_cache_import
+import octobot.strategy_optimizer.runs_journal as runs_journal_import
+import octobot.strategy_optimizer.run_results_index as run_results_index_import
 import octobot.enums as enums
+import octobot.backtesting as octobot_backtesting
 import octobot_commons.optimization_campaign as optimization_campaign
 import octobot_commons.constants as commons_constants
 import octobot_commons.enums as commons_enums
@@ -42,9 +51,10 @@ import octobot_commons.logging as commons_logging
 import octobot_commons.multiprocessing_util as multiprocessing_util
 import octobot_commons.databases as databases
 import octobot_commons.dict_util as dict_util
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.enums as backtesting_enums
 import octobot_backtesting.errors as backtesting_errors
 import octobot_tentacles_manager.api as tentacles_manager_api
-import octobot_tentacles_manager.constants as tentacles_manager_constants
 import octobot_services.api as services_api
 import octobot_services.enums as services_enums
 
@@ -66,6 +76,7 @@ class StrategyDesignOptimizer:
     SHARED_KEEP_RUNNING_KEY = "keep_running"
     SHARED_RUN_TIMES_KEY = "run_times"
     SHARED_RUNS_QUEUES_KEY = "runs_queues"
+    SHARED_NEXT_BACKTESTING_IDS_KEY = "next_backtesting_ids"
     START_QUEUE_KEY = "start_queue"
     DONE_QUEUE_KEY = "done_queue"
 
@@ -90,6 +101,19 @@ class StrategyDesignOptimizer:
     LAST_CREATED_QUEUE = f"last_created_queue{commons_constants.CONFIG_FILE_EXT}"
     LAST_CREATED_QUEUE_CONFIG = f"last_created_queue_config{commons_constants.CONFIG_FILE_EXT}"
 
+    # genetic mode: share of the best ranked runs used as parents of the next generation
+    GENETIC_SELECTED_PARENTS_RATIO = 0.25
+    GENETIC_MAX_ATTEMPTS_PER_RUN = 20
+    # random runs are picked by index when the runs space is larger than this ratio x queue_size
+    RUN_INDEX_SAMPLING_MIN_SPACE_RATIO = 10
+    RUN_INDEX_SAMPLING_MAX_ATTEMPTS_PER_RUN = 20
+    # backtesting ids are reserved by blocks to avoid synchronizing processes at each run
+    BACKTESTING_IDS_BLOCK_SIZE = 10
+    # completed runs are removed from the run schedule database once this number of runs are journaled
+    RUNS_JOURNAL_COMPACTION_SIZE = 1000
+    # max number of merged runs tentacles configs kept in memory
+    TENTACLES_CONFIGS_CACHE_MAX_SIZE = 1000
+
     def __init__(self, trading_mode, config, tentacles_setup_config, optimizer_settings=None):
         self.logger = commons_logging.get_logger(self.__class__.__name__)
         self.config = config
@@ -112,6 +136,16 @@ class StrategyDesignOptimizer:
         self.process_pool_handle = None
         self.average_run_time = 0
         self.first_iteration_time = 0
+        # runs of the next genetic generations
+        self.pending_runs_count = 0
+        self.run_results_cache = None
+        # parsed backtesting data, kept in memory for every run of an optimizer process
+        self.backtesting_data = None
+        self._backtesting_ids_by_optimizer_id = {}
+        # runs tentacles configs are given to backtestings in memory instead of being written in run folders
+        self._base_tentacles_configs = {}
+        self._tentacles_configs_by_key = {}
+        self._run_results_indexes = {}
 
     async def initialize(self, is_resuming):
         if not is_resuming:
@@ -160,18 +194,7 @@ class StrategyDesignOptimizer:
                         run_queues_by_optimizer_id
                     )
                 finally:
-                    # properly empty and close queues to avoid underlying thread issues
-                    for optimizer_id, run_queues in run_queues_by_optimizer_id.items():
-                        try:
-                            await self._update_runs_from_done_queue(run_queues, optimizer_id)
-                        except Exception as e:
-                            self.logger.exception(e, True, f"Error on final db queue update: {e}")
-                        for run_queue in run_queues.values():
-                            # empty queues
-                            while not run_queue.empty():
-                                run_queue.get()
-                            run_queue.close()
-                            run_queue.cancel_join_thread()
+                    await self._close_run_queues(run_queues_by_optimizer_id)
         except Exception as e:
             self.logger.exception(e, True, f"Error when running optimizer processes: {e}")
             success = False
@@ -184,27 +207,43 @@ class StrategyDesignOptimizer:
         self.logger.info(f"Optimizer runs complete in {time.time() - global_t0} seconds.")
         return success
 
+    async def _close_run_queues(self, run_queues_by_optimizer_id):
+        # properly empty and close queues to avoid underlying thread issues
+        for optimizer_id, run_queues in run_queues_by_optimizer_id.items():
+            try:
+                await self._update_runs_from_done_queue(run_queues, optimizer_id, compact=True)
+            except Exception as e:
+                self.logger.exception(e, True, f"Error on final db queue update: {e}")
+            for run_queue in run_queues.values():
+                # empty queues
+                while not run_queue.empty():
+                    run_queue.get()
+                run_queue.close()
+                run_queue.cancel_join_thread()
+
     async def _run_multi_processed_optimizer(self, optimizer_settings,
                                              lock, shared_keep_running, shared_run_time,
                                              run_queues_by_optimizer_id):
+        shared_elements = {
+            self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
+            self.SHARED_RUN_TIMES_KEY: shared_run_time,
+            self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
+            self.SHARED_NEXT_BACKTESTING_IDS_KEY: {
+                optimizer_id: multiprocessing.Value(ctypes.c_int,
+                                                    await self._get_first_available_backtesting_id(optimizer_id))
+                for optimizer_id in run_queues_by_optimizer_id
+            },
+        }
         with multiprocessing_util.registered_lock_and_shared_elements(
                 commons_enums.MultiprocessingLocks.DBLock.value,
                 lock,
-                {
-                    self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
-                    self.SHARED_RUN_TIMES_KEY: shared_run_time,
-                    self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
-                }), \
+                shared_elements), \
                 concurrent.futures.ProcessPoolExecutor(
                     max_workers=self.active_processes_count,
                     initializer=multiprocessing_util.register_lock_and_shared_elements,
                     initargs=(commons_enums.MultiprocessingLocks.DBLock.value,
                               lock,
-                              {
-                                  self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
-                                  self.SHARED_RUN_TIMES_KEY: shared_run_time,
-                                  self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
-                              })) as pool:
+                              shared_elements)) as pool:
             coros = []
             self.logger.info(f"Dispatching optimizer backtesting runs into {self.active_processes_count} "
                              f"parallel processes (based on the current computer physical processors).")
@@ -266,6 +305,8 @@ class StrategyDesignOptimizer:
                                          end_timestamp=None):
         # need to load tentacles when in new process
         tentacles_manager_api.reload_tentacle_info()
+        if self.optimizer_settings.use_run_results_cache:
+            self.run_results_cache = run_results_cache_import.RunResultsCache(self.trading_mode)
         run_queues = optimizer_id = None
         try:
             for optimizer_id, run_queues in run_queues_by_optimizer_id.items():
@@ -278,6 +319,10 @@ class StrategyDesignOptimizer:
                 # stopped run: update queue
                 await self._update_runs_from_done_queue(run_queues, optimizer_id)
             raise
+        finally:
+            if self.run_results_cache is not None:
+                self.logger.info(f"Run results cache: {self.run_results_cache.get_stats_str()}")
+            await self._stop_backtesting_data()
 
     async def _read_optimizer_runs_details_and_hashes(self, optimizer_id):
         async with databases.DBReader.database(self.run_dbs_identifier.get_optimizer_runs_schedule_identifier()) \
@@ -327,37 +372,66 @@ class StrategyDesignOptimizer:
         except Exception as e:
             self.logger.exception(e, True, f"Error while running iteration: {e}")
 
-    async def _update_runs_from_done_queue(self, run_queues, optimizer_id):
+    async def _update_runs_from_done_queue(self, run_queues, optimizer_id, compact=False):
         completed_run_hashes = set()
         while not run_queues[self.DONE_QUEUE_KEY].empty():
             completed_run_hashes.add(run_queues[self.DONE_QUEUE_KEY].get(timeout=0.1))
-        if not completed_run_hashes:
+        runs_journal = self._get_runs_journal(self.trading_mode, self.optimization_campaign_name, optimizer_id)
+        if completed_run_hashes:
+            # only append new completed runs, the run schedule database is updated on compaction
+            runs_journal.append(completed_run_hashes)
+        if compact or runs_journal.get_entries_count() >= self.RUNS_JOURNAL_COMPACTION_SIZE:
+            await self._compact_runs_journal(optimizer_id, runs_journal)
+
+    async def _compact_runs_journal(self, optimizer_id, runs_journal):
+        if not runs_journal.get_entries_count():
             return
         async with databases.DBWriterReader.database(
                 self.run_dbs_identifier.get_optimizer_runs_schedule_identifier(), with_lock=True) \
                 as writer_reader:
+            # journaled runs are filtered out when reading run data
             run_data = await self._get_run_data_from_db(optimizer_id, writer_reader)
-            if not run_data:
-                # db already empty, nothing to do
-                return
-            updated_queue = run_data[0]
-            runs = [run_details
-                    for run_details in updated_queue[self.CONFIG_RUNS].values()
-                    if self.get_run_hash(run_details) not in completed_run_hashes]
-            updated_queue[self.CONFIG_RUNS] = {
-                index: run
-                for index, run in enumerate(runs)
-            }
-            query = await writer_reader.search()
-            if runs and runs[0]:
-                await writer_reader.update(self.RUN_SCHEDULE_TABLE, updated_queue,
-                                           query.id == updated_queue["id"])
+            if run_data:
+                updated_queue = run_data[0]
+                query = await writer_reader.search()
+                if updated_queue[self.CONFIG_RUNS]:
+                    await writer_reader.update(self.RUN_SCHEDULE_TABLE, updated_queue,
+                                               query.id == updated_queue["id"])
+                else:
+                    await writer_reader.delete(self.RUN_SCHEDULE_TABLE, query.id == updated_queue["id"])
+        runs_journal.clear()
 
     async def drop_optimizer_run_from_queue(self, optimizer_id):
         async with databases.DBWriter.database(
                 self.run_dbs_identifier.get_optimizer_runs_schedule_identifier(), with_lock=True) as writer:
             query = await writer.search()
             await writer.delete(self.RUN_SCHEDULE_TABLE, query.id == optimizer_id)
+        self._get_runs_journal(self.trading_mode, self.optimization_campaign_name, optimizer_id).clear()
+
+    @staticmethod
+    def _get_runs_journal(trading_mode, campaign_name, optimizer_id):
+        return runs_journal_import.RunsJournal(
+            databases.RunDatabasesIdentifier(
+                trading_mode, campaign_name, optimizer_id=optimizer_id
+            ).get_backtesting_run_folder()
+        )
+
+    @classmethod
+    def _remove_journaled_runs(cls, trading_mode, campaign_name, runs_schedules):
+        for runs_schedule in runs_schedules:
+            completed_run_hashes = cls._get_runs_journal(
+                trading_mode, campaign_name, runs_schedule[cls.CONFIG_ID]
+            ).read()
+            if completed_run_hashes:
+                runs_schedule[cls.CONFIG_RUNS] = {
+                    index: run
+                    for index, run in enumerate(
+                        run_details
+                        for run_details in runs_schedule[cls.CONFIG_RUNS].values()
+                        if cls.get_run_hash(run_details) not in completed_run_hashes
+                    )
+                }
+        return runs_schedules
 
     def _should_keep_running(self):
         try:
@@ -418,6 +492,7 @@ class StrategyDesignOptimizer:
         else:
             remaining_runs = await self._get_remaining_runs_count_from_multi_process_queue(
                 self.optimizer_settings.optimizer_id)
+        remaining_runs += self.pending_runs_count
         if self.is_computing and remaining_runs == 0:
             remaining_runs = 1
         done_runs = self.total_nb_runs - remaining_runs
@@ -443,7 +518,10 @@ class StrategyDesignOptimizer:
         if optimizer_id is None:
             raise RuntimeError("No optimizer id")
         query = await reader.search()
-        return await reader.select(self.RUN_SCHEDULE_TABLE, query.id == optimizer_id)
+        return self._remove_journaled_runs(
+            self.trading_mode, self.optimization_campaign_name,
+            await reader.select(self.RUN_SCHEDULE_TABLE, query.id == optimizer_id)
+        )
 
     async def get_queued_optimizer_ids(self):
         return [
@@ -454,6 +532,10 @@ class StrategyDesignOptimizer:
     def _get_optimization_func(self, optimizer_settings: optimizer_settings_import.OptimizerSettings):
         if optimizer_settings.optimizer_mode == enums.OptimizerModes.NORMAL.value:
             return self.multi_processed_optimize
+        if optimizer_settings.optimizer_mode == enums.OptimizerModes.GENETIC.value:
+            return self.genetic_optimize
+        if optimizer_settings.optimizer_mode == enums.OptimizerModes.SUCCESSIVE_HALVING.value:
+            return self.successive_halving_optimize
         return None
 
     async def resume(self, optimizer_settings: optimizer_settings_import.OptimizerSettings):
@@ -463,31 +545,398 @@ class StrategyDesignOptimizer:
         else:
             raise NotImplementedError(f"Unknown optimizer mode: {optimizer_settings.optimizer_mode}")
 
-    def _get_from_run_results(self, run_data_elements, all_run_results):
-        if all_run_results:
-            yielded_count = 1
-            for run_data_from_runs in reversed(all_run_results):
-                for to_find_run_data in run_data_elements.values():
-                    if self._is_using_these_user_inputs(
-                            run_data_from_runs,
-                            to_find_run_data
-                    ):
-                        yield to_find_run_data, run_data_from_runs
-                        if yielded_count == len(run_data_elements):
-                            return
-                        yielded_count += 1
-
-    def _is_using_these_user_inputs(self, full_run_data, to_find_run_data):
-        full_run_data_user_inputs = full_run_data[commons_enums.BacktestingMetadata.USER_INPUTS.value]
-        for user_input_data in to_find_run_data:
-            try:
-                # todo handle user input with object config
-                if full_run_data_user_inputs[user_input_data[self.CONFIG_TENTACLE][0]] \
-                        [user_input_data[self.CONFIG_USER_INPUT]] != user_input_data[self.CONFIG_VALUE]:
-                    return False
-            except KeyError:
-                return False
-        return True
+    async def genetic_optimize(self, optimizer_settings):
+        """
+        Evolutionary optimization: each generation is bred from the best scored runs of the previous ones
+        until generations_count is reached, max_optimizer_runs are consumed or target_fitness_score is reached.
+        """
+        success = True
+        optimizer_id = (optimizer_settings.optimizer_ids or [optimizer_settings.optimizer_id])[0]
+        self.is_computing = True
+        self.is_finished = False
+        self.average_run_time = 0
+        self.active_processes_count = multiprocessing.cpu_count() - abs(optimizer_settings.required_idle_cores)
+        self.total_nb_runs = self._get_genetic_max_runs_count(optimizer_settings)
+        global_t0 = time.time()
+        lock = multiprocessing.RLock()
+        shared_keep_running = multiprocessing.Value(ctypes.c_bool, True)
+        shared_run_time = multiprocessing.Array(ctypes.c_float, [0.0 for _ in range(self.active_processes_count)])
+        individuals_by_hash = {}
+        scored_results_by_hash = {}
+        ranked_hashes = []
+        try:
+            genes = self._get_genetic_genes()
+            if not genes:
+                raise RuntimeError("No optimizer run to schedule with this configuration")
+            for generation in range(optimizer_settings.generations_count):
+                remaining_runs = self.total_nb_runs - len(individuals_by_hash)
+                if not self._should_keep_running() or remaining_runs <= 0:
+                    break
+                generation_runs = self._generate_generation_runs(
+                    optimizer_settings, genes, generation, individuals_by_hash, ranked_hashes, remaining_runs
+                )
+                if not generation_runs:
+                    self.logger.info(f"No new run to breed at generation {generation + 1}, stopping optimizer.")
+                    break
+                individuals_by_hash.update({
+                    run_hash: individual
+                    for run_hash, (individual, _) in generation_runs.items()
+                })
+                self.pending_runs_count = self.total_nb_runs - len(individuals_by_hash)
+                runs = [run for _, run in generation_runs.values()]
+                await self._run_genetic_generation(optimizer_settings, optimizer_id, runs,
+                                                   lock, shared_keep_running, shared_run_time)
+                scored_results_by_hash.update(await self._get_scored_run_results(optimizer_id, runs))
+                ranked_hashes = self._rank_scored_results(optimizer_settings, scored_results_by_hash)
+                if not ranked_hashes:
+                    continue
+                best_result = scored_results_by_hash[ranked_hashes[0]]
+                self.logger.info(f"Generation {generation + 1}/{optimizer_settings.generations_count} "
+                                 f"best run: {best_result.result_str()}")
+                if self._is_target_fitness_score_reached(optimizer_settings, best_result):
+                    self.logger.info(f"Target fitness score of {optimizer_settings.target_fitness_score} reached "
+                                     f"after {len(individuals_by_hash)} runs.")
+                    break
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when running genetic optimizer: {e}")
+            success = False
+        finally:
+            if optimizer_settings.notify_when_complete:
+                await self._send_optimizer_finished_notification()
+            self.runs_schedule = None
+            self.pending_runs_count = 0
+            self.process_pool_handle = None
+            self.is_computing = False
+            self.is_finished = True
+        if ranked_hashes:
+            self.logger.info(f"Best configuration: {scored_results_by_hash[ranked_hashes[0]].result_str()}")
+        self.logger.info(f"Genetic optimizer: {len(individuals_by_hash)} runs complete in "
+                         f"{time.time() - global_t0} seconds.")
+        return success
+
+    @staticmethod
+    def _get_genetic_max_runs_count(optimizer_settings):
+        return min(
+            optimizer_settings.max_optimizer_runs,
+            optimizer_settings.initial_generation_count +
+            max(optimizer_settings.generations_count - 1, 0) * optimizer_settings.run_per_generation
+        )
+
+    def _get_genetic_genes(self):
+        # each gene is the list of possible values of a user input, individuals are tuples of values indexes
+        return [values for values in self._get_config_possible_iterations() if values]
+
+    def _get_run_from_individual(self, genes, individual):
+        run = tuple(
+            genes[gene_index][value_index]
+            for gene_index, value_index in enumerate(individual)
+        )
+        if not self._is_run_allowed(run):
+            return None
+        return self._get_storable_run(run)
+
+    def _generate_generation_runs(self, optimizer_settings, genes, generation, individuals_by_hash,
+                                  ranked_hashes, remaining_runs):
+        parents = [
+            individuals_by_hash[run_hash]
+            for run_hash in ranked_hashes[:max(
+                2, int(len(ranked_hashes) * self.GENETIC_SELECTED_PARENTS_RATIO)
+            )]
+        ]
+        random_individual_factory = functools.partial(self._get_random_individual, genes)
+        if generation == 0 or not parents:
+            runs_count = optimizer_settings.initial_generation_count
+            individual_factory = random_individual_factory
+        else:
+            runs_count = optimizer_settings.run_per_generation
+            individual_factory = functools.partial(
+                self._breed_individual, genes, parents, optimizer_settings,
+                self._get_mutation_probability(optimizer_settings, generation)
+            )
+        runs_count = min(runs_count, remaining_runs)
+        runs_by_hash = self._generate_individuals(genes, runs_count, individuals_by_hash, individual_factory)
+        if len(runs_by_hash) < runs_count:
+            # converged population: complete the generation with random runs
+            runs_by_hash.update(self._generate_individuals(
+                genes, runs_count - len(runs_by_hash), {**individuals_by_hash, **runs_by_hash},
+                random_individual_factory
+            ))
+        return runs_by_hash
+
+    def _generate_individuals(self, genes, count, excluded_hashes, individual_factory):
+        runs_by_hash = {}
+        remaining_attempts = count * self.GENETIC_MAX_ATTEMPTS_PER_RUN
+        while len(runs_by_hash) < count and remaining_attempts > 0:
+            remaining_attempts -= 1
+            individual = individual_factory()
+            run = self._get_run_from_individual(genes, individual)
+            if run is None:
+                continue
+            run_hash = self.get_run_hash(run)
+            if run_hash in excluded_hashes or run_hash in runs_by_hash:
+                continue
+            runs_by_hash[run_hash] = (individual, run)
+        return runs_by_hash
+
+    @staticmethod
+    def _get_random_individual(genes):
+        return tuple(random.randrange(len(values)) for values in genes)
+
+    @staticmethod
+    def _breed_individual(genes, parents, optimizer_settings, mutation_probability):
+        first_parent, second_parent = random.sample(parents, 2) if len(parents) > 1 else (parents[0], parents[0])
+        # uniform crossover
+        child = [random.choice(values) for values in zip(first_parent, second_parent)]
+        if random.random() < mutation_probability:
+            mutated_genes_count = min(
+                max(1, round(len(child) * optimizer_settings.mutation_percent / 100)), len(child)
+            )
+            max_shift = max(1, int(optimizer_settings.max_mutation_number_multiplier))
+            for gene_index in random.sample(range(len(child)), mutated_genes_count):
+                # move to a close value: values are ordered for number user inputs
+                shift = random.randint(1, max_shift) * random.choice((-1, 1))
+                child[gene_index] = min(max(child[gene_index] + shift, 0), len(genes[gene_index]) - 1)
+        return tuple(child)
+
+    @staticmethod
+    def _get_mutation_probability(optimizer_settings, generation):
+        # explore first and then refine: mutate less and less as generations are going
+        max_probability = float(optimizer_settings.max_mutation_probability_percent)
+        min_probability = float(optimizer_settings.min_mutation_probability_percent)
+        progress = generation / max(optimizer_settings.generations_count - 1, 1)
+        return (max_probability - (max_probability - min_probability) * progress) / 100
+
+    async def _run_genetic_generation(self, optimizer_settings, optimizer_id, runs,
+                                      lock, shared_keep_running, shared_run_time):
+        run_data = {index: run for index, run in enumerate(runs)}
+        # runs_schedule is given to optimizer processes, no need to store generations in the run schedule database
+        self.runs_schedule = {
+            self.CONFIG_RUNS: run_data,
+            self.CONFIG_ID: optimizer_id
+        }
+        run_queues_by_optimizer_id = {
+            optimizer_id: await self._create_run_queues(optimizer_id, run_data)
+        }
+        try:
+            await self._run_multi_processed_optimizer(
+                optimizer_settings, lock,
+                shared_keep_running, shared_run_time,
+                run_queues_by_optimizer_id
+            )
+        finally:
+            await self._close_run_queues(run_queues_by_optimizer_id)
+
+    async def successive_halving_optimize(self, optimizer_settings):
+        """
+        Multi-fidelity optimization: every run is first evaluated on a short slice of the backtesting window,
+        only the best ranked runs are promoted to the next (longer) window until the full window is reached.
+        """
+        success = True
+        optimizer_id = (optimizer_settings.optimizer_ids or [optimizer_settings.optimizer_id])[0]
+        self.is_computing = True
+        self.is_finished = False
+        self.average_run_time = 0
+        self.active_processes_count = multiprocessing.cpu_count() - abs(optimizer_settings.required_idle_cores)
+        global_t0 = time.time()
+        lock = multiprocessing.RLock()
+        shared_keep_running = multiprocessing.Value(ctypes.c_bool, True)
+        shared_run_time = multiprocessing.Array(ctypes.c_float, [0.0 for _ in range(self.active_processes_count)])
+        executed_runs_count = 0
+        scored_results_by_hash = {}
+        ranked_hashes = []
+        try:
+            runs = list(self._generate_runs().values())
+            rungs_settings = await self._get_halving_rungs_settings(optimizer_settings)
+            halving_factor = max(optimizer_settings.halving_factor, 2)
+            rung_sizes = self._get_halving_rung_sizes(len(runs), len(rungs_settings), halving_factor)
+            self.total_nb_runs = sum(rung_sizes)
+            for rung, rung_settings in enumerate(rungs_settings):
+                if not self._should_keep_running() or not runs:
+                    break
+                runs = runs[:rung_sizes[rung]]
+                executed_runs_count += len(runs)
+                self.pending_runs_count = sum(rung_sizes[rung + 1:])
+                rung_first_backtesting_id = await self._get_first_available_backtesting_id(optimizer_id)
+                await self._run_genetic_generation(rung_settings, optimizer_id, runs,
+                                                   lock, shared_keep_running, shared_run_time)
+                # only use this rung results: runs that failed in this rung are not promoted
+                scored_results_by_hash = await self._get_scored_run_results(
+                    optimizer_id, runs, min_backtesting_id=rung_first_backtesting_id
+                )
+                ranked_hashes = self._rank_halving_rung_results(
+                    rung_settings, scored_results_by_hash, rung == len(rungs_settings) - 1
+                )
+                if not ranked_hashes:
+                    self.logger.info(f"No run to promote after rung {rung + 1}, stopping optimizer.")
+                    break
+                self.logger.info(f"Rung {rung + 1}/{len(rungs_settings)} ({len(runs)} runs until "
+                                 f"{rung_settings.end_timestamp}) best run: "
+                                 f"{scored_results_by_hash[ranked_hashes[0]].result_str()}")
+                runs = [scored_results_by_hash[run_hash].optimizer_run_data for run_hash in ranked_hashes]
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when running successive halving optimizer: {e}")
+            success = False
+        finally:
+            if optimizer_settings.notify_when_complete:
+                await self._send_optimizer_finished_notification()
+            self.runs_schedule = None
+            self.pending_runs_count = 0
+            self.process_pool_handle = None
+            self.is_computing = False
+            self.is_finished = True
+        if ranked_hashes:
+            self.logger.info(f"Best configuration: {scored_results_by_hash[ranked_hashes[0]].result_str()}")
+        self.logger.info(f"Successive halving optimizer: {executed_runs_count} runs complete in "
+                         f"{time.time() - global_t0} seconds.")
+        return success
+
+    async def _get_halving_rungs_settings(self, optimizer_settings):
+        rungs_count = max(optimizer_settings.halving_rungs_count, 1)
+        start_timestamp, end_timestamp = await self._get_backtesting_window(optimizer_settings)
+        if start_timestamp is None:
+            self.logger.warning("Impossible to identify the backtesting window to slice: running successive "
+                                "halving on the full backtesting window only.")
+            rungs_count = 1
+        rungs_settings = []
+        for rung in range(rungs_count):
+            rung_settings = copy.copy(optimizer_settings)
+            # windows are different: scores can't be compared from one rung to another
+            rung_settings.fitness_parameters = [
+                fitness_parameter_import.FitnessParameter(
+                    parameter.name, parameter.weight, parameter.is_ratio_from_max
+                )
+                for parameter in optimizer_settings.fitness_parameters
+            ]
+            if rung < rungs_count - 1:
+                window_ratio = max(optimizer_settings.halving_factor, 2) ** (rung - rungs_count + 1)
+                rung_settings.start_timestamp = start_timestamp
+                rung_settings.end_timestamp = int(start_timestamp + (end_timestamp - start_timestamp) * window_ratio)
+            rungs_settings.append(rung_settings)
+        return rungs_settings
+
+    async def _get_backtesting_window(self, optimizer_settings):
+        start_timestamp = optimizer_settings.start_timestamp
+        end_timestamp = optimizer_settings.end_timestamp
+        if start_timestamp is None or end_timestamp is None:
+            descriptions = [
+                await backtesting_api.get_file_description(data_file)
+                for data_file in optimizer_settings.data_files
+            ]
+            if not descriptions or None in descriptions:
+                return None, None
+            # backtesting is run on the common part of data files
+            if start_timestamp is None:
+                start_timestamp = max(description[backtesting_enums.DataFormatKeys.START_TIMESTAMP.value]
+                                      for description in descriptions)
+            if end_timestamp is None:
+                end_timestamp = min(description[backtesting_enums.DataFormatKeys.END_TIMESTAMP.value]
+                                    for description in descriptions)
+        if not start_timestamp or not end_timestamp or end_timestamp <= start_timestamp:
+            return None, None
+        return start_timestamp, end_timestamp
+
+    @staticmethod
+    def _get_halving_rung_sizes(runs_count, rungs_count, halving_factor):
+        return [
+            max(1, math.ceil(runs_count / halving_factor ** rung))
+            for rung in range(rungs_count)
+        ]
+
+    def _rank_halving_rung_results(self, rung_settings, scored_results_by_hash, is_last_rung):
+        ranked_hashes = self._rank_scored_results(rung_settings, scored_results_by_hash)
+        if is_last_rung:
+            return ranked_hashes
+        # short windows might not be long enough for runs to pass filters (ex: trades count):
+        # also promote excluded runs, after eligible ones
+        eligible_hashes = set(ranked_hashes)
+        return ranked_hashes + [
+            run_hash
+            for run_hash, _ in sorted(
+                (
+                    (run_hash, scored_result)
+                    for run_hash, scored_result in scored_results_by_hash.items()
+                    if run_hash not in eligible_hashes
+                ),
+                key=lambda element: element[1].score, reverse=True
+            )
+        ]
+
+    async def _get_scored_run_results(self, optimizer_id, runs, min_backtesting_id=None):
+        run_dbs_identifier = databases.RunDatabasesIdentifier(
+            self.trading_mode, self.optimization_campaign_name, optimizer_id=optimizer_id
+        )
+        try:
+            async with databases.DBReader.database(run_dbs_identifier.get_backtesting_metadata_identifier(),
+                                                   with_lock=True) as reader:
+                all_run_results = await reader.all(commons_enums.DBTables.METADATA.value)
+        except commons_errors.DatabaseNotFoundError:
+            return {}
+        run_results_index = self._run_results_indexes.setdefault(
+            optimizer_id, run_results_index_import.RunResultsIndex()
+        )
+        run_results_index.update(all_run_results)
+        scored_results_by_hash = {}
+        for run_data, full_result in self._get_from_run_results(dict(enumerate(runs)), run_results_index,
+                                                                min_backtesting_id=min_backtesting_id):
+            run_hash = self.get_run_hash(run_data)
+            # results are read from the most recent one: keep the first one
+            if run_hash not in scored_results_by_hash:
+                scored_results_by_hash[run_hash] = scored_run_result_import.ScoredRunResult(full_result, run_data)
+        return scored_results_by_hash
+
+    def _rank_scored_results(self, optimizer_settings, scored_results_by_hash):
+        run_hashes = list(scored_results_by_hash)
+        scored_results = list(scored_results_by_hash.values())
+        # score, filter and rank every result at once
+        run_results = scored_run_results_import.ScoredRunResults(
+            [scored_result.full_result for scored_result in scored_results]
+        )
+        ranked_indexes = run_results.rank(optimizer_settings.fitness_parameters, optimizer_settings.exclude_filters)
+        for scored_result, score in zip(scored_results, run_results.scores.tolist()):
+            scored_result.set_score(score, optimizer_settings.fitness_parameters)
+        return [run_hashes[index] for index in ranked_indexes.tolist()]
+
+    @staticmethod
+    def _is_target_fitness_score_reached(optimizer_settings, scored_result):
+        if optimizer_settings.target_fitness_score is None:
+            return False
+        # ranking scores are relative to other results: compare the absolute score to the target
+        absolute_result = scored_run_result_import.ScoredRunResult(
+            scored_result.full_result, scored_result.optimizer_run_data
+        )
+        absolute_result.compute_score([
+            fitness_parameter_import.FitnessParameter(
+                parameter.name, parameter.weight, parameter.is_ratio_from_max
+            )
+            for parameter in optimizer_settings.fitness_parameters
+        ])
+        return absolute_result.score >= optimizer_settings.target_fitness_score
+
+    def _get_from_run_results(self, run_data_elements, run_results_index, min_backtesting_id=None):
+        found_results = []
+        for to_find_run_data in run_data_elements.values():
+            if (found_result := run_results_index.get_most_recent(
+                    *self._get_user_inputs_fingerprint(to_find_run_data)
+            )) is not None and (
+                min_backtesting_id is None
+                or int(found_result[1][commons_enums.BacktestingMetadata.ID.value]) >= min_backtesting_id
+            ):
+                found_results.append((found_result, to_find_run_data))
+        # yield from the most recent result
+        for (_, full_result), to_find_run_data in sorted(
+                found_results, key=lambda element: element[0][0], reverse=True
+        ):
+            yield to_find_run_data, full_result
+
+    def _get_user_inputs_fingerprint(self, run_data):
+        # todo handle user input with object config
+        return (
+            tuple(
+                (user_input_data[self.CONFIG_TENTACLE][0], user_input_data[self.CONFIG_USER_INPUT])
+                for user_input_data in run_data
+            ),
+            tuple(user_input_data[self.CONFIG_VALUE] for user_input_data in run_data)
+        )
 
     async def _send_optimizer_finished_notification(self):
         await services_api.send_notification(
@@ -508,6 +957,9 @@ class StrategyDesignOptimizer:
             if self.optimizer_settings.optimizer_id is None else self.optimizer_settings.optimizer_id
         self.run_dbs_identifier.optimizer_id = self.optimizer_settings.optimizer_id
         await self.run_dbs_identifier.initialize()
+        if self.optimizer_settings.optimizer_mode != enums.OptimizerModes.NORMAL.value:
+            # genetic and successive halving modes generate their own runs when started: nothing to queue
+            return self._generate_runs()
         return await self._generate_and_store_backtesting_runs_schedule()
 
     @classmethod
@@ -517,7 +969,7 @@ class StrategyDesignOptimizer:
         try:
             async with databases.DBReader.database(run_dbs_identifier.get_optimizer_runs_schedule_identifier(),
                                                    with_lock=True) as reader:
-                return await reader.all(cls.RUN_SCHEDULE_TABLE)
+                return cls._remove_journaled_runs(trading_mode, campaign_name, await reader.all(cls.RUN_SCHEDULE_TABLE))
         except commons_errors.DatabaseNotFoundError:
             return []
         except json.JSONDecodeError:
@@ -589,12 +1041,10 @@ class StrategyDesignOptimizer:
                 pass
             return updated_queue
 
-    async def _synchronized_pick_run(self, run_queue, run_details_by_hash):
+    async def _pick_run(self, run_queue, run_details_by_hash):
         try:
-            # acquire MultiprocessingLocks.DBLock to wait for re-ordering if it happens during a run
-            with multiprocessing_util.get_lock(commons_enums.MultiprocessingLocks.DBLock.value):
-                # wait for a very short  time to allow queue sync between processes
-                selected_run_hash = run_queue.get(timeout=1)
+            # wait for a very short  time to allow queue sync between processes
+            selected_run_hash = run_queue.get(timeout=1)
             run_details = run_details_by_hash.pop(selected_run_hash, None)
             self.logger.info(f"Selecting: {run_details}")
             return selected_run_hash, run_details
@@ -611,51 +1061,117 @@ class StrategyDesignOptimizer:
                                    start_timestamp=None,
                                    end_timestamp=None):
         start_run = False
-        selected_run_hash, run_details = await self._synchronized_pick_run(run_queues[self.START_QUEUE_KEY],
-                                                                           run_data_by_hash)
+        cache_key = cached_result = None
+        selected_run_hash, run_details = await self._pick_run(run_queues[self.START_QUEUE_KEY], run_data_by_hash)
         if run_details:
-            # start backtesting run ids at 1
-            backtesting_run_id = 1
-            # always ensure backtesting id is unique
+            if self.run_results_cache is not None:
+                cache_key = self.run_results_cache.get_cache_key(
+                    selected_run_hash, self.config, self.base_tentacles_setup_config,
+                    data_files, start_timestamp, end_timestamp
+                )
             run_dbs_identifier = databases.RunDatabasesIdentifier(
-                self.trading_mode, self.optimization_campaign_name,
-                optimizer_id=optimizer_id, backtesting_id=backtesting_run_id
+                self.trading_mode, self.optimization_campaign_name, optimizer_id=optimizer_id
             )
-            # acquire MultiprocessingLocks.DBLock to avoid conflicts during multi processing runs
-            with multiprocessing_util.get_lock(commons_enums.MultiprocessingLocks.DBLock.value):
-                backtesting_run_id = await run_dbs_identifier.generate_new_backtesting_id()
-                run_dbs_identifier.backtesting_id = backtesting_run_id
-                await run_dbs_identifier.initialize()
+            backtesting_run_id = await self._get_next_backtesting_id(optimizer_id, run_dbs_identifier)
+            run_dbs_identifier.backtesting_id = backtesting_run_id
+            await run_dbs_identifier.initialize()
+            if cache_key is not None:
+                cached_result = await self.run_results_cache.get(cache_key)
             start_run = True
         if start_run:
             try:
+                if cached_result is not None:
+                    self.logger.debug(f"Reusing cached result for backtesting {backtesting_run_id}")
+                    return await self._log_cached_run_result(run_dbs_identifier, cached_result)
                 run_result = await self._run_with_config(optimizer_id, data_files, backtesting_run_id, run_details,
                                                          start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+                if cache_key is not None:
+                    await self._store_run_result_in_cache(run_dbs_identifier, cache_key, run_result)
                 return run_result
             finally:
                 if selected_run_hash is not None:
                     run_queues[self.DONE_QUEUE_KEY].put(selected_run_hash)
         raise NoMoreRunError("Nothing to run")
 
+    async def _get_first_available_backtesting_id(self, optimizer_id):
+        run_dbs_identifier = databases.RunDatabasesIdentifier(
+            self.trading_mode, self.optimization_campaign_name, optimizer_id=optimizer_id
+        )
+        existing_ids = [
+            int(backtesting_id)
+            for backtesting_id in await run_dbs_identifier.get_backtesting_run_ids() or []
+            if backtesting_id.isdigit()
+        ]
+        # start backtesting run ids at 1
+        return max(existing_ids, default=0) + 1
+
+    async def _get_next_backtesting_id(self, optimizer_id, run_dbs_identifier):
+        try:
+            return next(self._backtesting_ids_by_optimizer_id[optimizer_id])
+        except (KeyError, StopIteration):
+            self._backtesting_ids_by_optimizer_id[optimizer_id] = \
+                await self._reserve_backtesting_ids(optimizer_id, run_dbs_identifier)
+            return next(self._backtesting_ids_by_optimizer_id[optimizer_id])
+
+    async def _reserve_backtesting_ids(self, optimizer_id, run_dbs_identifier):
+        try:
+            next_backtesting_id = \
+                multiprocessing_util.get_shared_element(self.SHARED_NEXT_BACKTESTING_IDS_KEY)[optimizer_id]
+        except KeyError:
+            # not in a multi processed optimizer: use the first available id
+            return iter([await run_dbs_identifier.generate_new_backtesting_id()])
+        # only synchronized with other processes once every BACKTESTING_IDS_BLOCK_SIZE runs
+        with next_backtesting_id.get_lock():
+            first_id = next_backtesting_id.value
+            next_backtesting_id.value += self.BACKTESTING_IDS_BLOCK_SIZE
+        return iter(range(first_id, first_id + self.BACKTESTING_IDS_BLOCK_SIZE))
+
+    async def _log_cached_run_result(self, run_dbs_identifier, cached_result):
+        run_metadata = cached_result[run_results_cache_import.RunResultsCache.RUN_METADATA]
+        run_metadata[commons_enums.BacktestingMetadata.ID.value] = run_dbs_identifier.backtesting_id
+        run_metadata[commons_enums.BacktestingMetadata.OPTIMIZATION_CAMPAIGN.value] = \
+            run_dbs_identifier.optimization_campaign_name
+        cached_run_folder = cached_result[run_results_cache_import.RunResultsCache.RUN_FOLDER]
+        run_folder = run_dbs_identifier.get_backtesting_run_folder()
+        if cached_run_folder != run_folder and os.path.isdir(cached_run_folder):
+            # also copy run databases when still available to be able to display run details
+            shutil.copytree(cached_run_folder, run_folder, dirs_exist_ok=True)
+        async with databases.DBWriter.database(run_dbs_identifier.get_backtesting_metadata_identifier(),
+                                               with_lock=True) as writer:
+            await writer.log(commons_enums.DBTables.METADATA.value, run_metadata)
+        return run_metadata
+
+    async def _store_run_result_in_cache(self, run_dbs_identifier, cache_key, independent_backtesting):
+        # use the in memory run metadata: don't read it back from the optimizer metadata database
+        run_metadata = None if independent_backtesting is None \
+            else independent_backtesting.octobot_backtesting.run_metadata
+        if not run_metadata:
+            # failed run: nothing to cache
+            return
+        await self.run_results_cache.store(cache_key, run_metadata, run_dbs_identifier.get_backtesting_run_folder())
+
     async def _run_with_config(self, optimizer_id, data_files, run_id, run_config,
                                start_timestamp=None, end_timestamp=None):
         self.logger.debug(f"Running optimizer with id {optimizer_id} "
                           f"on backtesting {run_id} with config {run_config}")
         self._update_config_for_optimizer(optimizer_id, run_id)
-        tentacles_setup_config = self._get_custom_tentacles_setup_config(optimizer_id, run_id, run_config)
+        config_by_tentacle = self._get_config_by_tentacle(run_config)
         independent_backtesting = None
         try:
             import octobot.api.backtesting as octobot_backtesting_api
             # reset possible remaining caches
             await databases.CacheManager().reset()
-            config_to_use = copy.deepcopy(self.config)
+            # copy-on-write view: config changes made by the backtesting are not applied to self.config
+            config_to_use = octobot_backtesting.ConfigOverlay(self.config)
             independent_backtesting = octobot_backtesting_api.create_independent_backtesting(
                 config_to_use,
-                tentacles_setup_config,
+                self.base_tentacles_setup_config,
                 data_files,
                 start_timestamp=start_timestamp,
                 end_timestamp=end_timestamp,
                 enforce_total_databases_max_size_after_run=False,
+                backtesting_data=await self._get_backtesting_data(data_files),
+                config_by_tentacle=config_by_tentacle,
             )
             await octobot_backtesting_api.initialize_and_run_independent_backtesting(independent_backtesting,
                                                                                      log_errors=False)
@@ -671,6 +1187,22 @@ class StrategyDesignOptimizer:
             if independent_backtesting is not None:
                 await independent_backtesting.stop()
 
+    async def _get_backtesting_data(self, data_files):
+        if self.backtesting_data is None or self.backtesting_data.data_files != data_files:
+            await self._stop_backtesting_data()
+            import octobot.api.backtesting as octobot_backtesting_api
+            # data files are parsed only once: only trading and evaluation states are reset between runs
+            # and preloaded candles are shared with the other optimizer processes
+            self.backtesting_data = await octobot_backtesting_api.create_and_init_shared_backtesting_data(
+                data_files, self.config, self.base_tentacles_setup_config
+            )
+        return self.backtesting_data
+
+    async def _stop_backtesting_data(self):
+        if self.backtesting_data is not None:
+            await self.backtesting_data.stop()
+            self.backtesting_data = None
+
     def _update_config_for_optimizer(self, optimizer_id, run_id):
         self.config[commons_constants.CONFIG_OPTIMIZER_ID] = optimizer_id
         self.config[commons_constants.CONFIG_BACKTESTING_ID] = run_id
@@ -685,16 +1217,8 @@ class StrategyDesignOptimizer:
             self._updated_nested_tentacle_config(nested_tentacles[1:], user_input, config_value,
                                                  local_tentacle_config[cleaned_tentacle_name])
 
-    def _get_custom_tentacles_setup_config(self, optimizer_id, run_id, run_config):
-        local_tentacles_setup_config = copy.deepcopy(self.base_tentacles_setup_config)
-        run_dbs_identifier = databases.RunDatabasesIdentifier(
-            self.trading_mode, self.optimization_campaign_name, optimizer_id=optimizer_id, backtesting_id=run_id)
-        run_folder = run_dbs_identifier.get_backtesting_run_folder()
-        tentacles_setup_config_path = os.path.join(run_folder, commons_constants.CONFIG_TENTACLES_FILE)
-        tentacles_manager_api.set_tentacles_setup_configuration_path(local_tentacles_setup_config,
-                                                                     tentacles_setup_config_path)
-        # save updated config for each custom parameter tentacle
-        # and import config of remaining tentacles: add missing tentacles into tentacles_updates with nothing to update
+    def _get_config_by_tentacle(self, run_config):
+        # use the config of every tentacle with a profile local config, updated with the run user inputs
         tentacles_updates = {
             tentacle: {}
             for tentacle in tentacles_manager_api.get_activated_tentacles(self.base_tentacles_setup_config)
@@ -705,23 +1229,33 @@ class StrategyDesignOptimizer:
                                                  input_config[self.CONFIG_USER_INPUT],
                                                  input_config[self.CONFIG_VALUE],
                                                  tentacles_updates)
-        self._ensure_local_config_folders(run_folder)
-        for tentacle, updated_values in tentacles_updates.items():
-            tentacle_class = tentacles_manager_api.get_tentacle_class_from_string(tentacle)
-            current_config = tentacles_manager_api.get_tentacle_config(self.base_tentacles_setup_config,
-                                                                       tentacle_class)
-            dict_util.nested_update_dict(current_config, updated_values)
-            tentacles_manager_api.update_tentacle_config(local_tentacles_setup_config, tentacle_class, current_config)
-        return local_tentacles_setup_config
+        return {
+            tentacle: self._get_run_tentacle_config(tentacle, updated_values)
+            for tentacle, updated_values in tentacles_updates.items()
+        }
 
-    @staticmethod
-    def _ensure_local_config_folders(run_folder):
-        if not os.path.exists(run_folder):
-            os.makedirs(run_folder)
-        tentacles_specific_config_folder = os.path.join(run_folder,
-                                                        tentacles_manager_constants.TENTACLES_SPECIFIC_CONFIG_FOLDER)
-        if not os.path.exists(tentacles_specific_config_folder):
-            os.mkdir(tentacles_specific_config_folder)
+    def _get_run_tentacle_config(self, tentacle, updated_values):
+        config_key = (tentacle, json.dumps(updated_values, sort_keys=True, default=str))
+        try:
+            # move to the end: least recently used configs are removed first
+            tentacle_config = self._tentacles_configs_by_key[config_key] = \
+                self._tentacles_configs_by_key.pop(config_key)
+        except KeyError:
+            # identical configs are only merged once
+            tentacle_config = copy.deepcopy(self._get_base_tentacle_config(tentacle))
+            dict_util.nested_update_dict(tentacle_config, updated_values)
+            self._tentacles_configs_by_key[config_key] = tentacle_config
+            while len(self._tentacles_configs_by_key) > self.TENTACLES_CONFIGS_CACHE_MAX_SIZE:
+                self._tentacles_configs_by_key.pop(next(iter(self._tentacles_configs_by_key)))
+        # tentacles can complete their config with default values: each run gets its own copy
+        return copy.deepcopy(tentacle_config)
+
+    def _get_base_tentacle_config(self, tentacle):
+        if tentacle not in self._base_tentacles_configs:
+            self._base_tentacles_configs[tentacle] = tentacles_manager_api.get_tentacle_config(
+                self.base_tentacles_setup_config, tentacles_manager_api.get_tentacle_class_from_string(tentacle)
+            )
+        return self._base_tentacles_configs[tentacle]
 
     async def _generate_and_store_backtesting_runs_schedule(self):
         runs = self._generate_runs()
@@ -729,29 +1263,88 @@ class StrategyDesignOptimizer:
         await self._create_run_schedule_and_config_snapshot()
         return runs
 
-    @staticmethod
-    def shuffle_and_select_runs(runs, select_size=None) -> dict:
-        shuffled_runs = list(runs.values())
-        random.shuffle(shuffled_runs)
-        selected_runs = shuffled_runs if select_size is None else shuffled_runs[:select_size]
-        return {i: run for i, run in enumerate(selected_runs)}
-
     def _generate_runs(self):
         iterations = [i for i in self._get_config_possible_iterations() if i]
+        select_size = self.optimizer_settings.queue_size
+        if self.optimizer_settings.randomly_chose_runs:
+            selected_runs = self._select_random_runs(iterations, select_size)
+        else:
+            selected_runs = itertools.islice(self._iterate_allowed_runs(iterations), select_size)
         runs = {
-            index: run
-            for index, run in enumerate(itertools.product(*iterations))
-            if self._is_run_allowed(run)
+            index: self._get_storable_run(run)
+            for index, run in enumerate(selected_runs)
         }
         if runs:
-            shuffled_runs = self.shuffle_and_select_runs(runs, select_size=self.optimizer_settings.queue_size)
-            for run in shuffled_runs.values():
-                for run_input in run:
-                    # do not store self.CONFIG_KEY
-                    run_input.pop(self.CONFIG_KEY, None)
-            return shuffled_runs
+            return runs
         raise RuntimeError("No optimizer run to schedule with this configuration")
 
+    def _iterate_allowed_runs(self, iterations):
+        # lazily iterate over the runs space: never store every possible run
+        return (
+            run
+            for run in itertools.product(*iterations)
+            if self._is_run_allowed(run)
+        )
+
+    def _select_random_runs(self, iterations, select_size):
+        rng = random.Random(self.optimizer_settings.random_seed)
+        runs_space_size = math.prod(len(values) for values in iterations) if iterations else 0
+        if runs_space_size > select_size * self.RUN_INDEX_SAMPLING_MIN_SPACE_RATIO:
+            # runs space is too large to be iterated: pick random indexes in it
+            return self._sample_runs_by_index(iterations, runs_space_size, select_size, rng)
+        return self._reservoir_sample_runs(self._iterate_allowed_runs(iterations), select_size, rng)
+
+    @staticmethod
+    def _reservoir_sample_runs(runs, select_size, rng):
+        reservoir = []
+        for index, run in enumerate(runs):
+            if index < select_size:
+                reservoir.append(run)
+            else:
+                replaced_index = rng.randint(0, index)
+                if replaced_index < select_size:
+                    reservoir[replaced_index] = run
+        rng.shuffle(reservoir)
+        return reservoir
+
+    def _sample_runs_by_index(self, iterations, runs_space_size, select_size, rng):
+        runs_by_index = {}
+        tried_indexes = set()
+        remaining_attempts = select_size * self.RUN_INDEX_SAMPLING_MAX_ATTEMPTS_PER_RUN
+        while len(runs_by_index) < select_size and remaining_attempts > 0:
+            remaining_attempts -= 1
+            run_index = rng.randrange(runs_space_size)
+            if run_index in tried_indexes:
+                continue
+            tried_indexes.add(run_index)
+            run = self._get_run_at_index(iterations, run_index)
+            if self._is_run_allowed(run):
+                runs_by_index[run_index] = run
+        if len(runs_by_index) < select_size:
+            self.logger.info(f"Only {len(runs_by_index)} runs selected out of the {select_size} requested: "
+                             f"most of the {runs_space_size} possible runs are filtered.")
+        return list(runs_by_index.values())
+
+    @staticmethod
+    def _get_run_at_index(iterations, run_index):
+        # same order as itertools.product: the last user input changes first
+        run = []
+        for values in reversed(iterations):
+            run_index, value_index = divmod(run_index, len(values))
+            run.append(values[value_index])
+        return tuple(reversed(run))
+
+    def _get_storable_run(self, run):
+        # do not store self.CONFIG_KEY, copy inputs as they are shared between runs
+        return tuple(
+            {
+                key: value
+                for key, value in run_input.items()
+                if key != self.CONFIG_KEY
+            }
+            for run_input in run
+        )
+
     def _is_run_allowed(self, run):
         for run_filter_config in self.optimizer_settings.optimizer_config[self.CONFIG_FILTER_SETTINGS]:
             if self._is_filtered(run, run_filter_config):
@@ -904,3 +1497,7 @@ class StrategyDesignOptimizer:
                 # error in database, reset it
                 await writer_reader.hard_reset()
                 await writer_reader.log(self.RUN_SCHEDULE_TABLE, self.runs_schedule)
+        # journaled runs are not in the saved schedule anymore
+        self._get_runs_journal(
+            self.trading_mode, self.optimization_campaign_name, self.optimizer_settings.optimizer_id
+        ).clear()
@@ -14,9 +14,11 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import asyncio
+import concurrent.futures
 import logging
 import math
 import copy
+import multiprocessing
 
 import octobot_commons.data_util as data_util
 import octobot_commons.tentacles_management as tentacles_management
@@ -25,6 +27,7 @@ import octobot_commons.constants as commons_constants
 import octobot_commons.errors as commons_errors
 
 import octobot.constants as constants
+import octobot.backtesting as octobot_backtesting
 import octobot.strategy_optimizer as strategy_optimizer
 
 import octobot_tentacles_manager.api as tentacles_manager_api
@@ -45,6 +48,8 @@ class StrategyOptimizer:
     """
     StrategyOptimizer is a tool that performs backtesting with different configurations
     """
+    # submitted and not yet completed runs per process when configurations are tested in processes
+    PENDING_RUNS_PER_PROCESS = 2
 
     def __init__(self, config, tentacles_setup_config, strategy_name):
         # Lazy import of tentacles to let tentacles manager handle imports
@@ -68,6 +73,8 @@ class StrategyOptimizer:
         self.all_TAs = []
         self.risks = []
         self.current_test_suite = None
+        # test suite scenarios are run at the same time in processes
+        self.test_suite_processes_count = multiprocessing.cpu_count()
         self.errors = set()
 
         self.is_computing = False
@@ -84,7 +91,10 @@ class StrategyOptimizer:
         else:
             self.is_properly_initialized = True
 
-    def find_optimal_configuration(self, TAs=None, time_frames=None, risks=None):
+    def find_optimal_configuration(self, TAs=None, time_frames=None, risks=None, processes_count=1):
+        """
+        When processes_count is greater than 1, configurations are tested at the same time in a process pool
+        """
         if not self.is_computing:
 
             # set is_computing to True to prevent any simultaneous start
@@ -120,7 +130,10 @@ class StrategyOptimizer:
                 common_logging.set_global_logger_level(logging.ERROR)
 
                 self.run_id = 1
-                self._iterate_on_configs(nb_TAs, nb_TFs)
+                if processes_count > 1:
+                    self._iterate_on_configs_in_processes(nb_TAs, nb_TFs, processes_count)
+                else:
+                    self._iterate_on_configs(nb_TAs, nb_TFs)
                 self._find_optimal_configuration_using_results()
             finally:
                 self.current_test_suite = None
@@ -137,10 +150,71 @@ class StrategyOptimizer:
                                f"{self.run_id}/{self.total_nb_runs} processed")
 
     def _iterate_on_configs(self, nb_TAs, nb_TFs):
+        for risk, activated_evaluators, activated_time_frames in self._generate_configs(nb_TAs, nb_TFs):
+            if not self.keep_running:
+                return
+            self._run_on_config(risk, activated_evaluators, activated_time_frames)
+
+    def _iterate_on_configs_in_processes(self, nb_TAs, nb_TFs, processes_count):
+        results_by_run_index = {}
+        # already tested combinations are skipped: use the exact runs count for progress
+        self.total_nb_runs = sum(1 for _ in self._generate_configs(nb_TAs, nb_TFs))
+        max_pending_runs_count = processes_count * self.PENDING_RUNS_PER_PROCESS
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes_count,
+                initializer=tentacles_manager_api.reload_tentacle_info) as pool:
+            configs = enumerate(self._generate_configs(nb_TAs, nb_TFs))
+            configs_by_future = {}
+            has_configs_to_submit = True
+            while self.keep_running and (has_configs_to_submit or configs_by_future):
+                # only submit the next configs when workers are available: each submitted run holds config copies
+                while self.keep_running and has_configs_to_submit \
+                        and len(configs_by_future) < max_pending_runs_count:
+                    try:
+                        run_index, (risk, activated_evaluators, activated_time_frames) = next(configs)
+                    except StopIteration:
+                        has_configs_to_submit = False
+                        break
+                    self._apply_config(risk, activated_evaluators, activated_time_frames)
+                    # copy configs: they are serialized when sent to the process, after the next configs are applied
+                    future = pool.submit(run_test_suite_in_process,
+                                         self.strategy_class,
+                                         copy.deepcopy(self.tentacles_setup_config),
+                                         copy.deepcopy(self.config),
+                                         activated_evaluators)
+                    configs_by_future[future] = (run_index, risk, activated_evaluators, activated_time_frames)
+                if not configs_by_future:
+                    break
+                done_futures, _ = concurrent.futures.wait(configs_by_future,
+                                                          return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done_futures:
+                    if not self.keep_running:
+                        break
+                    self._register_run_result(future, configs_by_future.pop(future), results_by_run_index)
+            if not self.keep_running:
+                pool.shutdown(wait=True, cancel_futures=True)
+        # keep results in configurations order, as when tested one after the other
+        self.run_results = [results_by_run_index[run_index] for run_index in sorted(results_by_run_index)]
+
+    def _register_run_result(self, future, run_config, results_by_run_index):
+        run_index, risk, activated_evaluators, activated_time_frames = run_config
+        try:
+            run_result, errors = future.result()
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when running test suite: {e}")
+            self.errors.add(str(e))
+        else:
+            self.errors = self.errors.union(errors)
+            results_by_run_index[run_index] = run_result
+            print(f"{self.run_id}/{self.total_nb_runs} Run with: evaluators: {activated_evaluators}, "
+                  f"time frames :{activated_time_frames}, risk: {risk} "
+                  f" => Result: {run_result.get_result_string(False)}")
+        self.run_id += 1
+
+    def _generate_configs(self, nb_TAs, nb_TFs):
         # test with several risks
         for risk in self.risks:
-            self.config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] = risk
-            eval_conf_history = []
+            eval_conf_history = set()
             # test with several evaluators
             for evaluator_conf_iteration in range(nb_TAs):
                 current_forced_evaluator = self.all_TAs[evaluator_conf_iteration]
@@ -154,8 +228,7 @@ class StrategyOptimizer:
                                                                            self.strategy_class.get_name(),
                                                                            True)
                         if activated_evaluators is not None:
-                            self._adapt_tentacles_config(activated_evaluators)
-                            time_frames_conf_history = []
+                            time_frames_conf_history = set()
                             # test different time frames
                             for time_frame_conf_iteration in range(nb_TFs):
                                 current_forced_time_frame = self.all_time_frames[time_frame_conf_iteration]
@@ -163,32 +236,36 @@ class StrategyOptimizer:
                                 for nb_time_frames in range(1, nb_TFs + 1):
                                     # test different configurations
                                     for _ in range(nb_TFs):
-                                        if not self.keep_running:
-                                            return
-                                        self._run_on_config(risk, current_forced_time_frame, nb_time_frames,
-                                                            time_frames_conf_history, activated_evaluators)
-
-    def _run_on_config(self, risk, current_forced_time_frame, nb_time_frames,
-                       time_frames_conf_history, activated_evaluators):
-        activated_time_frames = self._get_activated_element(self.all_time_frames,
-                                                            current_forced_time_frame,
-                                                            nb_time_frames,
-                                                            time_frames_conf_history)
-        if activated_time_frames is not None:
-            self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME] = activated_time_frames
-            print(f"{self.run_id}/{self.total_nb_runs} Run with: evaluators: {activated_evaluators}, "
-                  f"time frames :{activated_time_frames}, risk: {risk}")
-            self._run_test_suite(self.config, activated_evaluators)
-            print(f" => Result: {self.run_results[-1].get_result_string(False)}")
-            self.run_id += 1
+                                        activated_time_frames = self._get_activated_element(
+                                            self.all_time_frames,
+                                            current_forced_time_frame,
+                                            nb_time_frames,
+                                            time_frames_conf_history
+                                        )
+                                        if activated_time_frames is not None:
+                                            yield risk, activated_evaluators, activated_time_frames
+
+    def _apply_config(self, risk, activated_evaluators, activated_time_frames):
+        self.config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] = risk
+        self._adapt_tentacles_config(activated_evaluators)
+        self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME] = activated_time_frames
+
+    def _run_on_config(self, risk, activated_evaluators, activated_time_frames):
+        self._apply_config(risk, activated_evaluators, activated_time_frames)
+        print(f"{self.run_id}/{self.total_nb_runs} Run with: evaluators: {activated_evaluators}, "
+              f"time frames :{activated_time_frames}, risk: {risk}")
+        self._run_test_suite(self.config, activated_evaluators)
+        print(f" => Result: {self.run_results[-1].get_result_string(False)}")
+        self.run_id += 1
 
     def _run_test_suite(self, config, evaluators):
         self.current_test_suite = strategy_optimizer.StrategyTestSuite()
         self.current_test_suite.evaluators = list(evaluators)
         self.current_test_suite.initialize_with_strategy(self.strategy_class,
                                                          self.tentacles_setup_config,
-                                                         copy.deepcopy(config))
-        no_error = asyncio.run(self.current_test_suite.run_test_suite(self.current_test_suite),
+                                                         octobot_backtesting.ConfigOverlay(config))
+        no_error = asyncio.run(self.current_test_suite.run_test_suite(self.current_test_suite,
+                                                                      self.test_suite_processes_count),
                                debug=constants.OPTIMIZER_FORCE_ASYNCIO_DEBUG_OPTION)
         if not no_error:
             self.errors = self.errors.union(set([str(e) for e in self.current_test_suite.exceptions]))
@@ -290,6 +367,7 @@ class StrategyOptimizer:
     @staticmethod
     def _get_activated_element(all_elements, current_forced_element, nb_elements_to_consider,
                                elem_conf_history, default_element=None, dict_shaped=False):
+        # elem_conf_history is a set of already activated elements frozensets
         eval_conf = {current_forced_element: True}
         additional_elements_count = 0
         if default_element is not None:
@@ -303,17 +381,14 @@ class StrategyOptimizer:
                 if current_elem not in eval_conf:
                     eval_conf[current_elem] = True
                     if len(eval_conf) == nb_elements_to_consider + additional_elements_count and \
-                            ((eval_conf if dict_shaped else sorted([key.value for key in eval_conf]))
-                             in elem_conf_history):
+                            frozenset(eval_conf) in elem_conf_history:
                         eval_conf.pop(current_elem)
                 i += 1
         if len(eval_conf) == nb_elements_to_consider + additional_elements_count:
-            to_use_conf = eval_conf
-            if not dict_shaped:
-                to_use_conf = sorted([key.value for key in eval_conf])
-            if to_use_conf not in elem_conf_history:
-                elem_conf_history.append(to_use_conf)
-                return to_use_conf
+            conf_key = frozenset(eval_conf)
+            if conf_key not in elem_conf_history:
+                elem_conf_history.add(conf_key)
+                return eval_conf if dict_shaped else sorted([key.value for key in eval_conf])
         return None
 
     @staticmethod
@@ -344,3 +419,13 @@ class StrategyOptimizer:
         # Lazy import of tentacles to let tentacles manager handle imports
         import tentacles.Trading.Mode as modes
         return [modes.DailyTradingMode.get_name()]
+
+
+def run_test_suite_in_process(strategy_class, tentacles_setup_config, config, evaluators):
+    test_suite = strategy_optimizer.StrategyTestSuite()
+    test_suite.evaluators = list(evaluators)
+    test_suite.initialize_with_strategy(strategy_class, tentacles_setup_config, config)
+    # configurations are already tested in parallel: run scenarios one after the other
+    asyncio.run(test_suite.run_test_suite(test_suite),
+                debug=constants.OPTIMIZER_FORCE_ASYNCIO_DEBUG_OPTION)
+    return test_suite.get_test_suite_result(), set(str(e) for e in test_suite.exceptions)
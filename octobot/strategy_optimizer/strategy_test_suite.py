@@ -13,7 +13,8 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
-import copy
+import asyncio
+import concurrent.futures
 
 import octobot.api.backtesting as octobot_backtesting_api
 import octobot.strategy_optimizer as octobot_strategy_optimizer
@@ -26,6 +27,8 @@ import octobot_evaluators.constants as evaluator_constants
 
 import octobot_trading.api as trading_api
 
+import octobot_tentacles_manager.api as tentacles_manager_api
+
 
 class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
     # set to True to skip bigger scenarii and make tests faster
@@ -48,23 +51,66 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
                                                           self.evaluators,
                                                           self.strategy_evaluator_class.get_name())
 
-    async def run_test_suite(self, strategy_tester):
+    async def run_test_suite(self, strategy_tester, processes_count=1):
+        """
+        When processes_count is greater than 1, scenarios are run at the same time in a process pool,
+        each scenario being run by a new test suite using this test suite configuration
+        """
         self.exceptions = []
         tests = [self.test_slow_downtrend, self.test_sharp_downtrend, self.test_flat_markets,
                  self.test_slow_uptrend, self.test_sharp_uptrend, self.test_up_then_down]
         print('| ', end='')
-        nb_tests = len(tests)
-        for i, test in enumerate(tests):
+        if processes_count > 1:
+            await self._run_tests_in_processes(tests, min(processes_count, len(tests)))
+        else:
+            nb_tests = len(tests)
+            for i, test in enumerate(tests):
+                try:
+                    await test(strategy_tester)
+                except Exception as e:
+                    self.logger.exception(e, True, f"Exception when running test {test.__name__}: {e}")
+                    self.exceptions.append(e)
+                finally:
+                    self.current_progress = int((i + 1) / nb_tests * 100)
+                print('#', end='')
+        print(' |', end='')
+        return not self.exceptions
+
+    async def _run_tests_in_processes(self, tests, processes_count):
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes_count,
+                initializer=tentacles_manager_api.reload_tentacle_info) as pool:
+            futures = [
+                asyncio.get_event_loop().run_in_executor(
+                    pool,
+                    run_test_in_process,
+                    self.strategy_evaluator_class,
+                    self.tentacles_setup_config,
+                    self.config,
+                    self.evaluators,
+                    test.__name__
+                )
+                for test in tests
+            ]
+            completed_tests = 0
+            for future in asyncio.as_completed(futures):
+                try:
+                    await future
+                except Exception:
+                    # handled when merging results
+                    pass
+                completed_tests += 1
+                self.current_progress = int(completed_tests / len(tests) * 100)
+                print('#', end='')
+        # merge results in scenarios order to keep results identical to sequential runs
+        for test, future in zip(tests, futures):
             try:
-                await test(strategy_tester)
+                profitability_results, trades_counts = future.result()
+                self._profitability_results += profitability_results
+                self._trades_counts += trades_counts
             except Exception as e:
                 self.logger.exception(e, True, f"Exception when running test {test.__name__}: {e}")
                 self.exceptions.append(e)
-            finally:
-                self.current_progress = int((i + 1) / nb_tests * 100)
-            print('#', end='')
-        print(' |', end='')
-        return not self.exceptions
 
     async def test_default_run(self, strategy_tester):
         await strategy_tester.run_test_default_run(None)
@@ -112,7 +158,7 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
     async def _run_backtesting_with_current_config(self, data_file_to_use):
         independent_backtesting = None
         try:
-            config_to_use = copy.deepcopy(self.config)
+            config_to_use = octobot_backtesting.ConfigOverlay(self.config)
             independent_backtesting = octobot_backtesting_api.create_independent_backtesting(
                 config_to_use,
                 self.tentacles_setup_config,
@@ -130,3 +176,11 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
         except Exception as e:
             self.logger.exception(e, True, str(e))
             return independent_backtesting
+
+
+def run_test_in_process(strategy_evaluator_class, tentacles_setup_config, config, evaluators, test_name):
+    test_suite = StrategyTestSuite()
+    test_suite.evaluators = list(evaluators)
+    test_suite.initialize_with_strategy(strategy_evaluator_class, tentacles_setup_config, config)
+    asyncio.run(getattr(test_suite, test_name)(test_suite))
+    return test_suite._profitability_results, test_suite._trades_counts
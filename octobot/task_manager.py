@@ -15,7 +15,6 @@
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import asyncio
 import threading
-import concurrent.futures as thread
 import traceback
 import sys
 
@@ -24,6 +23,7 @@ import octobot_commons.logging as logging
 import octobot_commons.constants as commons_constants
 
 import octobot.constants as constants
+import octobot.executors as executors
 
 
 ASYNC_IGNORED_ERROR_MESSAGES = ["'message': 'Unclosed client session'"]
@@ -45,7 +45,10 @@ class TaskManager:
         self.watcher = None
         self.tools_task_group = None
         self.current_loop_thread = None
+        # executor for blocking I/O calls
         self.executors = None
+        # executor for CPU-heavy calls, None when they should use self.executors
+        self.cpu_executors = None
         self.bot_main_task = None
         self.loop_forever_thread = None
 
@@ -90,7 +93,7 @@ class TaskManager:
 
         stop_coroutines = []
         if stop_octobot:
-            allowed_seconds_to_stop = 10
+            allowed_seconds_to_stop = constants.OCTOBOT_STOP_TIMEOUT + 1
             stop_coroutines.append(self.octobot.stop())
             stop_coroutines.append(stop_timeout(allowed_seconds_to_stop))
 
@@ -115,6 +118,7 @@ class TaskManager:
             except asyncio.exceptions.TimeoutError:
                 self.logger.info(f"Remaining threads: {self._get_remaining_threads()}")
                 sys.exit(-1)
+        self.stop_pool_executors()
         self.async_loop.stop()
         # ensure there is at least one element in the event loop tasks
         # not to block on base_event.py#self._selector.select(timeout) which prevents run_forever() from completing
@@ -133,8 +137,30 @@ class TaskManager:
     def get_name(cls):
         return cls.__name__
 
-    def create_pool_executor(self, workers=2):
-        self.executors = thread.ThreadPoolExecutor(max_workers=workers)
+    def create_pool_executor(self, workers=None, cpu_workers=None):
+        self.executors = executors.InstrumentedThreadPoolExecutor(
+            max_workers=constants.IO_EXECUTOR_WORKERS if workers is None else workers,
+            thread_name_prefix=f"{self.get_name()} I/O executor"
+        )
+        cpu_workers = constants.CPU_EXECUTOR_WORKERS if cpu_workers is None else cpu_workers
+        if cpu_workers > 0:
+            self.cpu_executors = executors.InstrumentedProcessPoolExecutor(max_workers=cpu_workers)
+
+    def stop_pool_executors(self):
+        self.logger.debug(f"Executors metrics: {self.get_executors_metrics()}")
+        for executor in (self.executors, self.cpu_executors):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_executors_metrics(self) -> dict:
+        """
+        :return: the metrics of each executor by executor name (queue depth, saturation, latency, ...)
+        """
+        return {
+            name: executor.metrics.to_dict()
+            for name, executor in (("io", self.executors), ("cpu", self.cpu_executors))
+            if executor is not None
+        }
 
     def _loop_exception_handler(self, loop, context):
         loop_str = "bot main async" if loop is self.async_loop else {loop}
@@ -171,3 +197,9 @@ class TaskManager:
         if self.executors is not None:
             return self.executors.submit(asyncio.run, coroutine).result()
         return asyncio.run(coroutine)
+
+    async def run_in_cpu_executor(self, func, *args):
+        """
+        Run func (picklable when using a CPU executor) outside of the event loop
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.cpu_executors or self.executors, func, *args)
@@ -0,0 +1,86 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+"""
+Per-phase backtesting benchmark on the bundled tests/static data files.
+Usage: python -m tests.benchmarks.backtesting_benchmark --output results.json [--baseline baseline.json]
+Exits with 1 when a phase regressed compared to the baseline.
+"""
+import argparse
+import asyncio
+import os.path as path
+import sys
+
+from octobot_commons.tests.test_config import load_test_config
+
+import octobot.backtesting as backtesting
+from octobot.backtesting.abstract_backtesting_test import TEST_DATA_FILES_FOLDER
+from tests.test_utils.config import load_test_tentacles_config
+
+BTC_USDT_2018 = path.join(TEST_DATA_FILES_FOLDER, "AbstractExchangeHistoryCollector_1586017993.616272.data")
+ADA_USDT_2020 = path.join(TEST_DATA_FILES_FOLDER, "ExchangeHistoryDataCollector_1587769859.9278197.data")
+ADA_BTC_2020 = path.join(TEST_DATA_FILES_FOLDER, "ExchangeHistoryDataCollector_1588110698.1060486.data")
+
+SCENARIOS = {
+    "single_data_file": [BTC_USDT_2018],
+    "synchronized_data_files": [ADA_BTC_2020, ADA_USDT_2020],
+    "data_files_with_gap": [BTC_USDT_2018, ADA_BTC_2020],
+}
+
+
+async def run_benchmark(output, baseline, repetitions, tolerance, measure_memory, enable_storage):
+    benchmark = backtesting.BacktestingBenchmark(
+        load_test_config(),
+        load_test_tentacles_config(),
+        SCENARIOS,
+        data_file_path="",
+        repetitions=repetitions,
+        measure_memory=measure_memory,
+        enable_storage=enable_storage,
+    )
+    results = await benchmark.run()
+    backtesting.BacktestingBenchmark.save(results, output)
+    print(f"Benchmark results saved into {output}")
+    if baseline is None:
+        return 0
+    regressions = backtesting.BacktestingBenchmark.get_regressions(
+        results, backtesting.BacktestingBenchmark.load(baseline), tolerance
+    )
+    for regression in regressions:
+        print(
+            f"Regression: {regression['scenario']} {regression['phase']} {regression['metric']}: "
+            f"{regression['value']} (baseline: {regression['baseline']})"
+        )
+    return 1 if regressions else 0
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="OctoBot backtesting benchmark")
+    parser.add_argument("-o", "--output", help="Results file path.", default="backtesting_benchmark.json")
+    parser.add_argument("-b", "--baseline", help="Baseline results file path to compare results with.")
+    parser.add_argument("-r", "--repetitions", help="Runs of each scenario.", type=int, default=3)
+    parser.add_argument("-t", "--tolerance", help="Relative increase from baseline considered as a regression.",
+                        type=float, default=backtesting.BacktestingBenchmark.DEFAULT_TOLERANCE)
+    parser.add_argument("--no-memory", help="Skip peak memory measurement.", action="store_true")
+    parser.add_argument("--enable-storage", help="Store backtesting runs data.", action="store_true")
+    parsed_args = parser.parse_args(args)
+    return asyncio.run(run_benchmark(
+        parsed_args.output, parsed_args.baseline, parsed_args.repetitions, parsed_args.tolerance,
+        not parsed_args.no_memory, parsed_args.enable_storage
+    ))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
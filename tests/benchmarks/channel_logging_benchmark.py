@@ -0,0 +1,121 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+"""
+Market data channels throughput according to the channel loggers configuration.
+Usage: python -m tests.benchmarks.channel_logging_benchmark [--updates 100000]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import mock
+
+import async_channel.channels as channels
+import async_channel.consumer as consumers
+import async_channel.producer as producers
+
+import octobot_commons.channels_name as channels_name
+import octobot_commons.logging as common_logging
+
+import octobot.constants as constants
+import octobot.logger as logger
+
+CANDLE = [1588110698, 9000.1, 9100.2, 8900.3, 9050.4, 123.456]
+BENCHMARKED_CHANNELS = {
+    channels_name.OctoBotTradingChannelsName.TICKER_CHANNEL.value: {
+        "ticker": {"symbol": "BTC/USDT", "close": 9050.4, "baseVolume": 123.456}
+    },
+    channels_name.OctoBotTradingChannelsName.ORDER_BOOK_CHANNEL.value: {
+        "asks": [[9051, 1]] * 50, "bids": [[9049, 1]] * 50
+    },
+    channels_name.OctoBotTradingChannelsName.RECENT_TRADES_CHANNEL.value: {
+        "recent_trades": [{"price": 9050.4, "amount": 0.1}] * 50
+    },
+    channels_name.OctoBotTradingChannelsName.KLINE_CHANNEL.value: {"time_frame": "1m", "kline": CANDLE},
+    channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value: {"time_frame": "1m", "candle": CANDLE},
+}
+# scenario name: channel logger level, market data channels logs min interval
+SCENARIOS = {
+    "info_level": (logging.INFO, 0),
+    "debug_level": (logging.DEBUG, 0),
+    "debug_level_rate_limited": (logging.DEBUG, 1),
+}
+
+
+class _BenchmarkChannel(channels.Channel):
+    CONSUMER_CLASS = consumers.Consumer
+    PRODUCER_CLASS = producers.Producer
+
+    def __init__(self):
+        super().__init__()
+        self.is_synchronized = True
+
+
+async def _trading_callback(**_):
+    pass
+
+
+async def run_scenario(updates, level, min_interval):
+    exchange_channels = {channel_name: _BenchmarkChannel() for channel_name in BENCHMARKED_CHANNELS}
+    for channel in exchange_channels.values():
+        # the consumer any channel update is produced for
+        await channel.new_consumer(_trading_callback)
+    logger.BOT_CHANNEL_LOGGER = common_logging.get_logger("OctoBot Channel Benchmark")
+    logger.BOT_CHANNEL_LOGGER.logger.setLevel(level)
+    logger.BOT_CHANNEL_LOGGER.logger.propagate = False
+    for channel_name in BENCHMARKED_CHANNELS:
+        logger.set_channel_logs_min_interval(channel_name, min_interval)
+    with mock.patch.object(constants, "ENV_TRADING_ENABLE_DEBUG_LOGS", True), \
+            mock.patch.object(logger.exchanges_channel, "get_chan",
+                              lambda channel_name, _: exchange_channels.get(channel_name, _BenchmarkChannel())):
+        await logger.init_exchange_chan_logger("exchange_id")
+    channel_producers = []
+    for channel_name, data in BENCHMARKED_CHANNELS.items():
+        channel_producers.append((
+            producers.Producer(exchange_channels[channel_name]),
+            {"exchange": "binance", "exchange_id": "exchange_id",
+             "cryptocurrency": "Bitcoin", "symbol": "BTC/USDT", **data}
+        ))
+    start = time.perf_counter()
+    for index in range(updates):
+        producer, kwargs = channel_producers[index % len(channel_producers)]
+        await producer.send(kwargs)
+        await producer.synchronized_perform_consumers_queue(logger.LOGGER_PRIORITY_LEVEL, False, 0)
+    duration = time.perf_counter() - start
+    return {
+        "subscribed_consumers": sum(len(channel.consumers) for channel in exchange_channels.values()),
+        "updates_per_second": round(updates / duration),
+    }
+
+
+async def run_benchmark(updates):
+    for scenario, (level, min_interval) in SCENARIOS.items():
+        result = await run_scenario(updates, level, min_interval)
+        print(f"{scenario}: {result['updates_per_second']} updates/s "
+              f"({result['subscribed_consumers']} subscribed consumers)")
+    return 0
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="OctoBot channel logging benchmark")
+    parser.add_argument("-u", "--updates", help="Market data updates to send.", type=int, default=100000)
+    parsed_args = parser.parse_args(args)
+    return asyncio.run(run_benchmark(parsed_args.updates))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
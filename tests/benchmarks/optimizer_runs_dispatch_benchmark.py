@@ -0,0 +1,74 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+"""
+Strategy design optimizer runs dispatch throughput depending on the processes count.
+Usage: python -m tests.benchmarks.optimizer_runs_dispatch_benchmark [--runs 200] [--run-duration 0.005]
+"""
+import argparse
+import asyncio
+import sys
+
+import octobot_trading.api as trading_api
+import octobot_tentacles_manager.api as tentacles_manager_api
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+import tentacles.Evaluator.Strategies as Strategies
+import tentacles.Evaluator.TA as Evaluator
+import tentacles.Trading.Mode as Mode
+
+from tests.unit_tests.strategy_optimizer import get_short_runs, dispatch_short_runs
+
+
+def _create_optimizer():
+    tentacles_setup_config = tentacles_manager_api.create_tentacles_setup_config_with_tentacles(
+        Mode.DailyTradingMode,
+        Strategies.SimpleStrategyEvaluator,
+        Evaluator.RSIMomentumEvaluator,
+        Evaluator.DoubleMovingAverageTrendEvaluator
+    )
+    trading_mode = trading_api.get_activated_trading_mode(tentacles_setup_config)
+    return strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+
+
+async def run_benchmark(runs_count, run_duration):
+    optimizer = _create_optimizer()
+    runs = get_short_runs(runs_count)
+    runs_per_second_by_processes_count = {}
+    for processes_count in (1, 2, 4):
+        executed_runs, start_time = await dispatch_short_runs(optimizer, runs, processes_count, run_duration)
+        if len(executed_runs) != runs_count:
+            raise AssertionError(f"{len(executed_runs)} executed runs instead of {runs_count}")
+        runs_per_second_by_processes_count[processes_count] = \
+            runs_count / (max(end_time for _, _, end_time in executed_runs) - start_time)
+        print(f"{processes_count} processes: {round(runs_per_second_by_processes_count[processes_count], 1)} "
+              f"runs per second")
+    # runs are not synchronized on a shared lock: more processes means more runs per second
+    if runs_per_second_by_processes_count[4] <= runs_per_second_by_processes_count[1]:
+        print("Warning: 4 processes are not dispatching more runs per second than 1 process")
+    return 0
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="OctoBot strategy optimizer runs dispatch benchmark")
+    parser.add_argument("-r", "--runs", help="Count of dispatched runs.", type=int, default=200)
+    parser.add_argument("-d", "--run-duration", help="Duration of each run in seconds.", type=float, default=0.005)
+    parsed_args = parser.parse_args(args)
+    return asyncio.run(run_benchmark(parsed_args.runs, parsed_args.run_duration))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
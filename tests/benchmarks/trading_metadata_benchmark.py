@@ -0,0 +1,75 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+"""
+Backtesting run metrics computation duration compared to the trading API coefficients of determination.
+Usage: python -m tests.benchmarks.trading_metadata_benchmark [--trades 100000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import octobot_trading.api as trading_api
+
+import octobot.storage.trading_metadata as trading_metadata
+
+from tests.unit_tests.storage import create_exchange_manager
+
+
+async def _get_reference_coefficients_of_determination(exchange_manager):
+    # reference draw down is not computed: it is quadratic on the trades count
+    return (
+        await trading_api.get_coefficient_of_determination(exchange_manager, use_high_instead_of_end_balance=False),
+        await trading_api.get_coefficient_of_determination(exchange_manager, use_high_instead_of_end_balance=True),
+    )
+
+
+async def run_scenario(trades, is_future):
+    exchange_manager = create_exchange_manager(trades, is_future)
+    start = time.perf_counter()
+    metrics = await trading_metadata._get_exchange_metrics(exchange_manager)
+    metrics_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    r_sq_end_balance, _ = await _get_reference_coefficients_of_determination(exchange_manager)
+    reference_duration = time.perf_counter() - start
+    if metrics.r_sq_end_balance != r_sq_end_balance:
+        raise AssertionError(f"Invalid coefficient of determination: {metrics.r_sq_end_balance} "
+                             f"instead of {r_sq_end_balance}")
+    return {
+        "trades_count": metrics.trades_count,
+        "metrics_duration": round(metrics_duration, 3),
+        "reference_duration": round(reference_duration, 3),
+    }
+
+
+async def run_benchmark(trades):
+    for is_future in (False, True):
+        result = await run_scenario(trades, is_future)
+        print(f"{'future' if is_future else 'spot'}: {result['trades_count']} trades metrics in "
+              f"{result['metrics_duration']}s (trading API coefficients of determination: "
+              f"{result['reference_duration']}s)")
+    return 0
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="OctoBot backtesting run metrics benchmark")
+    parser.add_argument("-t", "--trades", help="Trades count of the benchmarked runs.", type=int, default=100000)
+    parsed_args = parser.parse_args(args)
+    return asyncio.run(run_benchmark(parsed_args.trades))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import mock
+import pytest
+
+import octobot.backtesting as backtesting
+import octobot.storage as storage
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_run():
+    configs_by_tentacle = [{"TM": {"period": 1}}, {"TM": {"period": 2}}, {"TM": {"period": 3}}]
+    config = {"key": "value"}
+    created_backtestings = []
+
+    def _create_backtesting(backtesting_config, _, __, **kwargs):
+        independent_backtesting = mock.Mock(
+            initialize_and_run=mock.AsyncMock(
+                side_effect=RuntimeError if kwargs["config_by_tentacle"]["TM"]["period"] == 2 else None
+            ),
+            join_backtesting_updater=mock.AsyncMock(),
+            get_dict_formatted_report=mock.AsyncMock(return_value=kwargs["config_by_tentacle"]["TM"]),
+            stop=mock.AsyncMock(),
+            config=backtesting_config,
+            kwargs=kwargs,
+        )
+        created_backtestings.append(independent_backtesting)
+        return independent_backtesting
+
+    batch = backtesting.BacktestingBatch(config, None, ["data_file.data"], configs_by_tentacle)
+    with mock.patch.object(backtesting.SharedCandlesBacktestData, "initialize", mock.AsyncMock()) \
+            as initialize_mock, \
+            mock.patch.object(backtesting.SharedCandlesBacktestData, "stop", mock.AsyncMock()) as stop_mock, \
+            mock.patch.object(backtesting.independent_backtesting, "IndependentBacktesting",
+                              mock.Mock(side_effect=_create_backtesting)), \
+            mock.patch.object(storage, "enforce_total_databases_max_size", mock.AsyncMock()) \
+            as enforce_total_databases_max_size_mock:
+        assert await batch.run() == [{"period": 1}, None, {"period": 3}]
+        # data files are imported once for every backtesting
+        initialize_mock.assert_awaited_once()
+        stop_mock.assert_awaited_once()
+        enforce_total_databases_max_size_mock.assert_awaited_once()
+    assert batch.backtesting_data is None
+    assert len(created_backtestings) == 3
+    for independent_backtesting in created_backtestings:
+        assert independent_backtesting.config == config
+        assert independent_backtesting.config is not config
+        assert isinstance(independent_backtesting.kwargs["backtesting_data"], backtesting.SharedCandlesBacktestData)
+        assert independent_backtesting.kwargs["enforce_total_databases_max_size_after_run"] is False
+        independent_backtesting.stop.assert_awaited_once()
+    assert len(set(
+        id(independent_backtesting.kwargs["backtesting_data"]) for independent_backtesting in created_backtestings
+    )) == 1
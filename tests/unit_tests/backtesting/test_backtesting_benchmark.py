@@ -0,0 +1,139 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import tracemalloc
+
+import mock
+import pytest
+
+import octobot.backtesting as backtesting
+import octobot.backtesting.backtesting_benchmark as backtesting_benchmark
+import octobot.backtesting.phases_profiler as phases_profiler
+
+
+def test_phases_profiler():
+    profiler = backtesting.PhasesProfiler()
+    with profiler.profile("phase_1"):
+        sum(range(100000))
+    with pytest.raises(RuntimeError):
+        with profiler.profile("failed_phase"):
+            raise RuntimeError
+    tracemalloc.start()
+    try:
+        with profiler.profile("phase_2"):
+            allocated = [0] * 100000
+    finally:
+        tracemalloc.stop()
+    assert list(profiler.phases) == ["phase_1", "failed_phase", "phase_2"]
+    assert profiler.phases["phase_1"][phases_profiler.WALL_TIME] > 0
+    assert profiler.phases["phase_1"][phases_profiler.CPU_TIME] > 0
+    assert profiler.phases["phase_1"][phases_profiler.PEAK_MEMORY] is None
+    assert profiler.phases["phase_2"][phases_profiler.PEAK_MEMORY] >= len(allocated) * 4
+    assert list(profiler.get_wall_times()) == ["phase_1", "failed_phase", "phase_2"]
+
+
+@pytest.mark.asyncio
+async def test_run():
+    created_backtestings = []
+
+    async def _join_backtesting_updater(_):
+        await asyncio.sleep(0.01)
+
+    def _create_backtesting(config, tentacles_setup_config, data_files, data_file_path, **kwargs):
+        wall_time = len(created_backtestings) + 1
+        independent_backtesting = mock.Mock(
+            initialize_and_run=mock.AsyncMock(),
+            join_backtesting_updater=mock.AsyncMock(side_effect=_join_backtesting_updater),
+            stop=mock.AsyncMock(),
+            get_phases_profile=mock.Mock(return_value={
+                "init_matrix": {
+                    phases_profiler.WALL_TIME: wall_time,
+                    phases_profiler.CPU_TIME: wall_time / 2,
+                    phases_profiler.PEAK_MEMORY: 1000 if tracemalloc.is_tracing() else None,
+                }
+            }),
+            data_files=data_files,
+            kwargs=kwargs,
+        )
+        created_backtestings.append(independent_backtesting)
+        return independent_backtesting
+
+    benchmark = backtesting.BacktestingBenchmark(
+        {}, mock.Mock(), {"scenario": ["file_1", "file_2"]}, data_file_path="", repetitions=3
+    )
+    with mock.patch.object(backtesting_benchmark.independent_backtesting_import, "IndependentBacktesting",
+                           mock.Mock(side_effect=_create_backtesting)):
+        results = await benchmark.run()
+    # 3 repetitions and the memory measurement run
+    assert len(created_backtestings) == 4
+    for independent_backtesting in created_backtestings:
+        independent_backtesting.stop.assert_awaited_once()
+        assert independent_backtesting.data_files == ["file_1", "file_2"]
+        assert independent_backtesting.kwargs["enable_logs"] is False
+        assert independent_backtesting.kwargs["enforce_total_databases_max_size_after_run"] is False
+    assert not tracemalloc.is_tracing()
+    phases = results["scenarios"]["scenario"]["phases"]
+    assert list(phases) == ["init_matrix", "simulation", "stop"]
+    # median of the 3 repetitions
+    assert phases["init_matrix"] == {
+        phases_profiler.WALL_TIME: 2,
+        phases_profiler.CPU_TIME: 1,
+        phases_profiler.PEAK_MEMORY: 1000,
+    }
+    assert phases["simulation"][phases_profiler.WALL_TIME] >= 0.01
+    assert phases["simulation"][phases_profiler.PEAK_MEMORY] is not None
+    assert results["scenarios"]["scenario"]["data_files"] == ["file_1", "file_2"]
+    assert results["version"] == backtesting.BacktestingBenchmark.FORMAT_VERSION
+
+
+def test_get_regressions():
+    baseline = {"scenarios": {
+        "scenario": {"phases": {
+            "init_matrix": {phases_profiler.WALL_TIME: 1, phases_profiler.CPU_TIME: 1,
+                            phases_profiler.PEAK_MEMORY: None},
+            "simulation": {phases_profiler.WALL_TIME: 10, phases_profiler.CPU_TIME: 0.01,
+                           phases_profiler.PEAK_MEMORY: 10 * 1024 * 1024},
+            "removed_phase": {phases_profiler.WALL_TIME: 1},
+        }},
+        "removed_scenario": {"phases": {"init_matrix": {phases_profiler.WALL_TIME: 1}}},
+    }}
+    results = {"scenarios": {
+        "scenario": {"phases": {
+            "init_matrix": {phases_profiler.WALL_TIME: 1.5, phases_profiler.CPU_TIME: 1.1,
+                            phases_profiler.PEAK_MEMORY: 10},
+            # cpu time increase is too small to be a regression
+            "simulation": {phases_profiler.WALL_TIME: 9, phases_profiler.CPU_TIME: 0.02,
+                           phases_profiler.PEAK_MEMORY: 20 * 1024 * 1024},
+        }},
+    }}
+    assert backtesting.BacktestingBenchmark.get_regressions(results, baseline) == [
+        {"scenario": "scenario", "phase": "init_matrix", "metric": phases_profiler.WALL_TIME,
+         "value": 1.5, "baseline": 1},
+        {"scenario": "scenario", "phase": "simulation", "metric": phases_profiler.PEAK_MEMORY,
+         "value": 20 * 1024 * 1024, "baseline": 10 * 1024 * 1024},
+    ]
+    assert backtesting.BacktestingBenchmark.get_regressions(results, baseline, tolerance=0.6) == [
+        {"scenario": "scenario", "phase": "simulation", "metric": phases_profiler.PEAK_MEMORY,
+         "value": 20 * 1024 * 1024, "baseline": 10 * 1024 * 1024},
+    ]
+    assert backtesting.BacktestingBenchmark.get_regressions(results, results) == []
+
+
+def test_save_and_load(tmp_path):
+    results = {"version": 1, "scenarios": {"scenario": {"phases": {"stop": {phases_profiler.WALL_TIME: 1.2}}}}}
+    file_path = str(tmp_path / "results.json")
+    backtesting.BacktestingBenchmark.save(results, file_path)
+    assert backtesting.BacktestingBenchmark.load(file_path) == results
@@ -0,0 +1,150 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+
+import mock
+import pytest
+
+import octobot.backtesting as backtesting
+import octobot_backtesting.data as backtesting_data
+import octobot_backtesting.enums as backtesting_enums
+import octobot_commons.constants as commons_constants
+import octobot_trading.api as trading_api
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class _ExchangeBuilder:
+    def __init__(self, exchange_name, build_durations, built_exchanges, error=None):
+        self.exchange_name = exchange_name
+        self.exchange_manager = mock.Mock(id=f"{exchange_name}_id")
+        self.build_durations = build_durations
+        self.built_exchanges = built_exchanges
+        self.error = error
+
+    def __getattr__(self, _):
+        # builder configuration methods
+        return lambda *_, **__: self
+
+    async def build(self):
+        await asyncio.sleep(self.build_durations[self.exchange_name])
+        self.built_exchanges.append(self.exchange_name)
+        if self.error is not None:
+            raise self.error
+        return self.exchange_manager
+
+
+def _create_backtesting(symbols_by_exchange):
+    octobot_backtesting = backtesting.OctoBotBacktesting({}, None, symbols_by_exchange, [], True)
+    octobot_backtesting.exchange_type_by_exchange = {
+        exchange: commons_constants.CONFIG_EXCHANGE_SPOT for exchange in symbols_by_exchange
+    }
+    return octobot_backtesting
+
+
+async def test_init_exchanges():
+    octobot_backtesting = _create_backtesting({"binance": [], "kucoin": [], "okx": []})
+    build_durations = {"binance": 0.3, "kucoin": 0.1, "okx": 0.2}
+    built_exchanges = []
+    with mock.patch.object(trading_api, "create_exchange_builder",
+                           mock.Mock(side_effect=lambda _, name: _ExchangeBuilder(name, build_durations,
+                                                                                  built_exchanges))), \
+            mock.patch.object(trading_api, "get_exchange_manager_id",
+                              mock.Mock(side_effect=lambda exchange_manager: exchange_manager.id)):
+        await octobot_backtesting._init_exchanges()
+    # exchanges are built concurrently
+    assert built_exchanges == ["kucoin", "okx", "binance"]
+    # ids are registered in exchanges order
+    assert octobot_backtesting.exchange_manager_ids == ["binance_id", "kucoin_id", "okx_id"]
+
+
+async def test_init_exchanges_with_error():
+    octobot_backtesting = _create_backtesting({"binance": [], "kucoin": []})
+    build_durations = {"binance": 0, "kucoin": 0}
+    built_exchanges = []
+    with mock.patch.object(trading_api, "create_exchange_builder",
+                           mock.Mock(side_effect=lambda _, name: _ExchangeBuilder(
+                               name, build_durations, built_exchanges,
+                               error=RuntimeError(name) if name == "binance" else None
+                           ))), \
+            mock.patch.object(trading_api, "get_exchange_manager_id",
+                              mock.Mock(side_effect=lambda exchange_manager: exchange_manager.id)):
+        with pytest.raises(RuntimeError, match="binance"):
+            await octobot_backtesting._init_exchanges()
+    # ids are saved even when an exchange can't be built
+    assert octobot_backtesting.exchange_manager_ids == ["binance_id", "kucoin_id"]
+
+
+async def test_register_available_data():
+    descriptions = {
+        "1.data": {
+            backtesting_enums.DataFormatKeys.EXCHANGE.value: "binance",
+            backtesting_enums.DataFormatKeys.SYMBOLS.value: ["BTC/USDT"],
+        },
+        "2.data": {
+            backtesting_enums.DataFormatKeys.EXCHANGE.value: "kucoin",
+            backtesting_enums.DataFormatKeys.SYMBOLS.value: ["ETH/USDT"],
+        },
+        "3.data": {
+            backtesting_enums.DataFormatKeys.EXCHANGE.value: "binance",
+            backtesting_enums.DataFormatKeys.SYMBOLS.value: ["ETH/USDT", "SOL/USDT"],
+        },
+    }
+
+    async def _get_file_description(data_file_path):
+        data_file = data_file_path.split("/")[-1]
+        # first files are the slowest to read
+        await asyncio.sleep(0.1 * (len(descriptions) - int(data_file[0])))
+        return descriptions[data_file]
+
+    independent_backtesting = backtesting.IndependentBacktesting(_get_config(), None, list(descriptions))
+    with mock.patch.object(backtesting_data, "get_file_description",
+                           mock.Mock(side_effect=_get_file_description)):
+        await independent_backtesting._register_available_data()
+    assert {
+        exchange: [str(symbol) for symbol in symbols]
+        for exchange, symbols in independent_backtesting.symbols_to_create_exchange_classes.items()
+    } == {
+        "binance": ["BTC/USDT", "ETH/USDT", "SOL/USDT"],
+        "kucoin": ["ETH/USDT"],
+    }
+    assert list(independent_backtesting.symbols_to_create_exchange_classes) == ["binance", "kucoin"]
+
+    # missing data file
+    independent_backtesting = backtesting.IndependentBacktesting(_get_config(), None, list(descriptions))
+    with mock.patch.object(backtesting_data, "get_file_description", mock.AsyncMock(return_value=None)):
+        with pytest.raises(RuntimeError):
+            await independent_backtesting._register_available_data()
+
+
+async def test_run_phase():
+    octobot_backtesting = _create_backtesting({})
+    assert await octobot_backtesting._run_phase("phase", asyncio.sleep(0.1, result=1)) == 1
+    with pytest.raises(RuntimeError):
+        await octobot_backtesting._run_phase("failed_phase", mock.AsyncMock(side_effect=RuntimeError)())
+    assert list(octobot_backtesting.phases_duration) == ["phase", "failed_phase"]
+    assert 0.1 <= octobot_backtesting.phases_duration["phase"] < 1
+
+
+def _get_config():
+    return {
+        commons_constants.CONFIG_TRADING: {commons_constants.CONFIG_TRADER_RISK: 0.5},
+        commons_constants.CONFIG_SIMULATOR: {
+            commons_constants.CONFIG_STARTING_PORTFOLIO: {},
+            commons_constants.CONFIG_SIMULATOR_FEES: {},
+        },
+    }
@@ -0,0 +1,117 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import copy
+import pickle
+import time
+
+import pytest
+
+import octobot.backtesting as backtesting
+import octobot_commons.constants as commons_constants
+import octobot_commons.symbols.symbol_util as symbol_util
+
+
+def _get_config():
+    return {
+        commons_constants.CONFIG_EXCHANGES: {
+            "binance": {
+                commons_constants.CONFIG_ENABLED_OPTION: True,
+                commons_constants.CONFIG_EXCHANGE_KEY: "key",
+                commons_constants.CONFIG_EXCHANGE_SECRET: "secret",
+            },
+        },
+        commons_constants.CONFIG_TRADING: {commons_constants.CONFIG_TRADER_RISK: 0.5},
+        commons_constants.CONFIG_SIMULATOR: {
+            commons_constants.CONFIG_STARTING_PORTFOLIO: {"USDT": 1000},
+            commons_constants.CONFIG_SIMULATOR_FEES: {},
+        },
+        "time_frames": ["1h", "4h"],
+    }
+
+
+def test_read():
+    config = _get_config()
+    overlay = backtesting.ConfigOverlay(config)
+    assert overlay[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] == 0.5
+    assert overlay.get("missing") is None
+    assert "time_frames" in overlay
+    assert list(overlay) == list(config)
+    assert len(overlay) == len(config)
+    assert overlay.to_dict() == config
+    with pytest.raises(KeyError):
+        overlay["missing"]
+
+
+def test_write():
+    config = _get_config()
+    origin_config = copy.deepcopy(config)
+    overlay = backtesting.ConfigOverlay(config)
+    overlay[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] = 1
+    overlay[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_STARTING_PORTFOLIO]["BTC"] = 1
+    overlay[commons_constants.CONFIG_EXCHANGES]["binance"].pop(commons_constants.CONFIG_EXCHANGE_KEY)
+    overlay["time_frames"].append("1d")
+    overlay["new_key"] = "value"
+    del overlay[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES]
+    # base config is untouched
+    assert config == origin_config
+    assert overlay[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] == 1
+    assert overlay[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_STARTING_PORTFOLIO] == \
+        {"USDT": 1000, "BTC": 1}
+    assert commons_constants.CONFIG_EXCHANGE_KEY not in overlay[commons_constants.CONFIG_EXCHANGES]["binance"]
+    assert overlay["time_frames"] == ["1h", "4h", "1d"]
+    assert list(overlay) == list(config) + ["new_key"]
+    assert commons_constants.CONFIG_SIMULATOR_FEES not in overlay[commons_constants.CONFIG_SIMULATOR]
+    with pytest.raises(KeyError):
+        del overlay[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES]
+    overlay[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES] = {"taker": 1}
+    assert overlay[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES] == {"taker": 1}
+
+
+def test_copy():
+    overlay = backtesting.ConfigOverlay(_get_config())
+    overlay["new_key"] = {"value": 1}
+    for copied_config in (copy.deepcopy(overlay), overlay.to_dict()):
+        assert type(copied_config) is dict
+        assert type(copied_config[commons_constants.CONFIG_EXCHANGES]["binance"]) is dict
+        assert copied_config == {**_get_config(), "new_key": {"value": 1}}
+    assert pickle.loads(pickle.dumps(overlay)).to_dict() == overlay.to_dict()
+
+
+def test_independent_backtesting_config():
+    config = _get_config()
+    origin_config = copy.deepcopy(config)
+    independent_backtesting = backtesting.IndependentBacktesting(backtesting.ConfigOverlay(config), None, [])
+    independent_backtesting.symbols_to_create_exchange_classes["binance"] = [
+        symbol_util.parse_symbol("BTC/USDT")
+    ]
+    independent_backtesting._adapt_config()
+    backtesting_config = independent_backtesting.backtesting_config
+    assert type(backtesting_config[commons_constants.CONFIG_EXCHANGES]["binance"]) is dict
+    assert commons_constants.CONFIG_EXCHANGE_KEY not in backtesting_config[commons_constants.CONFIG_EXCHANGES]["binance"]
+    assert type(backtesting_config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_STARTING_PORTFOLIO]) \
+        is dict
+    assert config == origin_config
+
+
+def test_creation_duration():
+    config = {
+        f"key_{i}": {f"nested_{j}": {"values": list(range(10))} for j in range(100)}
+        for i in range(100)
+    }
+    t0 = time.time()
+    for _ in range(100):
+        backtesting.ConfigOverlay(config)[commons_constants.CONFIG_TRADING] = {}
+    assert time.time() - t0 < 0.01
@@ -0,0 +1,144 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import tracemalloc
+import weakref
+
+import mock
+import pytest
+
+import octobot_trading.exchanges as exchanges
+import octobot.backtesting as backtesting
+import octobot.backtesting.objects_tracker as objects_tracker
+
+
+class _Element:
+    # tracemalloc can't find allocation sites of instances with a managed __dict__ on python 3.11
+    __slots__ = ("cycle", "__weakref__")
+
+    def __init__(self):
+        self.cycle = self
+
+
+def test_get_alive_objects():
+    tracker = objects_tracker.ObjectsTracker()
+    element_1 = _Element()
+    element_2 = _Element()
+    element_3 = _Element()
+    tracker.track(_Element, element_1, element_2)
+    tracker.track(dict, element_3)
+    assert tracker.get_alive_objects() == {_Element: [element_1, element_2], dict: [element_3]}
+    # reference cycles are garbage collected
+    element_1 = element_3 = None
+    assert tracker.get_alive_objects() == {_Element: [element_2]}
+    element_2 = None
+    assert tracker.get_alive_objects() == {}
+    young_element = _Element()
+    tracker.track(_Element, young_element)
+    young_element = None
+    with mock.patch.object(objects_tracker.gc, "collect", mock.Mock(wraps=objects_tracker.gc.collect)) as collect_mock:
+        assert tracker.get_alive_objects() == {}
+        # young cycles are collected without a full collection
+        collect_mock.assert_called_once_with(0)
+        # no remaining object: garbage collector is not called
+        assert tracker.get_alive_objects() == {}
+        collect_mock.assert_called_once_with(0)
+
+
+def test_get_allocation_site():
+    assert objects_tracker.get_allocation_site(_Element()) == "unknown (tracemalloc is not tracing)"
+    tracemalloc.start()
+    try:
+        element = _Element()
+    finally:
+        tracemalloc.stop()
+    tracemalloc.start()
+    try:
+        assert objects_tracker.get_allocation_site(element) == "unknown"
+        element = _Element()
+        assert __file__ in objects_tracker.get_allocation_site(element)
+    finally:
+        tracemalloc.stop()
+
+
+def test_get_allocations_diff():
+    tracker = objects_tracker.ObjectsTracker()
+    tracker.take_snapshot()
+    assert tracker.get_allocations_diff() == []
+    tracemalloc.start()
+    try:
+        tracker.take_snapshot()
+        elements = [_Element() for _ in range(1000)]
+        allocations_diff = tracker.get_allocations_diff(limit=3)
+        assert len(allocations_diff) == 3
+        assert any(__file__ in str(allocation_diff) for allocation_diff in allocations_diff)
+    finally:
+        tracemalloc.stop()
+    assert len(elements) == 1000
+
+
+def test_memory_leak_checkup():
+    octobot_backtesting = backtesting.OctoBotBacktesting({}, None, {}, [], True)
+    element = _Element()
+    references = [weakref.ref(element), weakref.ref(_Element())]
+    with pytest.raises(AssertionError, match="Remaining references on the _Element element"):
+        octobot_backtesting.memory_leak_checkup(references)
+    element = None
+    octobot_backtesting.memory_leak_checkup(references)
+
+
+def test_check_remaining_objects():
+    octobot_backtesting = backtesting.OctoBotBacktesting({}, None, {}, [], True)
+    octobot_backtesting.exchange_manager_ids = ["exchange_id"]
+    tracker = objects_tracker.ObjectsTracker()
+    simulators = [_Element(), _Element()]
+    with mock.patch.object(backtesting.OctoBotBacktesting, "OBJECTS_TRACKER", tracker):
+        tracker.track(exchanges.ExchangeSimulator, *simulators)
+        # 2 exchange managers are allowed
+        tracker.track(exchanges.ExchangeManager, *simulators)
+        with pytest.raises(AssertionError, match="too many remaining ExchangeSimulator instances: expected: 1 actual 2"):
+            octobot_backtesting.check_remaining_objects()
+        simulators.pop()
+        octobot_backtesting.check_remaining_objects()
+
+
+def test_track_forgets_garbage_collected_objects():
+    tracker = objects_tracker.ObjectsTracker()
+    for _ in range(100):
+        tracker.track(_Element, _Element(), _Element())
+        # cycles are only collected by the garbage collector
+        objects_tracker.gc.collect(0)
+    # references to garbage collected objects are removed without calling get_alive_objects
+    assert len(tracker._references_by_type[_Element]) == 2
+    element = _Element()
+    tracker.track(_Element, element)
+    assert tracker.get_alive_objects() == {_Element: [element]}
+
+
+@pytest.mark.asyncio
+async def test_stop_tracks_objects_on_memory_check_only():
+    octobot_backtesting = backtesting.OctoBotBacktesting({}, None, {}, [], True)
+    octobot_backtesting.backtesting = mock.Mock()
+    with mock.patch.object(backtesting.octobot_backtesting.trading_api, "get_exchange_managers_from_exchange_ids",
+                           mock.Mock(return_value=[])), \
+            mock.patch.object(backtesting.octobot_backtesting.backtesting_api, "stop_backtesting", mock.AsyncMock()), \
+            mock.patch.object(octobot_backtesting, "stop_importers", mock.AsyncMock()), \
+            mock.patch.object(octobot_backtesting, "_track_exchange_objects", mock.Mock()) \
+            as _track_exchange_objects_mock:
+        await octobot_backtesting.stop()
+        _track_exchange_objects_mock.assert_not_called()
+        octobot_backtesting.backtesting = mock.Mock()
+        await octobot_backtesting.stop(memory_check=True)
+        _track_exchange_objects_mock.assert_called_once_with([])
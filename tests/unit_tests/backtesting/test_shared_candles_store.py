@@ -0,0 +1,138 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import os
+import time
+
+import mock
+import numpy
+import pytest
+
+import octobot.backtesting as backtesting
+import octobot_commons.enums as commons_enums
+
+EXCHANGE = "binance"
+SYMBOL = "BTC/USDT"
+TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
+
+
+def _get_candles(count):
+    candles = []
+    for index in range(count):
+        candle = [0] * len(commons_enums.PriceIndexes)
+        candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = 3600 * index
+        candle[commons_enums.PriceIndexes.IND_PRICE_OPEN.value] = index + 1
+        candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value] = index + 3
+        candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value] = index
+        candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] = index + 2
+        candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value] = index * 10
+        candles.append(candle)
+    return candles
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    data_file_path = os.path.join(tmp_path, "data_file.data")
+    with open(data_file_path, "w") as file:
+        file.write("data")
+    return data_file_path
+
+
+def test_store_and_get_candles(tmp_path, data_file):
+    store = backtesting.SharedCandlesStore(os.path.join(tmp_path, "store"))
+    assert store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1000) is None
+    stored_candles = store.store_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1000, _get_candles(10))
+    candles = store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1000)
+    for candles_array in (stored_candles, candles):
+        assert isinstance(candles_array, numpy.memmap)
+        assert not candles_array.flags.writeable
+        assert candles_array.shape == (len(store.CANDLES_VALUES), 10)
+        assert candles_array[0].tolist() == [3600 * index for index in range(10)]
+        assert candles_array[4].tolist() == [index + 2 for index in range(10)]
+    # other time window
+    assert store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 2000) is None
+    # updated data file
+    with open(data_file, "a") as file:
+        file.write("new data")
+    assert store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1000) is None
+    # no temporary file left
+    assert all(file_name.endswith(store.STORE_FILE_EXT) for file_name in os.listdir(store.folder))
+    store.clear()
+    assert os.listdir(store.folder) == []
+
+
+def test_store_empty_candles(tmp_path, data_file):
+    store = backtesting.SharedCandlesStore(os.path.join(tmp_path, "store"))
+    candles = store.store_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1000, [])
+    assert candles.shape == (len(store.CANDLES_VALUES), 0)
+    assert store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1000) is None
+
+
+@pytest.mark.asyncio
+async def test_get_preloaded_candles_manager(tmp_path, data_file):
+    store = backtesting.SharedCandlesStore(os.path.join(tmp_path, "store"))
+    importer = mock.Mock(
+        exchange_name=EXCHANGE, symbols=[SYMBOL],
+        adapt_file_path_if_necessary=mock.Mock(return_value=data_file),
+        get_ohlcv_from_timestamps=mock.AsyncMock(return_value=[[0, candle] for candle in _get_candles(10)])
+    )
+    backtesting_data_1 = backtesting.SharedCandlesBacktestData([data_file], {}, None, True, candles_store=store)
+    backtesting_data_2 = backtesting.SharedCandlesBacktestData([data_file], {}, None, True, candles_store=store)
+    for backtesting_data in (backtesting_data_1, backtesting_data_2):
+        backtesting_data.importers_by_data_file = {data_file: importer}
+    candles_manager = await backtesting_data_1.get_preloaded_candles_manager(EXCHANGE, SYMBOL, TIME_FRAME, 0, 18000)
+    assert await backtesting_data_1.get_preloaded_candles_manager(EXCHANGE, SYMBOL, TIME_FRAME, 0, 18000) \
+        is candles_manager
+    # candles are read from the data file once
+    other_candles_manager = \
+        await backtesting_data_2.get_preloaded_candles_manager(EXCHANGE, SYMBOL, TIME_FRAME, 0, 18000)
+    importer.get_ohlcv_from_timestamps.assert_awaited_once()
+    for manager in (candles_manager, other_candles_manager):
+        assert manager.candles_initialized
+        assert manager.get_preloaded_symbol_candles_count() == 6
+        assert manager.get_preloaded_symbol_close_candles().tolist() == [2, 3, 4, 5, 6, 7]
+        assert manager.get_preloaded_symbol_time_candles().tolist() == [3600 * index for index in range(6)]
+        # candles arrays are memory-mapped
+        assert isinstance(manager.get_preloaded_symbol_volume_candles().base, numpy.memmap)
+    candles_manager.add_old_and_new_candles(_get_candles(3))
+    assert candles_manager.get_symbol_close_candles().tolist() == [2, 3]
+
+
+def test_prune(tmp_path, data_file):
+    store = backtesting.SharedCandlesStore(os.path.join(tmp_path, "store"), max_size=None, max_age=100)
+    store.store_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1, _get_candles(10))
+    # max_size is reached with 3 files
+    store.max_size = os.path.getsize(store._get_path(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1)) * 3
+    now = time.time()
+    for end_timestamp in range(1, 4):
+        store.store_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, end_timestamp, _get_candles(10))
+        last_used_time = now - 50 + end_timestamp
+        os.utime(store._get_path(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, end_timestamp),
+                 (last_used_time, last_used_time))
+    assert len(os.listdir(store.folder)) == 3
+    # recently used file
+    assert store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 1) is not None
+    # least recently used file is removed
+    store.store_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 4, _get_candles(10))
+    assert [
+        store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, end_timestamp) is not None
+        for end_timestamp in range(1, 5)
+    ] == [True, False, True, True]
+    # expired file
+    expired_time = now - 200
+    os.utime(store._get_path(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 3), (expired_time, expired_time))
+    assert store.prune() == 1
+    assert store.get_candles(data_file, EXCHANGE, SYMBOL, TIME_FRAME, 0, 3) is None
+    assert store.prune() == 0
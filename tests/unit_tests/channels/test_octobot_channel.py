@@ -0,0 +1,97 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import pytest
+
+import octobot.channels as octobot_channels
+
+pytestmark = pytest.mark.asyncio
+
+BOT_ID = "bot_id"
+
+
+def _create_channel():
+    channel = octobot_channels.OctoBotChannel(BOT_ID)
+    producer = octobot_channels.OctoBotChannelProducer(channel)
+    return channel, producer
+
+
+async def test_concurrent_consumer():
+    channel, producer = _create_channel()
+    running = []
+    max_running = []
+
+    async def callback(bot_id, subject, action, data):
+        running.append(data)
+        max_running.append(len(running))
+        await asyncio.sleep(0.1)
+        running.remove(data)
+
+    consumer = await channel.new_consumer(callback, bot_id=BOT_ID, concurrent=True)
+    assert isinstance(consumer, octobot_channels.OctoBotChannelConcurrentConsumer)
+    for i in range(3):
+        await producer.send(BOT_ID, "subject", "action", data=i)
+    await asyncio.sleep(0.05)
+    assert len(consumer.perform_tasks) == 3
+    await asyncio.sleep(0.1)
+    assert max(max_running) == 3
+    assert consumer.perform_tasks == set()
+    await producer.send(BOT_ID, "subject", "action", data=3)
+    await asyncio.sleep(0.01)
+    # pending performs are cancelled
+    await channel.remove_consumer(consumer)
+    assert consumer.perform_tasks == set()
+    assert running == [3]
+
+
+async def test_get_filtered_consumers_cache():
+    channel, _ = _create_channel()
+
+    async def callback(**_):
+        pass
+
+    update_consumer = await channel.new_consumer(callback, bot_id=BOT_ID, subject="update")
+    assert channel.get_filtered_consumers(BOT_ID, "update", "action") == [update_consumer]
+    assert channel.get_filtered_consumers(BOT_ID, "update", "action") \
+           is channel.get_filtered_consumers(BOT_ID, "update", "action")
+    assert channel.get_filtered_consumers(BOT_ID, "creation", "action") == []
+    # cache is reset on consumers update
+    wildcard_consumer = await channel.new_consumer(callback, bot_id=BOT_ID)
+    assert channel.get_filtered_consumers(BOT_ID, "update", "action") == [update_consumer, wildcard_consumer]
+    assert channel.get_filtered_consumers(BOT_ID, "creation", "action") == [wildcard_consumer]
+    await channel.remove_consumer(update_consumer)
+    assert channel.get_filtered_consumers(BOT_ID, "update", "action") == [wildcard_consumer]
+    await channel.remove_consumer(wildcard_consumer)
+    assert channel.get_filtered_consumers(BOT_ID, "update", "action") == []
+
+
+async def test_send_batch():
+    channel, producer = _create_channel()
+    received = []
+
+    async def callback(bot_id, subject, action, data):
+        received.append((subject, action, data))
+
+    consumer = await channel.new_consumer(callback, bot_id=BOT_ID, action="action")
+    await producer.send_batch(BOT_ID, "subject", "action", [1, 2, 3])
+    await producer.send_batch(BOT_ID, "subject", "other_action", [4, 5])
+    await producer.send_batch(BOT_ID, "subject", "action", [])
+    await producer.send(BOT_ID, "subject", "action", 6)
+    await asyncio.sleep(0.01)
+    assert received == [
+        ("subject", "action", 1), ("subject", "action", 2), ("subject", "action", 3), ("subject", "action", 6)
+    ]
+    await channel.remove_consumer(consumer)
@@ -0,0 +1,79 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import decimal
+import random
+
+import mock
+
+import octobot_trading.enums as trading_enums
+import octobot_trading.personal_data as trading_personal_data
+
+
+def _create_trade(status, side, exchange_trade_type, reduce_only):
+    return mock.Mock(status=status, side=side, exchange_trade_type=exchange_trade_type, reduce_only=reduce_only)
+
+
+def create_exchange_manager(trades_count, is_future, seed=0):
+    randomizer = random.Random(seed)
+    trades = {
+        str(index): _create_trade(
+            randomizer.choice((trading_enums.OrderStatus.FILLED, trading_enums.OrderStatus.FILLED,
+                               trading_enums.OrderStatus.CANCELED)),
+            randomizer.choice((trading_enums.TradeOrderSide.BUY, trading_enums.TradeOrderSide.SELL)),
+            randomizer.choice((trading_enums.TradeOrderType.LIMIT, trading_enums.TradeOrderType.STOP_LOSS)),
+            randomizer.random() < 0.6,
+        )
+        for index in range(trades_count)
+    }
+    transactions = {}
+    for index in range(trades_count):
+        if index % 2:
+            transaction = trading_personal_data.FeeTransaction(
+                "binance", 1000 + index, trading_enums.TransactionType.TRADING_FEE, "USDT", "BTC/USDT",
+                decimal.Decimal(str(round(-randomizer.random(), 4)))
+            )
+        else:
+            transaction = trading_personal_data.RealisedPnlTransaction(
+                "binance", 1000 + index, trading_enums.TransactionType.CLOSE_REALISED_PNL, "USDT", "BTC/USDT",
+                decimal.Decimal(str(round(randomizer.random() * 10 - 4, 4))),
+                None, None, None, None, None, None, None, None, None
+            )
+        transactions[transaction.transaction_id] = transaction
+    portfolio_manager = mock.Mock(
+        reference_market="USDT",
+        portfolio_profitability=mock.Mock(
+            profitability=decimal.Decimal("12.5"), profitability_percent=decimal.Decimal("1.25"),
+            profitability_diff=0, market_profitability_percent=0, initial_portfolio_current_profitability=0,
+        ),
+        portfolio_value_holder=mock.Mock(
+            origin_portfolio=mock.Mock(portfolio={
+                "USDT": trading_personal_data.SpotAsset("USDT", decimal.Decimal(1000), decimal.Decimal(1000))
+            })
+        )
+    )
+    trades_manager = mock.Mock(trades=trades, get_trades=mock.Mock(return_value=list(trades.values())))
+    return mock.Mock(
+        is_future=is_future,
+        exchange_config=mock.Mock(traded_symbol_pairs=["BTC/USDT"]),
+        exchange_personal_data=mock.Mock(
+            portfolio_manager=portfolio_manager,
+            trades_manager=trades_manager,
+            transactions_manager=mock.Mock(transactions=transactions),
+            positions_manager=mock.Mock(get_symbol_position=mock.Mock(return_value=mock.Mock(
+                symbol_contract=mock.Mock(is_inverse_contract=mock.Mock(return_value=False))
+            )))
+        )
+    )
@@ -0,0 +1,235 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import concurrent.futures
+import os
+import time
+
+import mock
+import pytest
+
+import octobot.storage as storage
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+RUN_DB = "run_data.json"
+
+
+def _create_run(root, backtesting_id, size, last_modified_time):
+    run_folder = os.path.join(root, "TM", "campaign", "backtesting", f"backtesting_{backtesting_id}")
+    os.makedirs(os.path.join(run_folder, "binance"))
+    for file_path, file_size in ((os.path.join(run_folder, RUN_DB), size // 2),
+                                 (os.path.join(run_folder, "binance", "trades.json"), size - size // 2)):
+        with open(file_path, "wb") as file:
+            file.write(b"0" * file_size)
+        os.utime(file_path, (last_modified_time, last_modified_time))
+    return run_folder
+
+
+def _create_pruner(root, max_size, size_index, max_index_age=None):
+    run_databases_identifier = mock.Mock(
+        database_adaptor=mock.Mock(is_file_system_based=mock.Mock(return_value=True)),
+        data_path=str(root),
+        get_db_full_name=mock.Mock(return_value=RUN_DB),
+    )
+    return storage.IndexedRunDatabasesPruner(run_databases_identifier, max_size, size_index,
+                                             max_index_age=max_index_age)
+
+
+async def test_index_journal(tmp_path):
+    size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    assert not size_index.exists()
+    run_1 = _create_run(str(tmp_path), 1, 100, 1000)
+    run_2 = _create_run(str(tmp_path), 2, 50, 2000)
+    size_index.add_run_folder(run_1)
+    size_index.add_run_folder(run_2)
+    assert size_index.exists()
+    assert size_index.total_size == 150
+    assert size_index.runs == {run_1: (100, 1000), run_2: (50, 2000)}
+
+    # updates from other processes are read on refresh
+    other_size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    other_size_index.refresh()
+    assert other_size_index.runs == size_index.runs
+    other_size_index.remove_run_folders([run_1])
+    with open(size_index.journal_path, "a") as journal:
+        # entry being written
+        journal.write('["incomplete')
+    size_index.refresh()
+    assert size_index.runs == {run_2: (50, 2000)}
+    assert size_index.total_size == 50
+
+    # indexing an already indexed run replaces it
+    size_index.add_run_folder(run_2)
+    assert size_index.total_size == 50
+    assert [db_data.identifier for db_data in size_index.get_oldest_db_data()] == [run_2]
+
+
+async def test_index_compaction(tmp_path):
+    size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    other_size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    run_1 = _create_run(str(tmp_path), 1, 100, 1000)
+    run_2 = _create_run(str(tmp_path), 2, 50, 2000)
+    with mock.patch.object(storage.RunDatabasesSizeIndex, "COMPACTION_MIN_ENTRIES", 2):
+        size_index.add_run_folder(run_1)
+        size_index.add_run_folder(run_2)
+        other_size_index.refresh()
+        size_index.remove_run_folders([run_1])
+    with open(size_index.journal_path) as journal:
+        # journal id and remaining run
+        assert len(journal.read().splitlines()) == 2
+    assert size_index.runs == {run_2: (50, 2000)}
+    # compacted journal is fully read again
+    other_size_index.refresh()
+    assert other_size_index.runs == {run_2: (50, 2000)}
+    assert other_size_index.total_size == 50
+
+
+def _add_and_remove_runs_in_process(root, process_index, runs_count):
+    storage.RunDatabasesSizeIndex.COMPACTION_MIN_ENTRIES = 10
+    size_index = storage.RunDatabasesSizeIndex(root)
+    for run_index in range(runs_count):
+        run_folder = os.path.join(root, f"run_{process_index}_{run_index}")
+        size_index._append([[run_folder, 1, run_index]])
+        if run_index % 2:
+            # triggers compactions
+            size_index.remove_run_folders([run_folder])
+
+
+async def test_index_compaction_with_concurrent_updates(tmp_path):
+    processes_count = 4
+    runs_count = 200
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes_count) as pool:
+        for future in [
+            pool.submit(_add_and_remove_runs_in_process, str(tmp_path), process_index, runs_count)
+            for process_index in range(processes_count)
+        ]:
+            future.result()
+    size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    size_index.refresh()
+    # no update is lost by compactions
+    assert sorted(size_index.runs) == sorted(
+        os.path.join(str(tmp_path), f"run_{process_index}_{run_index}")
+        for process_index in range(processes_count)
+        for run_index in range(0, runs_count, 2)
+    )
+    assert size_index.total_size == processes_count * runs_count // 2
+
+
+async def test_pruner(tmp_path):
+    run_folders = [
+        _create_run(str(tmp_path), backtesting_id, 100, 1000 * backtesting_id)
+        for backtesting_id in (3, 1, 2)
+    ]
+    size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    pruner = _create_pruner(tmp_path, 250, size_index)
+    with mock.patch.object(pruner, "_update_backtesting_runs_metadata", mock.AsyncMock()) \
+            as _update_backtesting_runs_metadata_mock:
+        # first exploration builds the index
+        await pruner.explore()
+        assert size_index.total_size == 300
+        assert list(size_index.runs) == [run_folders[1], run_folders[2], run_folders[0]]
+        await pruner.prune_oldest_run_databases()
+        _update_backtesting_runs_metadata_mock.assert_awaited_once()
+    assert not os.path.exists(run_folders[1])
+    assert os.path.exists(run_folders[2])
+    assert size_index.total_size == 200
+
+    run_4 = _create_run(str(tmp_path), 4, 100, 4000)
+    storage.RunDatabasesSizeIndex(str(tmp_path)).add_run_folder(run_4)
+    # deleted outside of the pruner
+    os.remove(os.path.join(run_folders[2], RUN_DB))
+    os.remove(os.path.join(run_folders[2], "binance", "trades.json"))
+    os.removedirs(os.path.join(run_folders[2], "binance"))
+    pruner = _create_pruner(tmp_path, 150, size_index)
+    with mock.patch.object(pruner, "_update_backtesting_runs_metadata", mock.AsyncMock()):
+        with mock.patch.object(storage.IndexedRunDatabasesPruner, "_explore_databases", mock.AsyncMock()) \
+                as _explore_databases_mock:
+            await pruner.explore()
+            # stored runs are not explored again
+            _explore_databases_mock.assert_not_awaited()
+        run_5 = _create_run(str(tmp_path), 5, 10, 5000)
+        await pruner.prune_oldest_run_databases()
+    assert not os.path.exists(run_folders[0])
+    assert os.path.exists(run_4)
+    # a missing run folder has been found: the index is rebuilt from the stored runs, including unindexed ones
+    assert size_index.runs == {run_4: (100, 4000), run_5: (10, 5000)}
+    assert not pruner.has_missing_run_folders
+
+
+async def test_pruner_rebuilds_outdated_index(tmp_path):
+    run_1 = _create_run(str(tmp_path), 1, 100, 1000)
+    size_index = storage.RunDatabasesSizeIndex(str(tmp_path))
+    pruner = _create_pruner(tmp_path, 1000, size_index)
+    await pruner.explore()
+    assert size_index.runs == {run_1: (100, 1000)}
+    reset_time = size_index.reset_time
+    assert reset_time is not None
+    # not indexed
+    run_2 = _create_run(str(tmp_path), 2, 50, 2000)
+    with mock.patch.object(storage.RunDatabasesSizeIndex, "COMPACTION_MIN_ENTRIES", 1):
+        storage.RunDatabasesSizeIndex(str(tmp_path)).remove_run_folders(["other"])
+    # reset time is kept on compactions
+    size_index.refresh()
+    assert size_index.reset_time == reset_time
+    await _create_pruner(tmp_path, 1000, size_index).explore()
+    # no max index age
+    assert size_index.runs == {run_1: (100, 1000)}
+    pruner = _create_pruner(tmp_path, 1000, size_index, max_index_age=10)
+    await pruner.explore()
+    assert size_index.runs == {run_1: (100, 1000)}
+    with mock.patch.object(time, "time", mock.Mock(return_value=reset_time + 11)):
+        await pruner.explore()
+    assert size_index.runs == {run_1: (100, 1000), run_2: (50, 2000)}
+    assert size_index.reset_time == reset_time + 11
+
+
+async def test_register_run_databases(tmp_path):
+    run_folder = _create_run(str(tmp_path), 1, 100, 1000)
+    run_databases_identifier = mock.Mock(
+        database_adaptor=mock.Mock(is_file_system_based=mock.Mock(return_value=True)),
+        data_path=str(tmp_path),
+        get_backtesting_run_folder=mock.Mock(return_value=run_folder),
+    )
+    size_index = storage.db_databases_pruning._get_size_index(str(tmp_path))
+    # not indexed when the index is not created yet
+    storage.register_run_databases(run_databases_identifier)
+    assert not size_index.exists()
+    size_index.reset([])
+    storage.register_run_databases(run_databases_identifier)
+    assert size_index.runs == {run_folder: (100, 1000)}
+
+
+async def test_remove_run_databases(tmp_path):
+    run_1 = _create_run(str(tmp_path), 1, 100, 1000)
+    run_2 = _create_run(str(tmp_path), 2, 50, 2000)
+    size_index = storage.db_databases_pruning._get_size_index(str(tmp_path))
+    size_index.reset([])
+    size_index.add_run_folder(run_1)
+    size_index.add_run_folder(run_2)
+    run_databases_identifier = mock.Mock(
+        database_adaptor=mock.Mock(is_file_system_based=mock.Mock(return_value=True)),
+        data_path=str(tmp_path),
+        get_backtesting_run_folder=mock.Mock(return_value=run_1),
+    )
+    storage.remove_run_databases(run_databases_identifier)
+    run_databases_identifier.remove_all.assert_called_once_with()
+    assert size_index.runs == {run_2: (50, 2000)}
+    # removing a campaign removes each of its runs
+    run_databases_identifier.get_backtesting_run_folder.return_value = os.path.join(str(tmp_path), "TM", "campaign")
+    storage.remove_run_databases(run_databases_identifier)
+    assert size_index.runs == {}
+    assert size_index.total_size == 0
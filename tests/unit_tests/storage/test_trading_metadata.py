@@ -0,0 +1,96 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import mock
+import pytest
+
+import octobot_trading.api as trading_api
+import octobot_trading.enums as trading_enums
+import octobot.storage.trading_metadata as trading_metadata
+
+from tests.unit_tests.storage import create_exchange_manager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def _assert_metrics_equal_reference_metrics(exchange_manager, metrics):
+    assert metrics.profitability == 12.5
+    assert metrics.profitability_percent == 1.25
+    trades = trading_api.get_trade_history(exchange_manager, include_cancelled=False)
+    assert metrics.trades_count == len(trades)
+    assert metrics.entries_count == len([
+        trade
+        for trade in trades
+        if trade.status is trading_enums.OrderStatus.FILLED and trade.side is trading_enums.TradeOrderSide.BUY
+    ])
+    assert round(metrics.win_rate * 100, 3) == round(float(trading_api.get_win_rate(exchange_manager) * 100), 3)
+    assert metrics.r_sq_end_balance == await trading_api.get_coefficient_of_determination(
+        exchange_manager, use_high_instead_of_end_balance=False
+    )
+    assert metrics.r_sq_max_balance == await trading_api.get_coefficient_of_determination(
+        exchange_manager, use_high_instead_of_end_balance=True
+    )
+
+
+async def test_get_exchange_metrics_spot():
+    exchange_manager = create_exchange_manager(500, False)
+    metrics = await trading_metadata._get_exchange_metrics(exchange_manager)
+    await _assert_metrics_equal_reference_metrics(exchange_manager, metrics)
+    assert 0 < metrics.win_rate < 1
+    assert 0 < metrics.r_sq_max_balance <= 1
+    assert metrics.draw_down == 0
+
+
+async def test_get_exchange_metrics_future():
+    exchange_manager = create_exchange_manager(500, True)
+    metrics = await trading_metadata._get_exchange_metrics(exchange_manager)
+    await _assert_metrics_equal_reference_metrics(exchange_manager, metrics)
+    assert 0 < metrics.draw_down
+    assert round(metrics.draw_down, 3) == round(float(trading_api.get_draw_down(exchange_manager)), 3)
+
+
+async def test_get_exchange_metrics_without_trades():
+    exchange_manager = create_exchange_manager(0, True)
+    metrics = await trading_metadata._get_exchange_metrics(exchange_manager)
+    await _assert_metrics_equal_reference_metrics(exchange_manager, metrics)
+    assert metrics.trades_count == metrics.entries_count == 0
+    assert metrics.win_rate == metrics.draw_down == 0
+    assert metrics.r_sq_end_balance == metrics.r_sq_max_balance == 0
+
+
+async def test_get_exchange_metrics_without_reference_market_in_origin_portfolio():
+    exchange_manager = create_exchange_manager(10, True)
+    exchange_manager.exchange_personal_data.portfolio_manager.reference_market = "BUSD"
+    metrics = await trading_metadata._get_exchange_metrics(exchange_manager)
+    assert metrics.draw_down == 0
+    assert metrics.r_sq_end_balance is metrics.r_sq_max_balance is None
+    assert trading_metadata._get_coefficient_of_determination([metrics], True) is None
+
+
+async def test_update_markets_profitability():
+    exchange_manager_1 = mock.Mock()
+    exchange_manager_2 = mock.Mock()
+    markets_profitability = {}
+    with mock.patch.object(trading_api, "get_trading_pairs",
+                           mock.Mock(side_effect=[["BTC/USDT", "ETH/USDT"], ["BTC/USDT"]])), \
+         mock.patch.object(trading_metadata.backtesting.IndependentBacktesting, "get_market_delta",
+                           mock.Mock(side_effect=[0.1, ValueError])) as get_market_delta_mock:
+        trading_metadata._update_markets_profitability(markets_profitability, exchange_manager_1, "1h")
+        trading_metadata._update_markets_profitability(markets_profitability, exchange_manager_2, "1h")
+        # already computed BTC/USDT is not computed again
+        assert get_market_delta_mock.call_count == 2
+    assert markets_profitability == {"BTC/USDT": 0.1}
+
@@ -13,6 +13,12 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import concurrent.futures
+import ctypes
+import multiprocessing
+import time
+
 import pytest_asyncio
 
 import octobot.strategy_optimizer as strategy_optimizer
@@ -20,6 +26,7 @@ import octobot_trading.api as trading_api
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_commons.enums as commons_enums
 import octobot_commons.constants as commons_constants
+import octobot_commons.multiprocessing_util as multiprocessing_util
 import octobot_evaluators.constants as evaluators_constants
 
 import tentacles.Evaluator.Strategies as Strategies
@@ -176,6 +183,66 @@ MOCKED_RUNS = [
 
 
 EXPECTED_RUNS_FROM_MOCK = {
-    index + 6: val  # index + 6 as the first 5 runs have been filtered
+    index: val  # filtered runs are skipped
     for index, val in enumerate(MOCKED_RUNS)
 }
+
+
+def _run_short_runs_in_process(optimizer, optimizer_id, run_data_by_hash, run_duration):
+    run_queues = multiprocessing_util.get_shared_element(optimizer.SHARED_RUNS_QUEUES_KEY)[optimizer_id]
+
+    async def _run_short_runs():
+        executed_runs = []
+        try:
+            while True:
+                run_hash, _ = await optimizer._pick_run(run_queues[optimizer.START_QUEUE_KEY], run_data_by_hash)
+                backtesting_id = await optimizer._get_next_backtesting_id(optimizer_id, None)
+                time.sleep(run_duration)
+                executed_runs.append((run_hash, backtesting_id, time.time()))
+        except strategy_optimizer.strategy_design_optimizer.NoMoreRunError:
+            return executed_runs
+    return asyncio.run(_run_short_runs())
+
+
+def get_short_runs(runs_count):
+    return {
+        index: [{
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_USER_INPUT: "period_length",
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_TENTACLE: ["RSIMomentumEvaluator"],
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE: index,
+        }]
+        for index in range(runs_count)
+    }
+
+
+async def dispatch_short_runs(optimizer, runs, processes_count, run_duration):
+    """
+    Picks the given runs from processes_count processes, each run lasting run_duration seconds
+    :return: the executed (run hash, backtesting id, end time) and the dispatch start time
+    """
+    run_data_by_hash = optimizer._get_optimizer_runs_details_and_hashes(runs)
+    run_queues = await optimizer._create_run_queues(1, runs)
+    shared_elements = {
+        optimizer.SHARED_RUNS_QUEUES_KEY: {1: run_queues},
+        optimizer.SHARED_NEXT_BACKTESTING_IDS_KEY: {1: multiprocessing.Value(ctypes.c_int, 1)},
+    }
+    start_time = time.time()
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes_count,
+            initializer=multiprocessing_util.register_lock_and_shared_elements,
+            initargs=(commons_enums.MultiprocessingLocks.DBLock.value, multiprocessing.RLock(),
+                      shared_elements)) as pool:
+        executed_runs_by_process = await asyncio.gather(*(
+            asyncio.get_event_loop().run_in_executor(
+                pool, _run_short_runs_in_process, optimizer, 1, run_data_by_hash, run_duration
+            )
+            for _ in range(processes_count)
+        ))
+    for run_queue in run_queues.values():
+        run_queue.close()
+        run_queue.cancel_join_thread()
+    return [
+        executed_run
+        for executed_runs in executed_runs_by_process
+        for executed_run in executed_runs
+    ], start_time
@@ -0,0 +1,71 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import os
+import time
+
+import pytest
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    # store cache files in a temporary folder
+    monkeypatch.chdir(tmp_path)
+    return strategy_optimizer.RunResultsCache("DailyTradingMode", max_entries=3, max_age=100)
+
+
+async def test_get_and_store(cache):
+    cache_key = "a" * 64
+    assert await cache.get(cache_key) is None
+    await cache.store(cache_key, {"gains": 1}, "run_folder")
+    assert await cache.get(cache_key) == {
+        strategy_optimizer.RunResultsCache.RUN_METADATA: {"gains": 1},
+        strategy_optimizer.RunResultsCache.RUN_FOLDER: "run_folder",
+    }
+    assert (cache.hits, cache.misses) == (1, 1)
+    # one file per result, in a folder named after the first characters of the key
+    assert cache.get_cache_file_path(cache_key) == \
+        os.path.join(cache.get_cache_folder(), "aa", f"{cache_key}.json")
+    assert os.listdir(os.path.dirname(cache.get_cache_file_path(cache_key))) == [f"{cache_key}.json"]
+
+
+async def test_get_expired_result(cache):
+    cache_key = "b" * 64
+    await cache.store(cache_key, {"gains": 1}, "run_folder")
+    old_time = time.time() - 200
+    os.utime(cache.get_cache_file_path(cache_key), (old_time, old_time))
+    assert await cache.get(cache_key) is None
+
+
+async def test_evict(cache):
+    cache_keys = [f"{index}" * 64 for index in range(5)]
+    for index, cache_key in enumerate(cache_keys):
+        await cache.store(cache_key, {"gains": index}, "run_folder")
+        last_used_time = time.time() - 50 + index
+        os.utime(cache.get_cache_file_path(cache_key), (last_used_time, last_used_time))
+    # expired entry
+    expired_time = time.time() - 200
+    os.utime(cache.get_cache_file_path(cache_keys[4]), (expired_time, expired_time))
+    # recently used entry
+    assert await cache.get(cache_keys[0]) is not None
+    # remove the expired entry and the least recently used ones
+    assert cache.evict() == 2
+    assert [await cache.get(cache_key) is not None for cache_key in cache_keys] == [True, False, True, True, False]
+    assert cache.evict() == 0
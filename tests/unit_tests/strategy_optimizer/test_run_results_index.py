@@ -0,0 +1,123 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import random
+import time
+
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot_commons.enums as commons_enums
+
+SIGNATURE = (("RSIMomentumEvaluator", "period_length"), ("DailyTradingMode", "target_profits"))
+
+
+def _get_full_result(period_length, target_profits, run_id=0):
+    return {
+        commons_enums.BacktestingMetadata.ID.value: run_id,
+        commons_enums.BacktestingMetadata.USER_INPUTS.value: {
+            "RSIMomentumEvaluator": {"period_length": period_length, "trend_change_identifier": 2},
+            "DailyTradingMode": {"target_profits": target_profits},
+        }
+    }
+
+
+def test_get_most_recent():
+    index = strategy_optimizer.RunResultsIndex()
+    results = [_get_full_result(10, [1, 2], 1), _get_full_result(20, [1, 2], 2), _get_full_result(10, [1, 2], 3)]
+    index.update(results)
+    # most recent result is used
+    assert index.get_most_recent(SIGNATURE, (10, [1, 2])) == (2, results[2])
+    assert index.get_most_recent(SIGNATURE, (20, [1, 2])) == (1, results[1])
+    assert index.get_most_recent(SIGNATURE, (20, [1, 3])) is None
+    # subset of user inputs
+    assert index.get_most_recent(SIGNATURE[:1], (20, )) == (1, results[1])
+    # unknown user input
+    assert index.get_most_recent((("RSIMomentumEvaluator", "other"), ), (20, )) is None
+
+
+def test_update():
+    index = strategy_optimizer.RunResultsIndex()
+    results = [_get_full_result(10, 1, 1)]
+    index.update(results)
+    assert index.get_most_recent(SIGNATURE, (10, 1)) == (0, results[0])
+    assert index.get_most_recent(SIGNATURE, (20, 1)) is None
+    # new results are indexed
+    results += [_get_full_result(20, 1, 2), _get_full_result(10, 1, 3)]
+    index.update(results)
+    assert len(index.full_results) == 3
+    assert index.get_most_recent(SIGNATURE, (10, 1)) == (2, results[2])
+    assert index.get_most_recent(SIGNATURE, (20, 1)) == (1, results[1])
+    # reset database
+    results = [_get_full_result(30, 1, 1)]
+    index.update(results)
+    assert index.full_results == results
+    assert index.get_most_recent(SIGNATURE, (10, 1)) is None
+    assert index.get_most_recent(SIGNATURE, (30, 1)) == (0, results[0])
+
+
+def test_get_from_run_results():
+    optimizer = strategy_optimizer.StrategyDesignOptimizer.__new__(strategy_optimizer.StrategyDesignOptimizer)
+    rng = random.Random(42)
+    results = [_get_full_result(rng.randint(0, 50), rng.randint(0, 50), run_id) for run_id in range(2000)]
+    runs = {
+        run_id: [
+            {
+                optimizer.CONFIG_TENTACLE: [tentacle], optimizer.CONFIG_USER_INPUT: user_input,
+                optimizer.CONFIG_VALUE: rng.randint(0, 50)
+            }
+            for tentacle, user_input in SIGNATURE
+        ]
+        for run_id in range(1000)
+    }
+    index = strategy_optimizer.RunResultsIndex()
+    index.update(results)
+    t0 = time.time()
+    found_results = list(optimizer._get_from_run_results(runs, index))
+    assert time.time() - t0 < 1
+    assert found_results
+    for run_data, full_result in found_results:
+        user_inputs = full_result[commons_enums.BacktestingMetadata.USER_INPUTS.value]
+        assert all(
+            user_inputs[user_input[optimizer.CONFIG_TENTACLE][0]][user_input[optimizer.CONFIG_USER_INPUT]]
+            == user_input[optimizer.CONFIG_VALUE]
+            for user_input in run_data
+        )
+    # yielded from the most recent result
+    yielded_ids = [full_result[commons_enums.BacktestingMetadata.ID.value] for _, full_result in found_results]
+    assert yielded_ids == sorted(yielded_ids, reverse=True)
+
+
+def test_get_from_run_results_from_min_backtesting_id():
+    optimizer = strategy_optimizer.StrategyDesignOptimizer.__new__(strategy_optimizer.StrategyDesignOptimizer)
+    runs = {
+        run_id: [
+            {
+                optimizer.CONFIG_TENTACLE: [tentacle], optimizer.CONFIG_USER_INPUT: user_input,
+                optimizer.CONFIG_VALUE: value
+            }
+            for (tentacle, user_input), value in zip(SIGNATURE, values)
+        ]
+        for run_id, values in enumerate(((10, 1), (20, 1)))
+    }
+    index = strategy_optimizer.RunResultsIndex()
+    # (20, 1) failed in the 2nd round of runs, started at backtesting id 3
+    index.update([_get_full_result(10, 1, 1), _get_full_result(20, 1, 2), _get_full_result(10, 1, 3)])
+    assert [
+        full_result[commons_enums.BacktestingMetadata.ID.value]
+        for _, full_result in optimizer._get_from_run_results(runs, index)
+    ] == [3, 2]
+    assert [
+        full_result[commons_enums.BacktestingMetadata.ID.value]
+        for _, full_result in optimizer._get_from_run_results(runs, index, min_backtesting_id=3)
+    ] == [3]
@@ -0,0 +1,197 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import copy
+import random
+import time
+
+import octobot.enums as enums
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot_commons.enums as commons_enums
+
+
+def _get_full_results(count, seed=42):
+    rng = random.Random(seed)
+    full_results = []
+    for _ in range(count):
+        full_result = {}
+        # some results are missing values
+        if rng.random() > 0.05:
+            full_result[commons_enums.BacktestingMetadata.PERCENT_GAINS.value] = round(rng.uniform(-50, 50), 1)
+        if rng.random() > 0.05:
+            full_result[commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value] = \
+                round(rng.uniform(-1, 1), 2)
+        if rng.random() > 0.05:
+            full_result[commons_enums.BacktestingMetadata.TRADES.value] = rng.randint(0, 5)
+        full_results.append(full_result)
+    return full_results
+
+
+def _rank_one_by_one(optimizer_settings, full_results):
+    scored_results = [strategy_optimizer.ScoredRunResult(full_result, []) for full_result in full_results]
+    for fitness_parameter in optimizer_settings.fitness_parameters:
+        for scored_result in scored_results:
+            fitness_parameter.update_ratio(scored_result.full_result)
+    eligible_indexes = []
+    for index, scored_result in enumerate(scored_results):
+        scored_result.compute_score(optimizer_settings.fitness_parameters)
+        is_excluded = False
+        for exclude_filter in optimizer_settings.exclude_filters:
+            result_filter = copy.copy(exclude_filter)
+            try:
+                result_filter.load_values(scored_result.full_result)
+            except KeyError:
+                continue
+            is_excluded = is_excluded or result_filter.is_filtered()
+        if not is_excluded:
+            eligible_indexes.append(index)
+    return sorted(eligible_indexes, key=lambda index: scored_results[index].score, reverse=True), \
+        [scored_result.score for scored_result in scored_results]
+
+
+def test_rank_as_one_by_one_scoring():
+    full_results = _get_full_results(2000)
+    for filters in (
+        None,
+        [
+            {
+                strategy_optimizer.OptimizerFilter.LEFT_OPERAND_KEY_KEY:
+                    commons_enums.BacktestingMetadata.PERCENT_GAINS.value,
+                strategy_optimizer.OptimizerFilter.RIGHT_OPERAND_KEY_KEY:
+                    commons_enums.BacktestingMetadata.TRADES.value,
+                strategy_optimizer.OptimizerFilter.LEFT_OPERAND_VALUE_KEY: None,
+                strategy_optimizer.OptimizerFilter.RIGHT_OPERAND_VALUE_KEY: 3,
+                strategy_optimizer.OptimizerFilter.OPERATOR_KEY:
+                    commons_enums.LogicalOperators.HIGHER_THAN.value,
+            },
+            {
+                # not a number: results are filtered one by one
+                strategy_optimizer.OptimizerFilter.LEFT_OPERAND_KEY_KEY: "name",
+                strategy_optimizer.OptimizerFilter.RIGHT_OPERAND_KEY_KEY: None,
+                strategy_optimizer.OptimizerFilter.LEFT_OPERAND_VALUE_KEY: None,
+                strategy_optimizer.OptimizerFilter.RIGHT_OPERAND_VALUE_KEY: "plop",
+                strategy_optimizer.OptimizerFilter.OPERATOR_KEY: commons_enums.LogicalOperators.EQUAL_TO.value,
+            },
+        ],
+    ):
+        settings_dict = {} if filters is None else {
+            enums.OptimizerConfig.DEFAULT_OPTIMIZER_FILTERS.value: filters
+        }
+        expected_ranked_indexes, expected_scores = _rank_one_by_one(
+            strategy_optimizer.OptimizerSettings(settings_dict), full_results
+        )
+        optimizer_settings = strategy_optimizer.OptimizerSettings(settings_dict)
+        run_results = strategy_optimizer.ScoredRunResults(full_results)
+        assert run_results.rank(optimizer_settings.fitness_parameters,
+                                optimizer_settings.exclude_filters).tolist() == expected_ranked_indexes
+        assert run_results.scores.tolist() == expected_scores
+
+
+def test_rank_100k_results():
+    full_results = _get_full_results(100000)
+    optimizer_settings = strategy_optimizer.OptimizerSettings()
+    t0 = time.time()
+    ranked_indexes = strategy_optimizer.ScoredRunResults(full_results).rank(
+        optimizer_settings.fitness_parameters, optimizer_settings.exclude_filters
+    )
+    assert time.time() - t0 < 1
+    assert 0 < len(ranked_indexes) < len(full_results)
+
+
+def test_filter_with_zero_and_false_operands():
+    trades_filter = strategy_optimizer.OptimizerFilter(
+        commons_enums.BacktestingMetadata.TRADES.value, None, None, 1,
+        commons_enums.LogicalOperators.LOWER_THAN.value
+    )
+    trades_filter.load_values({commons_enums.BacktestingMetadata.TRADES.value: 0})
+    assert trades_filter.is_valid()
+    assert trades_filter.is_filtered()
+    gains_filter = strategy_optimizer.OptimizerFilter(
+        commons_enums.BacktestingMetadata.PERCENT_GAINS.value, None, None, 0,
+        commons_enums.LogicalOperators.LOWER_THAN.value
+    )
+    gains_filter.load_values({commons_enums.BacktestingMetadata.PERCENT_GAINS.value: -1})
+    assert gains_filter.is_valid()
+    assert gains_filter.is_filtered()
+    gains_filter.load_values({commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 0})
+    assert not gains_filter.is_filtered()
+    bool_filter = strategy_optimizer.OptimizerFilter(
+        None, None, False, False, commons_enums.LogicalOperators.EQUAL_TO.value
+    )
+    assert bool_filter.is_valid()
+    assert not strategy_optimizer.OptimizerFilter(None, None, None, 0, "<").is_valid()
+    assert not strategy_optimizer.OptimizerFilter(None, None, 0, 0, None).is_valid()
+
+
+def test_default_filters_exclude_zero_trades_and_losing_runs():
+    full_results = [
+        {
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 10,
+            commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+            commons_enums.BacktestingMetadata.TRADES.value: 3,
+        },
+        {
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 20,
+            commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+            commons_enums.BacktestingMetadata.TRADES.value: 0,
+        },
+        {
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: -5,
+            commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+            commons_enums.BacktestingMetadata.TRADES.value: 3,
+        },
+    ]
+    optimizer_settings = strategy_optimizer.OptimizerSettings()
+    expected_ranked_indexes, _ = _rank_one_by_one(optimizer_settings, full_results)
+    assert expected_ranked_indexes == [0]
+    assert strategy_optimizer.ScoredRunResults(full_results).rank(
+        optimizer_settings.fitness_parameters, optimizer_settings.exclude_filters
+    ).tolist() == [0]
+
+
+def test_fitness_parameter_with_equal_ratio_bounds():
+    fitness_parameter = strategy_optimizer.FitnessParameter(
+        commons_enums.BacktestingMetadata.PERCENT_GAINS.value, 2, True
+    )
+    fitness_parameter.update_ratio({commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 12})
+    fitness_parameter.update_ratio({commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 12})
+    assert fitness_parameter.max_ratio_value == fitness_parameter.min_ratio_value == 12
+    # no ZeroDivisionError: every value is the max value
+    assert fitness_parameter.get_normalized_value(12) == 2
+    fitness_parameter.update_ratio({commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 2})
+    assert fitness_parameter.get_normalized_value(12) == 2
+    assert fitness_parameter.get_normalized_value(2) == 0
+
+
+def test_compute_score_multiple_times():
+    gains_parameter = strategy_optimizer.FitnessParameter(
+        commons_enums.BacktestingMetadata.PERCENT_GAINS.value, 2, False
+    )
+    trades_parameter = strategy_optimizer.FitnessParameter(
+        commons_enums.BacktestingMetadata.TRADES.value, 1, False
+    )
+    scored_result = strategy_optimizer.ScoredRunResult({
+        commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 10,
+        commons_enums.BacktestingMetadata.TRADES.value: 4,
+    }, [])
+    scored_result.compute_score([gains_parameter, trades_parameter])
+    score = scored_result.score
+    assert scored_result.total_weight == 3
+    assert score == (10 * 0.01 * 2 + 4) / 3
+    for _ in range(3):
+        # total_weight is not accumulated across calls
+        scored_result.compute_score([gains_parameter, trades_parameter])
+        assert scored_result.total_weight == 3
+        assert scored_result.score == score
@@ -14,26 +14,32 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import math
+import multiprocessing
+import queue
 
 import pytest
 import pytest_asyncio
 import mock
 
 import octobot.api as bot_module_api
+import octobot.api.backtesting as octobot_backtesting_api
 import octobot.enums as enums
 import octobot.strategy_optimizer as strategy_optimizer
 import octobot_trading.api as trading_api
+import octobot_backtesting.api as backtesting_api
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_commons.enums as commons_enums
 import octobot_commons.constants as commons_constants
 import octobot_commons.databases as databases
+import octobot_commons.multiprocessing_util as multiprocessing_util
 import octobot_evaluators.constants as evaluators_constants
 
 import tentacles.Evaluator.Strategies as Strategies
 import tentacles.Evaluator.TA as Evaluator
 import tentacles.Trading.Mode as Mode
 
-from tests.unit_tests.strategy_optimizer import optimizer_inputs, MOCKED_OPTIMIZER_CONFIG, EXPECTED_RUNS_FROM_MOCK
+from tests.unit_tests.strategy_optimizer import optimizer_inputs, MOCKED_OPTIMIZER_CONFIG, EXPECTED_RUNS_FROM_MOCK, \
+    get_short_runs, dispatch_short_runs
 
 # All test coroutines will be treated as marked.
 pytestmark = pytest.mark.asyncio
@@ -43,23 +49,72 @@ async def test_generate_and_save_strategy_optimizer_runs(optimizer_inputs):
     tentacles_setup_config, trading_mode = optimizer_inputs
     optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
         enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.RANDOMLY_CHOSE_RUNS.value: False,
     })
     with mock.patch.object(databases.TinyDBAdaptor, "create_identifier", mock.AsyncMock()) as create_identifier_mock, \
             mock.patch.object(strategy_optimizer.StrategyDesignOptimizer, "_save_run_schedule", mock.AsyncMock()) as \
-                    _save_run_schedule_mock, \
-            mock.patch.object(strategy_optimizer.StrategyDesignOptimizer, "shuffle_and_select_runs", mock.Mock(
-                side_effect=lambda *args, **_: args[0]
-            )) as shuffle_and_select_runs_mock:
+                    _save_run_schedule_mock:
         assert await bot_module_api.generate_and_save_strategy_optimizer_runs(
             trading_mode,
             tentacles_setup_config,
             optimizer_settings
         ) == EXPECTED_RUNS_FROM_MOCK
         create_identifier_mock.assert_called_once()
-        shuffle_and_select_runs_mock.assert_called_once()
         _save_run_schedule_mock.assert_awaited_once_with(EXPECTED_RUNS_FROM_MOCK)
 
 
+async def test_generate_and_save_strategy_optimizer_runs_in_genetic_mode(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.RANDOMLY_CHOSE_RUNS.value: False,
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.GENETIC.value,
+    })
+    with mock.patch.object(databases.TinyDBAdaptor, "create_identifier", mock.AsyncMock()), \
+            mock.patch.object(strategy_optimizer.StrategyDesignOptimizer, "_save_run_schedule", mock.AsyncMock()) as \
+                    _save_run_schedule_mock:
+        assert await bot_module_api.generate_and_save_strategy_optimizer_runs(
+            trading_mode,
+            tentacles_setup_config,
+            optimizer_settings
+        ) == EXPECTED_RUNS_FROM_MOCK
+        # genetic runs are not taken from the run schedule: do not queue the exhaustive one
+        _save_run_schedule_mock.assert_not_called()
+
+
+async def test_generate_random_runs(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.RANDOMLY_CHOSE_RUNS.value: True,
+        enums.OptimizerConfig.RANDOM_SEED.value: 42,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode, optimizer_settings, None, tentacles_setup_config
+    )
+    all_runs = optimizer._generate_runs()
+    assert sorted(all_runs.keys()) == list(range(len(EXPECTED_RUNS_FROM_MOCK)))
+    assert sorted(optimizer.get_run_hash(run) for run in all_runs.values()) == \
+        sorted(optimizer.get_run_hash(run) for run in EXPECTED_RUNS_FROM_MOCK.values())
+    # same seed: same selection
+    assert optimizer._generate_runs() == all_runs
+
+    optimizer_settings.queue_size = 7
+    reservoir_runs = optimizer._generate_runs()
+    assert len(reservoir_runs) == 7
+    assert len(set(optimizer.get_run_hash(run) for run in reservoir_runs.values())) == 7
+    assert all(run in EXPECTED_RUNS_FROM_MOCK.values() for run in reservoir_runs.values())
+
+    # force index based sampling
+    with mock.patch.object(optimizer, "RUN_INDEX_SAMPLING_MIN_SPACE_RATIO", 0), \
+            mock.patch.object(optimizer, "_reservoir_sample_runs", mock.Mock()) as _reservoir_sample_runs_mock:
+        index_sampled_runs = optimizer._generate_runs()
+        _reservoir_sample_runs_mock.assert_not_called()
+    assert len(index_sampled_runs) == 7
+    assert len(set(optimizer.get_run_hash(run) for run in index_sampled_runs.values())) == 7
+    assert all(run in EXPECTED_RUNS_FROM_MOCK.values() for run in index_sampled_runs.values())
+
+
 async def test_resume_unknown_mode(optimizer_inputs):
     tentacles_setup_config, trading_mode = optimizer_inputs
     optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
@@ -108,3 +163,442 @@ async def test_resume_normal_mode(optimizer_inputs):
         _get_total_nb_runs_mock.assert_called_once_with(optimizer_settings.optimizer_ids)
         multi_processed_optimize_mock.assert_awaited_once_with(optimizer_settings)
 
+
+
+async def test_resume_genetic_mode(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.OPTIMIZER_IDS.value: [1],
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.GENETIC.value,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    with mock.patch.object(optimizer, "_get_total_nb_runs",
+                           mock.AsyncMock(return_value=5)) as _get_total_nb_runs_mock, \
+            mock.patch.object(optimizer, "genetic_optimize",
+                              mock.AsyncMock(return_value=True)) as genetic_optimize_mock:
+        assert await optimizer.resume(optimizer_settings) is True
+        _get_total_nb_runs_mock.assert_called_once_with(optimizer_settings.optimizer_ids)
+        genetic_optimize_mock.assert_awaited_once_with(optimizer_settings)
+
+
+def _get_mocked_scored_run_results(optimizer):
+    async def _mocked_scored_run_results(_, runs, **__):
+        scored_results_by_hash = {}
+        for run in runs:
+            values = {
+                run_input[strategy_optimizer.StrategyDesignOptimizer.CONFIG_USER_INPUT]:
+                    run_input[strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE]
+                for run_input in run
+            }
+            scored_results_by_hash[optimizer.get_run_hash(run)] = strategy_optimizer.ScoredRunResult(
+                {
+                    commons_enums.BacktestingMetadata.PERCENT_GAINS.value:
+                        values["period_length"] + values["constrained_risk"],
+                    commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+                    commons_enums.BacktestingMetadata.TRADES.value: 2,
+                },
+                run
+            )
+        return scored_results_by_hash
+    return _mocked_scored_run_results
+
+
+async def test_genetic_optimize(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.OPTIMIZER_IDS.value: [1],
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.GENETIC.value,
+        enums.OptimizerConfig.INITIAL_GENERATION_COUNT.value: 5,
+        enums.OptimizerConfig.DEFAULT_GENERATIONS_COUNT.value: 4,
+        enums.OptimizerConfig.DEFAULT_RUN_PER_GENERATION.value: 3,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    with mock.patch.object(optimizer, "_run_genetic_generation", mock.AsyncMock()) as _run_genetic_generation_mock, \
+            mock.patch.object(optimizer, "_get_scored_run_results",
+                              mock.AsyncMock(side_effect=_get_mocked_scored_run_results(optimizer))) \
+            as _get_scored_run_results_mock:
+        assert await optimizer.genetic_optimize(optimizer_settings) is True
+        assert optimizer.is_finished is True
+        assert optimizer.runs_schedule is None
+        generations_runs = [call.args[2] for call in _run_genetic_generation_mock.await_args_list]
+        assert 1 <= len(generations_runs) <= 4
+        assert len(generations_runs[0]) == 5
+        assert all(len(runs) <= 3 for runs in generations_runs[1:])
+        all_run_hashes = [optimizer.get_run_hash(run) for runs in generations_runs for run in runs]
+        # each run is only evaluated once
+        assert len(all_run_hashes) == len(set(all_run_hashes)) <= 5 + 3 * 3
+        # every run is allowed by filters settings
+        assert all(
+            5 <= run[0][strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE] < 15
+            for runs in generations_runs
+            for run in runs
+        )
+        assert _get_scored_run_results_mock.await_count == len(generations_runs)
+
+
+async def test_genetic_optimize_stops_when_target_fitness_score_is_reached(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.OPTIMIZER_IDS.value: [1],
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.GENETIC.value,
+        enums.OptimizerConfig.INITIAL_GENERATION_COUNT.value: 5,
+        enums.OptimizerConfig.DEFAULT_GENERATIONS_COUNT.value: 4,
+        enums.OptimizerConfig.DEFAULT_RUN_PER_GENERATION.value: 3,
+        # every run has at least 6% gains
+        enums.OptimizerConfig.TARGET_FITNESS_SCORE.value: 0.06,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    with mock.patch.object(optimizer, "_run_genetic_generation", mock.AsyncMock()) as _run_genetic_generation_mock, \
+            mock.patch.object(optimizer, "_get_scored_run_results",
+                              mock.AsyncMock(side_effect=_get_mocked_scored_run_results(optimizer))):
+        assert await optimizer.genetic_optimize(optimizer_settings) is True
+        # stopped after the 1st generation
+        _run_genetic_generation_mock.assert_awaited_once()
+
+
+async def test_successive_halving_optimize(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.OPTIMIZER_IDS.value: [1],
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.SUCCESSIVE_HALVING.value,
+        enums.OptimizerConfig.QUEUE_SIZE.value: 9,
+        enums.OptimizerConfig.START_TIMESTAMP.value: 1000,
+        enums.OptimizerConfig.END_TIMESTAMP.value: 10000,
+        enums.OptimizerConfig.HALVING_FACTOR.value: 3,
+        enums.OptimizerConfig.HALVING_RUNGS_COUNT.value: 3,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    assert optimizer._get_optimization_func(optimizer_settings) == optimizer.successive_halving_optimize
+    with mock.patch.object(optimizer, "_run_genetic_generation", mock.AsyncMock()) as _run_genetic_generation_mock, \
+            mock.patch.object(optimizer, "_get_scored_run_results",
+                              mock.AsyncMock(side_effect=_get_mocked_scored_run_results(optimizer))):
+        assert await optimizer.successive_halving_optimize(optimizer_settings) is True
+        assert optimizer.is_finished is True
+        assert optimizer.runs_schedule is None
+        assert optimizer.total_nb_runs == 9 + 3 + 1
+        rungs_settings = [call.args[0] for call in _run_genetic_generation_mock.await_args_list]
+        rungs_runs = [call.args[2] for call in _run_genetic_generation_mock.await_args_list]
+        assert [len(runs) for runs in rungs_runs] == [9, 3, 1]
+        # each rung is using a 3 times longer window, the last one is using the full window
+        assert [(settings.start_timestamp, settings.end_timestamp) for settings in rungs_settings] == \
+               [(1000, 2000), (1000, 4000), (1000, 10000)]
+        # only the best runs are promoted
+        gains = [
+            [
+                sum(
+                    run_input[strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE]
+                    for run_input in run
+                    if run_input[strategy_optimizer.StrategyDesignOptimizer.CONFIG_USER_INPUT]
+                    in ("period_length", "constrained_risk")
+                )
+                for run in runs
+            ]
+            for runs in rungs_runs
+        ]
+        assert gains[1] == sorted(gains[0], reverse=True)[:3]
+        assert gains[2] == [max(gains[0])]
+        # configured fitness parameters are not updated by rungs scoring
+        assert all(parameter.max_ratio_value is None for parameter in optimizer_settings.fitness_parameters)
+
+
+async def test_successive_halving_optimize_without_backtesting_window(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.OPTIMIZER_IDS.value: [1],
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.SUCCESSIVE_HALVING.value,
+        enums.OptimizerConfig.QUEUE_SIZE.value: 9,
+        enums.OptimizerConfig.DATA_FILES.value: ["data_file.data"],
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    with mock.patch.object(optimizer, "_run_genetic_generation", mock.AsyncMock()) as _run_genetic_generation_mock, \
+            mock.patch.object(optimizer, "_get_scored_run_results",
+                              mock.AsyncMock(side_effect=_get_mocked_scored_run_results(optimizer))), \
+            mock.patch.object(backtesting_api, "get_file_description", mock.AsyncMock(return_value=None)):
+        assert await optimizer.successive_halving_optimize(optimizer_settings) is True
+        # every run is evaluated on the full window
+        _run_genetic_generation_mock.assert_awaited_once()
+        assert len(_run_genetic_generation_mock.await_args.args[2]) == 9
+        assert _run_genetic_generation_mock.await_args.args[0].end_timestamp is None
+
+
+async def _run_optimizer_session(optimizer, optimizer_id, runs, data_files):
+    run_data_by_hash = optimizer._get_optimizer_runs_details_and_hashes(runs)
+    run_queues = {
+        optimizer.START_QUEUE_KEY: queue.Queue(),
+        optimizer.DONE_QUEUE_KEY: queue.Queue(),
+    }
+    for run_hash in run_data_by_hash:
+        run_queues[optimizer.START_QUEUE_KEY].put(run_hash)
+
+    trading_mode = optimizer.trading_mode
+
+    async def _mocked_run_with_config(optimizer_id, _, run_id, run_config, **__):
+        value = run_config[0][strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE]
+        run_dbs_identifier = databases.RunDatabasesIdentifier(
+            trading_mode, optimizer.optimization_campaign_name, optimizer_id=optimizer_id
+        )
+        run_metadata = {
+            commons_enums.BacktestingMetadata.ID.value: run_id,
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: value,
+            commons_enums.BacktestingMetadata.USER_INPUTS.value: {
+                "RSIMomentumEvaluator": {"period_length": value}
+            },
+        }
+        async with databases.DBWriter.database(run_dbs_identifier.get_backtesting_metadata_identifier(),
+                                               with_lock=True) as writer:
+            await writer.log(commons_enums.DBTables.METADATA.value, run_metadata)
+        return mock.Mock(octobot_backtesting=mock.Mock(run_metadata=run_metadata))
+
+    with mock.patch.object(optimizer, "_run_with_config",
+                           mock.AsyncMock(side_effect=_mocked_run_with_config)) as _run_with_config_mock:
+        with pytest.raises(strategy_optimizer.strategy_design_optimizer.NoMoreRunError):
+            while True:
+                await optimizer.run_single_iteration(optimizer_id, run_queues, run_data_by_hash, data_files)
+    assert run_queues[optimizer.DONE_QUEUE_KEY].qsize() == len(runs)
+    return _run_with_config_mock.await_count
+
+
+async def test_run_results_cache_skips_identical_runs(optimizer_inputs, tmp_path, monkeypatch):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    # store run databases and cache in a temporary folder
+    monkeypatch.chdir(tmp_path)
+    runs = {
+        index: [{
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_USER_INPUT: "period_length",
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_TENTACLE: ["RSIMomentumEvaluator"],
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE: index,
+        }]
+        for index in range(20)
+    }
+    data_files = ["data_file.data"]
+    with multiprocessing_util.registered_lock_and_shared_elements(
+            commons_enums.MultiprocessingLocks.DBLock.value, multiprocessing.RLock(), {}), \
+            mock.patch.object(strategy_optimizer.RunResultsCache, "_get_data_file_hash",
+                              mock.Mock(return_value="data_file_hash")):
+        backtests_counts = []
+        for optimizer_id in (1, 2):
+            optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+            optimizer.run_results_cache = strategy_optimizer.RunResultsCache(trading_mode)
+            backtests_counts.append(await _run_optimizer_session(optimizer, optimizer_id, runs, data_files))
+            if optimizer_id == 1:
+                assert (optimizer.run_results_cache.hits, optimizer.run_results_cache.misses) == (0, 20)
+            else:
+                assert (optimizer.run_results_cache.hits, optimizer.run_results_cache.misses) == (20, 0)
+        # 2nd identical session does not run any backtest
+        assert backtests_counts == [20, 0]
+        # cached results are registered in the 2nd optimizer run results
+        scored_results = await optimizer._get_scored_run_results(2, list(runs.values()))
+        assert sorted(
+            scored_result.full_result[commons_enums.BacktestingMetadata.PERCENT_GAINS.value]
+            for scored_result in scored_results.values()
+        ) == list(range(20))
+
+        # changed data files: cache is not used
+        with mock.patch.object(strategy_optimizer.RunResultsCache, "_get_data_file_hash",
+                               mock.Mock(return_value="other_data_file_hash")):
+            optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+            optimizer.run_results_cache = strategy_optimizer.RunResultsCache(trading_mode)
+            assert await _run_optimizer_session(optimizer, 3, runs, data_files) == 20
+
+
+async def test_store_run_result_in_cache(optimizer_inputs, tmp_path, monkeypatch):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    monkeypatch.chdir(tmp_path)
+    optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+    optimizer.run_results_cache = strategy_optimizer.RunResultsCache(trading_mode)
+    run_dbs_identifier = databases.RunDatabasesIdentifier(
+        trading_mode, optimizer.optimization_campaign_name, optimizer_id=1, backtesting_id=1
+    )
+    # no registered multiprocessing lock: results are cached without any lock
+    await optimizer._store_run_result_in_cache(run_dbs_identifier, "a" * 64, None)
+    await optimizer._store_run_result_in_cache(
+        run_dbs_identifier, "b" * 64, mock.Mock(octobot_backtesting=mock.Mock(run_metadata=None))
+    )
+    await optimizer._store_run_result_in_cache(
+        run_dbs_identifier, "c" * 64, mock.Mock(octobot_backtesting=mock.Mock(run_metadata={"gains": 1}))
+    )
+    # failed runs are not cached
+    assert await optimizer.run_results_cache.get("a" * 64) is None
+    assert await optimizer.run_results_cache.get("b" * 64) is None
+    assert await optimizer.run_results_cache.get("c" * 64) == {
+        strategy_optimizer.RunResultsCache.RUN_METADATA: {"gains": 1},
+        strategy_optimizer.RunResultsCache.RUN_FOLDER: run_dbs_identifier.get_backtesting_run_folder(),
+    }
+
+
+async def test_run_with_config_reuses_backtesting_data(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+    data_files = ["data_file.data"]
+    backtesting_data = mock.Mock(data_files=data_files, stop=mock.AsyncMock())
+    with mock.patch.object(optimizer, "_get_config_by_tentacle", mock.Mock()), \
+            mock.patch.object(octobot_backtesting_api, "create_and_init_shared_backtesting_data",
+                              mock.AsyncMock(return_value=backtesting_data)) \
+            as create_and_init_shared_backtesting_data_mock, \
+            mock.patch.object(octobot_backtesting_api, "create_independent_backtesting",
+                              mock.Mock(return_value=mock.Mock(stop=mock.AsyncMock()))) \
+            as create_independent_backtesting_mock, \
+            mock.patch.object(octobot_backtesting_api, "initialize_and_run_independent_backtesting",
+                              mock.AsyncMock()), \
+            mock.patch.object(octobot_backtesting_api, "join_independent_backtesting", mock.AsyncMock()):
+        for run_id in range(1, 4):
+            await optimizer._run_with_config(1, data_files, run_id, [])
+        # data files are only parsed once
+        create_and_init_shared_backtesting_data_mock.assert_awaited_once_with(
+            data_files, optimizer.config, tentacles_setup_config
+        )
+        assert create_independent_backtesting_mock.call_count == 3
+        assert all(
+            call.kwargs["backtesting_data"] is backtesting_data
+            for call in create_independent_backtesting_mock.call_args_list
+        )
+        backtesting_data.stop.assert_not_called()
+        await optimizer._stop_backtesting_data()
+        backtesting_data.stop.assert_awaited_once()
+        assert optimizer.backtesting_data is None
+
+
+
+async def test_get_config_by_tentacle(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+    base_configs = {
+        "TM": {"period": 10, "nested": {"length": 1}},
+        "Evaluator": {"threshold": 1},
+    }
+    run_config_1 = [
+        {optimizer.CONFIG_TENTACLE: ["TM", "nested"], optimizer.CONFIG_USER_INPUT: "length",
+         optimizer.CONFIG_VALUE: 2}
+    ]
+    run_config_2 = [
+        {optimizer.CONFIG_TENTACLE: ["TM", "nested"], optimizer.CONFIG_USER_INPUT: "length",
+         optimizer.CONFIG_VALUE: 3}
+    ]
+    with mock.patch.object(tentacles_manager_api, "get_activated_tentacles",
+                           mock.Mock(return_value=list(base_configs))), \
+            mock.patch.object(tentacles_manager_api, "has_profile_local_configuration", mock.Mock(return_value=True)), \
+            mock.patch.object(tentacles_manager_api, "get_tentacle_class_from_string", mock.Mock(side_effect=str)), \
+            mock.patch.object(tentacles_manager_api, "get_tentacle_config",
+                              mock.Mock(side_effect=lambda _, tentacle: base_configs[tentacle])) \
+            as get_tentacle_config_mock, \
+            mock.patch.object(tentacles_manager_api, "update_tentacle_config", mock.Mock()) \
+            as update_tentacle_config_mock:
+        config_by_tentacle_1 = optimizer._get_config_by_tentacle(run_config_1)
+        assert config_by_tentacle_1 == {
+            "TM": {"period": 10, "nested": {"length": 2}},
+            "Evaluator": {"threshold": 1},
+        }
+        config_by_tentacle_2 = optimizer._get_config_by_tentacle(run_config_2)
+        assert config_by_tentacle_2["TM"] == {"period": 10, "nested": {"length": 3}}
+        # each run gets its own config
+        assert config_by_tentacle_2["Evaluator"] == config_by_tentacle_1["Evaluator"]
+        assert config_by_tentacle_2["Evaluator"] is not config_by_tentacle_1["Evaluator"]
+        config_by_tentacle_1["TM"]["nested"]["default_value"] = 1
+        assert optimizer._get_config_by_tentacle(run_config_1)["TM"] == {"period": 10, "nested": {"length": 2}}
+        # base configs are left untouched and only read once
+        assert base_configs["TM"] == {"period": 10, "nested": {"length": 1}}
+        assert get_tentacle_config_mock.call_count == 2
+        # merged configs cache is bounded
+        with mock.patch.object(optimizer, "TENTACLES_CONFIGS_CACHE_MAX_SIZE", 2):
+            optimizer._get_config_by_tentacle([
+                {optimizer.CONFIG_TENTACLE: ["TM", "nested"], optimizer.CONFIG_USER_INPUT: "length",
+                 optimizer.CONFIG_VALUE: 4}
+            ])
+            assert len(optimizer._tentacles_configs_by_key) == 2
+            # least recently used config is removed
+            assert [tentacle for tentacle, _ in optimizer._tentacles_configs_by_key] == ["TM", "Evaluator"]
+        # nothing is written on disk
+        update_tentacle_config_mock.assert_not_called()
+
+
+async def test_runs_dispatch(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+    runs = get_short_runs(200)
+    run_data_by_hash = optimizer._get_optimizer_runs_details_and_hashes(runs)
+    # dispatch throughput is measured in tests/benchmarks/optimizer_runs_dispatch_benchmark.py
+    executed_runs, _ = await dispatch_short_runs(optimizer, runs, 2, 0)
+    # each run is executed once with a unique backtesting id
+    assert sorted(run_hash for run_hash, _, _ in executed_runs) == sorted(run_data_by_hash)
+    assert len(set(backtesting_id for _, backtesting_id, _ in executed_runs)) == len(runs)
+
+
+async def test_completed_runs_journal(optimizer_inputs, tmp_path, monkeypatch):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    # store run databases in a temporary folder
+    monkeypatch.chdir(tmp_path)
+    optimizer = strategy_optimizer.StrategyDesignOptimizer(trading_mode, {}, tentacles_setup_config)
+    runs = {
+        index: [{
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_USER_INPUT: "period_length",
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_TENTACLE: ["RSIMomentumEvaluator"],
+            strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE: index,
+        }]
+        for index in range(10)
+    }
+    optimizer.run_dbs_identifier.optimizer_id = 1
+    await optimizer.run_dbs_identifier.initialize()
+    await optimizer._save_run_schedule(runs)
+    run_hashes = [optimizer.get_run_hash(run) for run in runs.values()]
+    run_queues = {optimizer.DONE_QUEUE_KEY: queue.Queue()}
+    runs_journal = optimizer._get_runs_journal(trading_mode, optimizer.optimization_campaign_name, 1)
+
+    def _get_queued_values(run_queue):
+        return [
+            run[0][strategy_optimizer.StrategyDesignOptimizer.CONFIG_VALUE]
+            for run in run_queue[0][strategy_optimizer.StrategyDesignOptimizer.CONFIG_RUNS].values()
+        ]
+
+    for run_hash in run_hashes[:3]:
+        run_queues[optimizer.DONE_QUEUE_KEY].put(run_hash)
+    with mock.patch.object(optimizer, "_compact_runs_journal", mock.AsyncMock()) as _compact_runs_journal_mock:
+        await optimizer._update_runs_from_done_queue(run_queues, 1)
+        # completed runs are only journaled
+        _compact_runs_journal_mock.assert_not_awaited()
+    assert runs_journal.read() == set(run_hashes[:3])
+    assert runs_journal.get_entries_count() == 3
+    # journal is replayed when reading the run schedule (after a crash for example)
+    assert _get_queued_values(await optimizer.get_run_queue(trading_mode)) == list(range(3, 10))
+
+    for run_hash in run_hashes[3:5]:
+        run_queues[optimizer.DONE_QUEUE_KEY].put(run_hash)
+    await optimizer._update_runs_from_done_queue(run_queues, 1, compact=True)
+    # completed runs are removed from the run schedule database on compaction
+    assert runs_journal.get_entries_count() == 0
+    assert _get_queued_values(await optimizer.get_run_queue(trading_mode)) == list(range(5, 10))
+
+    for run_hash in run_hashes[5:]:
+        run_queues[optimizer.DONE_QUEUE_KEY].put(run_hash)
+    await optimizer._update_runs_from_done_queue(run_queues, 1, compact=True)
+    # no remaining run
+    assert await optimizer.get_run_queue(trading_mode) == []
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import concurrent.futures
 import os
 
 import mock
@@ -20,6 +21,8 @@ import builtins
 
 import tests.test_utils.config as test_utils_config
 import octobot_commons.tests.test_config as test_config
+import octobot_commons.constants as commons_constants
+import octobot_evaluators.constants as evaluator_constants
 import tentacles.Evaluator.Strategies as tentacles_strategies
 import octobot.strategy_optimizer as strategy_optimizer
 
@@ -52,3 +55,79 @@ def test_find_optimal_configuration():
         # iterate over each second print call to check run config (each strategy optimizer run prints twice)
         for call in print_mock.call_args_list[::2]:
             assert len([c for c in print_mock.call_args_list if c == call]) == 1
+
+
+def test_find_optimal_configuration_in_processes():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+
+    def _run_test_suite_in_process(_, tentacles_setup_config, config, evaluators):
+        return StrategyTestSuiteMock().get_test_suite_result(), set()
+
+    # use threads instead of processes to use mocks
+    with mock.patch.object(concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor), \
+            mock.patch.object(strategy_optimizer.strategy_optimizer, "run_test_suite_in_process",
+                              mock.Mock(side_effect=_run_test_suite_in_process)) as run_test_suite_in_process_mock, \
+            mock.patch.object(builtins, "print", mock.Mock()) as print_mock:
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(processes_count=4)
+        if os.getenv('CYTHON_IGNORE'):
+            return
+        assert optimizer.total_nb_runs == 21
+        assert run_test_suite_in_process_mock.call_count == optimizer.total_nb_runs
+        assert len(optimizer.run_results) == optimizer.total_nb_runs
+        assert optimizer.run_id == optimizer.total_nb_runs + 1
+        # one print per completed run
+        assert print_mock.call_count == optimizer.total_nb_runs
+        # each run has been using a different config
+        run_configs = [
+            (
+                tuple(call.args[3]),
+                tuple(call.args[2][evaluator_constants.CONFIG_FORCED_TIME_FRAME]),
+                call.args[2][commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]
+            )
+            for call in run_test_suite_in_process_mock.call_args_list
+        ]
+        assert len(set(run_configs)) == len(run_configs)
+        assert optimizer.sorted_results_through_all_time_frame
+
+
+class _PendingFuturesThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    max_pending_futures_count = 0
+    submitted_futures = []
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        self.submitted_futures.append(future)
+        _PendingFuturesThreadPoolExecutor.max_pending_futures_count = max(
+            self.max_pending_futures_count,
+            len([submitted_future for submitted_future in self.submitted_futures if not submitted_future.done()])
+        )
+        return future
+
+
+def test_find_optimal_configuration_in_processes_submits_lazily():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                     test_utils_config.load_test_tentacles_config(),
+                                                     strategy_name)
+
+    def _run_test_suite_in_process(_, tentacles_setup_config, config, evaluators):
+        if run_test_suite_in_process_mock.call_count == 5:
+            optimizer.cancel()
+        return StrategyTestSuiteMock().get_test_suite_result(), set()
+
+    with mock.patch.object(concurrent.futures, "ProcessPoolExecutor", _PendingFuturesThreadPoolExecutor), \
+            mock.patch.object(strategy_optimizer.strategy_optimizer, "run_test_suite_in_process",
+                              mock.Mock(side_effect=_run_test_suite_in_process)) as run_test_suite_in_process_mock, \
+            mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer.find_optimal_configuration(processes_count=2)
+        if os.getenv('CYTHON_IGNORE'):
+            return
+        assert optimizer.total_nb_runs == 21
+        # at most PENDING_RUNS_PER_PROCESS runs per process are submitted at the same time
+        assert _PendingFuturesThreadPoolExecutor.max_pending_futures_count <= 2 * optimizer.PENDING_RUNS_PER_PROCESS
+        # no run is submitted after cancel
+        assert len(_PendingFuturesThreadPoolExecutor.submitted_futures) < optimizer.total_nb_runs
+        assert run_test_suite_in_process_mock.call_count < optimizer.total_nb_runs
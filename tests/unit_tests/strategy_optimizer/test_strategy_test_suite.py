@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import concurrent.futures
 import os
 
 import mock
@@ -57,3 +58,41 @@ async def test_run_test_suite():
         test_suite.logger.exception.assert_called_once()
         # once for each call and one for the beginning and the end
         assert print_mock.call_count == len(calls) + 2
+
+
+async def test_run_test_suite_in_processes():
+    test_suite = StrategyTestSuiteMock()
+    test_suite.strategy_evaluator_class = mock.Mock()
+    test_suite.tentacles_setup_config = mock.Mock()
+    test_suite.config = {}
+    test_suite.evaluators = ["RSIMomentumEvaluator"]
+    test_suite._profitability_results = []
+    test_suite._trades_counts = []
+    for test_name in ("test_slow_downtrend", "test_sharp_downtrend", "test_flat_markets",
+                      "test_slow_uptrend", "test_sharp_uptrend"):
+        getattr(test_suite, test_name).__name__ = test_name
+
+    def _run_test_in_process(_, __, ___, ____, test_name):
+        if test_name == "test_up_then_down":
+            raise RuntimeError()
+        return [(len(test_name), 0)], [len(test_name)]
+
+    if os.getenv('CYTHON_IGNORE'):
+        return
+    # use threads instead of processes to use mocks
+    with mock.patch.object(builtins, "print", mock.Mock()) as print_mock, \
+            mock.patch.object(concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor), \
+            mock.patch.object(strategy_optimizer.strategy_test_suite, "run_test_in_process",
+                              mock.Mock(side_effect=_run_test_in_process)) as run_test_in_process_mock:
+        assert await test_suite.run_test_suite(test_suite, processes_count=4) is False
+        assert [call.args[4] for call in run_test_in_process_mock.call_args_list] == [
+            "test_slow_downtrend", "test_sharp_downtrend", "test_flat_markets",
+            "test_slow_uptrend", "test_sharp_uptrend", "test_up_then_down"
+        ]
+        assert test_suite.current_progress == 100
+        assert len(test_suite.exceptions) == 1
+        assert isinstance(test_suite.exceptions[0], RuntimeError)
+        # results are merged in scenarios order
+        assert test_suite._trades_counts == [19, 20, 17, 17, 18]
+        assert test_suite._profitability_results == [(19, 0), (20, 0), (17, 0), (17, 0), (18, 0)]
+        assert print_mock.call_count == 6 + 2
@@ -0,0 +1,102 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import mock
+import threading
+import pytest
+
+import octobot.executors as executors
+import octobot.task_manager as task_manager
+
+
+def _square(value):
+    return value * value
+
+
+def test_thread_pool_executor_metrics():
+    release = threading.Event()
+    executor = executors.InstrumentedThreadPoolExecutor(max_workers=2)
+    try:
+        blocked_futures = [executor.submit(release.wait) for _ in range(5)]
+        metrics = executor.metrics.to_dict()
+        assert metrics[executors.SUBMITTED_TASKS] == 5
+        assert metrics[executors.COMPLETED_TASKS] == 0
+        assert metrics[executors.RUNNING_TASKS] == 2
+        assert metrics[executors.QUEUE_DEPTH] == 3
+        assert metrics[executors.MAX_QUEUE_DEPTH] == 3
+        assert metrics[executors.QUEUED_SUBMISSIONS] == 3
+        assert metrics[executors.SATURATION] == 1
+        assert metrics[executors.AVERAGE_LATENCY] == 0
+        release.set()
+        for future in blocked_futures:
+            future.result(timeout=5)
+        assert executor.submit(_square, 3).result(timeout=5) == 9
+    finally:
+        executor.shutdown(wait=True)
+    metrics = executor.metrics.to_dict()
+    assert metrics[executors.SUBMITTED_TASKS] == metrics[executors.COMPLETED_TASKS] == 6
+    assert metrics[executors.RUNNING_TASKS] == metrics[executors.QUEUE_DEPTH] == 0
+    assert metrics[executors.MAX_QUEUE_DEPTH] == 3
+    assert metrics[executors.SATURATION] == 0
+    assert 0 < metrics[executors.AVERAGE_LATENCY] <= metrics[executors.MAX_LATENCY]
+
+
+def test_process_pool_executor_metrics():
+    executor = executors.InstrumentedProcessPoolExecutor(max_workers=1)
+    try:
+        assert [executor.submit(_square, value).result(timeout=30) for value in range(3)] == [0, 1, 4]
+    finally:
+        executor.shutdown(wait=True)
+    metrics = executor.metrics.to_dict()
+    assert metrics[executors.SUBMITTED_TASKS] == metrics[executors.COMPLETED_TASKS] == 3
+    assert metrics[executors.QUEUED_SUBMISSIONS] == 0
+    assert metrics[executors.MAX_LATENCY] > 0
+
+
+def test_create_pool_executor():
+    manager = task_manager.TaskManager(mock.Mock())
+    manager.create_pool_executor()
+    try:
+        assert manager.executors._max_workers == 2
+        assert manager.cpu_executors is None
+        assert list(manager.get_executors_metrics()) == ["io"]
+    finally:
+        manager.stop_pool_executors()
+    manager.create_pool_executor(workers=4, cpu_workers=1)
+    try:
+        assert manager.executors._max_workers == 4
+        assert isinstance(manager.cpu_executors, executors.InstrumentedProcessPoolExecutor)
+        assert list(manager.get_executors_metrics()) == ["io", "cpu"]
+    finally:
+        manager.stop_pool_executors()
+
+
+@pytest.mark.asyncio
+async def test_run_in_cpu_executor():
+    manager = task_manager.TaskManager(mock.Mock())
+    manager.create_pool_executor()
+    try:
+        # without CPU executor, the I/O executor is used
+        assert await manager.run_in_cpu_executor(_square, 2) == 4
+        assert manager.executors.metrics.completed_tasks == 1
+    finally:
+        manager.stop_pool_executors()
+    manager.create_pool_executor(cpu_workers=1)
+    try:
+        assert await manager.run_in_cpu_executor(_square, 3) == 9
+        assert manager.cpu_executors.metrics.completed_tasks == 1
+        assert manager.executors.metrics.completed_tasks == 0
+    finally:
+        manager.stop_pool_executors()
@@ -0,0 +1,125 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import logging
+import mock
+import pytest
+
+import octobot_commons.channels_name as channels_name
+import octobot_commons.logging as common_logging
+
+import octobot.constants as constants
+import octobot.logger as logger
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def channel_logger():
+    previous_logger = logger.BOT_CHANNEL_LOGGER
+    previous_intervals = dict(logger.CHANNEL_LOGS_MIN_INTERVALS)
+    logger.BOT_CHANNEL_LOGGER = common_logging.get_logger("OctoBot Channel Test")
+    try:
+        yield logger.BOT_CHANNEL_LOGGER
+    finally:
+        logger.BOT_CHANNEL_LOGGER = previous_logger
+        logger.CHANNEL_LOGS_MIN_INTERVALS.clear()
+        logger.CHANNEL_LOGS_MIN_INTERVALS.update(previous_intervals)
+        logger._LAST_CHANNEL_LOG_TIMES.clear()
+
+
+class _Ticker:
+    def __init__(self):
+        self.formatted_count = 0
+
+    def __str__(self):
+        self.formatted_count += 1
+        return "ticker"
+
+
+async def test_init_exchange_chan_logger_without_debug_logs(channel_logger):
+    channel_logger.logger.setLevel(logging.INFO)
+    with mock.patch.object(logger.exchanges_channel, "get_chan", mock.Mock()) as get_chan_mock:
+        await logger.init_exchange_chan_logger("exchange_id")
+        get_chan_mock.assert_not_called()
+
+
+async def test_init_exchange_chan_logger_without_channel_logger():
+    with mock.patch.object(logger, "BOT_CHANNEL_LOGGER", None), \
+            mock.patch.object(logger.exchanges_channel, "get_chan", mock.Mock()) as get_chan_mock:
+        await logger.init_exchange_chan_logger("exchange_id")
+        get_chan_mock.assert_not_called()
+
+
+async def test_init_exchange_chan_logger_with_debug_logs(channel_logger):
+    channel_logger.logger.setLevel(logging.DEBUG)
+    channel_mock = mock.Mock(new_consumer=mock.AsyncMock())
+    with mock.patch.object(logger.exchanges_channel, "get_chan", mock.Mock(return_value=channel_mock)) \
+            as get_chan_mock:
+        await logger.init_exchange_chan_logger("exchange_id")
+        assert get_chan_mock.call_count == 6
+        assert channel_mock.new_consumer.await_count == 6
+        get_chan_mock.reset_mock()
+        channel_mock.new_consumer.reset_mock()
+        with mock.patch.object(constants, "ENV_TRADING_ENABLE_DEBUG_LOGS", True):
+            await logger.init_exchange_chan_logger("exchange_id")
+            assert get_chan_mock.call_count == 15
+            assert channel_mock.new_consumer.await_count == 15
+
+
+async def test_init_evaluator_chan_logger(channel_logger):
+    channel_mock = mock.Mock(new_consumer=mock.AsyncMock())
+    with mock.patch.object(logger.evaluator_channels, "get_chan", mock.Mock(return_value=channel_mock)) \
+            as get_chan_mock:
+        channel_logger.logger.setLevel(logging.INFO)
+        await logger.init_evaluator_chan_logger("matrix_id")
+        get_chan_mock.assert_not_called()
+        channel_logger.logger.setLevel(logging.DEBUG)
+        await logger.init_evaluator_chan_logger("matrix_id")
+        assert channel_mock.new_consumer.await_count == 2
+
+
+async def test_channel_callback_lazy_formatting(channel_logger):
+    ticker = _Ticker()
+    channel_logger.logger.setLevel(logging.INFO)
+    await logger.ticker_callback(exchange="binance", exchange_id="1", cryptocurrency="Bitcoin",
+                                 symbol="BTC/USDT", ticker=ticker)
+    assert ticker.formatted_count == 0
+    channel_logger.logger.setLevel(logging.DEBUG)
+    await logger.ticker_callback(exchange="binance", exchange_id="1", cryptocurrency="Bitcoin",
+                                 symbol="BTC/USDT", ticker=ticker)
+    assert ticker.formatted_count == 1
+
+
+async def test_channel_callback_rate_limiting(channel_logger):
+    ticker = _Ticker()
+    channel_logger.logger.setLevel(logging.DEBUG)
+    logger.set_channel_logs_min_interval(channels_name.OctoBotTradingChannelsName.TICKER_CHANNEL.value, 10)
+    with mock.patch.object(logger.time, "monotonic", mock.Mock(return_value=100)):
+        for _ in range(3):
+            await logger.ticker_callback(exchange="binance", exchange_id="1", cryptocurrency="Bitcoin",
+                                         symbol="BTC/USDT", ticker=ticker)
+        assert ticker.formatted_count == 1
+    with mock.patch.object(logger.time, "monotonic", mock.Mock(return_value=110)):
+        await logger.ticker_callback(exchange="binance", exchange_id="1", cryptocurrency="Bitcoin",
+                                     symbol="BTC/USDT", ticker=ticker)
+        assert ticker.formatted_count == 2
+    # other channels are not rate limited
+    logger.set_channel_logs_min_interval(channels_name.OctoBotTradingChannelsName.MARK_PRICE_CHANNEL.value, 0)
+    mark_price = _Ticker()
+    for _ in range(3):
+        await logger.mark_price_callback(exchange="binance", exchange_id="1", cryptocurrency="Bitcoin",
+                                         symbol="BTC/USDT", mark_price=mark_price)
+    assert mark_price.formatted_count == 3
@@ -0,0 +1,223 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import mock
+import pytest
+
+import octobot_commons.configuration as configuration
+import octobot_commons.tests.test_config as test_config
+
+import octobot.octobot as octobot_module
+import octobot.producers as producers
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Producer:
+    def __init__(self, name, started_names, duration=0.05):
+        self.name = name
+        self.started_names = started_names
+        self.duration = duration
+        self.running = False
+
+    async def run(self):
+        self.started_names.append(self.name)
+        self.running = True
+        await asyncio.sleep(self.duration)
+        self.running = False
+
+
+def _create_bot():
+    config = configuration.Configuration(None, None)
+    config.config = test_config.load_test_config()
+    return octobot_module.OctoBot(config, community_authenticator=mock.Mock())
+
+
+async def test_start_producers_follows_dependencies():
+    bot = _create_bot()
+    started_names = []
+    bot.evaluator_producer = _Producer("evaluator", started_names)
+    bot.exchange_producer = _Producer("exchange", started_names)
+    bot.service_feed_producer = _Producer("service_feed", started_names)
+    bot.interface_producer = _Producer("interface", started_names)
+    await bot.start_producers()
+    # interfaces do not wait for evaluators
+    assert started_names[:2] == ["evaluator", "interface"]
+    assert sorted(started_names[2:]) == ["exchange", "service_feed"]
+
+
+async def test_start_producers_is_concurrent():
+    bot = _create_bot()
+    started_names = []
+    bot.evaluator_producer = _Producer("evaluator", started_names, duration=0)
+    bot.exchange_producer = _Producer("exchange", started_names, duration=0.2)
+    bot.service_feed_producer = _Producer("service_feed", started_names, duration=0.2)
+    bot.interface_producer = _Producer("interface", started_names, duration=0.2)
+    start = asyncio.get_event_loop().time()
+    await bot.start_producers()
+    assert asyncio.get_event_loop().time() - start < 0.4
+
+
+async def test_start_producers_cancels_other_producers_on_error():
+    bot = _create_bot()
+    started_names = []
+    bot.evaluator_producer = _Producer("evaluator", started_names)
+    bot.exchange_producer = _Producer("exchange", started_names)
+    bot.service_feed_producer = _Producer("service_feed", started_names)
+    bot.interface_producer = _Producer("interface", started_names, duration=1)
+    bot.evaluator_producer.run = mock.AsyncMock(side_effect=RuntimeError)
+    with pytest.raises(RuntimeError):
+        await bot.start_producers()
+    # dependent producers did not start
+    assert started_names == ["interface"]
+    # interface producer has been cancelled before the end of its run
+    assert bot.interface_producer.running is True
+
+
+async def test_exchange_producer_start():
+    bot = _create_bot()
+    exchange_producer = producers.ExchangeProducer(None, bot, None)
+    with mock.patch.object(exchange_producer, "create_exchange", mock.AsyncMock()) as create_exchange_mock, \
+            mock.patch("octobot_trading.api.get_enabled_exchanges_names",
+                       mock.Mock(return_value=["binance", "kucoin"])):
+        await exchange_producer.start()
+        assert create_exchange_mock.await_count == 2
+        assert exchange_producer.to_create_exchanges_count == 2
+        assert not exchange_producer.created_all_exchanges.is_set()
+        exchange_producer.register_created_exchange_id("1")
+        assert not exchange_producer.created_all_exchanges.is_set()
+        exchange_producer.register_created_exchange_id("2")
+        assert exchange_producer.created_all_exchanges.is_set()
+
+
+async def test_exchange_producer_start_without_exchange():
+    bot = _create_bot()
+    exchange_producer = producers.ExchangeProducer(None, bot, None)
+    with mock.patch.object(exchange_producer, "create_exchange", mock.AsyncMock()) as create_exchange_mock, \
+            mock.patch("octobot_trading.api.get_enabled_exchanges_names", mock.Mock(return_value=[])):
+        await exchange_producer.start()
+        create_exchange_mock.assert_not_awaited()
+        assert exchange_producer.created_all_exchanges.is_set()
+
+
+
+class _Component:
+    def __init__(self, name, stopped_names, duration=0.0, error=None):
+        self.name = name
+        self.stopped_names = stopped_names
+        self.duration = duration
+        self.error = error
+
+    async def stop(self):
+        await asyncio.sleep(self.duration)
+        if self.error is not None:
+            raise self.error
+        self.stopped_names.append(self.name)
+
+
+async def test_stop_components_follows_dependencies():
+    bot = _create_bot()
+    stopped_names = []
+    first = _Component("first", stopped_names, duration=0.1)
+    second = _Component("second", stopped_names)
+    independent = _Component("independent", stopped_names)
+    await bot._stop_components(
+        {
+            "first": (first.stop, ()),
+            "second": (second.stop, ("first", )),
+            "independent": (independent.stop, ()),
+        },
+        1, 2
+    )
+    assert stopped_names == ["independent", "first", "second"]
+
+
+async def test_stop_components_timeouts_and_errors():
+    bot = _create_bot()
+    stopped_names = []
+    hanging = _Component("hanging", stopped_names, duration=10)
+    failing = _Component("failing", stopped_names, error=RuntimeError)
+    after_hanging = _Component("after_hanging", stopped_names)
+    after_failing = _Component("after_failing", stopped_names)
+    with mock.patch.object(bot.logger, "warning", mock.Mock()) as warning_mock, \
+            mock.patch.object(bot.logger, "exception", mock.Mock()) as exception_mock:
+        start = asyncio.get_event_loop().time()
+        await bot._stop_components(
+            {
+                "hanging": (hanging.stop, ()),
+                "failing": (failing.stop, ()),
+                "after_hanging": (after_hanging.stop, ("hanging", )),
+                "after_failing": (after_failing.stop, ("failing", )),
+            },
+            0.1, 1
+        )
+        assert asyncio.get_event_loop().time() - start < 0.5
+        # components are stopped even when the previous ones failed or timed out
+        assert stopped_names == ["after_failing", "after_hanging"]
+        warning_mock.assert_called_once()
+        assert "hanging" in warning_mock.mock_calls[0].args[0]
+        exception_mock.assert_called_once()
+        assert "failing" in exception_mock.mock_calls[0].args[2]
+
+
+async def test_stop_components_global_timeout():
+    bot = _create_bot()
+    stopped_names = []
+    slow = _Component("slow", stopped_names, duration=0.15)
+    after_slow = _Component("after_slow", stopped_names, duration=0.15)
+    with mock.patch.object(bot.logger, "warning", mock.Mock()) as warning_mock:
+        start = asyncio.get_event_loop().time()
+        await bot._stop_components(
+            {
+                "slow": (slow.stop, ()),
+                "after_slow": (after_slow.stop, ("slow", )),
+            },
+            0.2, 0.2
+        )
+        assert asyncio.get_event_loop().time() - start < 0.3
+        assert stopped_names == ["slow"]
+        # slow is logged as slow, after_slow as forced to stop
+        assert "slow stopped in" in warning_mock.mock_calls[0].args[0]
+        assert warning_mock.mock_calls[1].args[0].endswith("forcing stop of: after_slow")
+
+
+async def test_stop():
+    bot = _create_bot()
+    bot.stopped = asyncio.Event()
+    stopped_names = []
+    bot.evaluator_producer = _Component("evaluator", stopped_names)
+    bot.exchange_producer = _Component("exchange", stopped_names)
+    bot.service_feed_producer = _Component("service_feed", stopped_names)
+    bot.interface_producer = _Component("interface", stopped_names)
+    bot.community_auth = _Component("community", stopped_names)
+    with mock.patch.object(octobot_module.profiles, "stop_profile_synchronizer", mock.AsyncMock()) \
+            as stop_profile_synchronizer_mock, \
+            mock.patch.object(octobot_module.os_clock_sync, "stop_clock_synchronizer", mock.AsyncMock()) \
+            as stop_clock_synchronizer_mock, \
+            mock.patch.object(octobot_module.system_resources_watcher, "stop_system_resources_watcher",
+                              mock.AsyncMock()) as stop_system_resources_watcher_mock, \
+            mock.patch.object(octobot_module.service_api, "stop_services", mock.AsyncMock()) as stop_services_mock, \
+            mock.patch.object(octobot_module.databases, "close_bot_storage", mock.AsyncMock()) \
+            as close_bot_storage_mock:
+        await bot.stop()
+        assert bot.stopped.is_set()
+        assert sorted(stopped_names) == ["community", "evaluator", "exchange", "interface", "service_feed"]
+        assert stopped_names.index("evaluator") < stopped_names.index("exchange")
+        stop_profile_synchronizer_mock.assert_awaited_once()
+        stop_clock_synchronizer_mock.assert_awaited_once()
+        stop_system_resources_watcher_mock.assert_awaited_once()
+        stop_services_mock.assert_awaited_once()
+        close_bot_storage_mock.assert_awaited_once_with(bot.bot_id)